@@ -1,10 +1,10 @@
 import itertools
 import re
-import warnings
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from collections.abc import Callable, Collection, Iterable, Sequence
 from dataclasses import dataclass, field
+from functools import partial
 from graphlib import CycleError, TopologicalSorter
 from typing import TYPE_CHECKING, Any, ClassVar, Generic, Literal, TypeVar, cast, overload
 
@@ -57,8 +57,8 @@ from cognite.client.utils.useful_types import SequenceNotStr
 
 from cognite.neat._v0.core._client.data_classes.data_modeling import Component
 from cognite.neat._v0.core._client.data_classes.schema import DMSSchema
-from cognite.neat._v0.core._issues.warnings import CDFMaxIterationsWarning
 from cognite.neat._v0.core._shared import T_ID
+from cognite.neat._v0.core._utils.concurrency import map_concurrently
 from cognite.neat._v0.core._utils.tarjan import tarjan
 
 if TYPE_CHECKING:
@@ -70,6 +70,22 @@ T_Item = TypeVar("T_Item")
 T_Out = TypeVar("T_Out", bound=Iterable)
 
 
+def _topological_levels(dependencies_by_id: dict[T_Item, set[T_Item]]) -> list[list[T_Item]]:
+    """Groups the ids in levels, where the ids of a level only depend on ids in earlier levels.
+
+    Raises:
+        CycleError: If there is a cycle in the dependencies.
+    """
+    sorter = TopologicalSorter(dependencies_by_id)
+    sorter.prepare()
+    levels: list[list[T_Item]] = []
+    while sorter.is_active():
+        level = list(sorter.get_ready())
+        sorter.done(*level)
+        levels.append(level)
+    return levels
+
+
 @dataclass
 class MultiCogniteAPIError(Exception, Generic[T_ID, T_WritableCogniteResourceList]):
     success: T_WritableCogniteResourceList
@@ -110,20 +126,31 @@ class ResourceLoader(
         return [cls.get_id(item) for item in items]
 
     def create(self, items: Sequence[T_WriteClass]) -> T_WritableCogniteResourceList:
-        # Containers can have dependencies on other containers, so we sort them before creating them.
-        items = self.sort_by_dependencies(items)
-
+        # Containers can have dependencies on other containers, so we create them level by level.
+        # The items of a level do not depend on each other, and are created in one request.
         exception: MultiCogniteAPIError[T_ID, T_WritableCogniteResourceList] | None = None
-        try:
-            created = self._fallback_one_by_one(self._create, items)
-        except MultiCogniteAPIError as e:
-            created = e.success
-            exception = e
+        created_by_level: list[T_WritableCogniteResourceList] = []
+        for level in self.dependency_levels(items):
+            try:
+                created_by_level.append(self._fallback_by_bisection(self._create, level))
+            except MultiCogniteAPIError as e:
+                created_by_level.append(e.success)
+                if exception is None:
+                    exception = e
+                else:
+                    exception.failed.extend(e.failed)
+                    exception.errors.extend(e.errors)
+        if len(created_by_level) == 1:
+            created = created_by_level[0]
+        else:
+            created = self._create_list([item for level_created in created_by_level for item in level_created])
 
         if self.cache:
             self._items_by_id.update({self.get_id(item): item for item in created})
 
         if exception is not None:
+            # Includes the items created in the other levels.
+            exception.success = created
             raise exception
 
         return created
@@ -141,7 +168,7 @@ class ResourceLoader(
     ) -> T_WritableCogniteResourceList | T_CogniteResourceList:
         if not self.cache:
             # We now that SequenceNotStr = Sequence
-            output = self._fallback_one_by_one(self._retrieve, ids)  # type: ignore[arg-type]
+            output = self._fallback_by_bisection(self._retrieve, ids)  # type: ignore[arg-type]
         else:
             exception: MultiCogniteAPIError[T_ID, T_WritableCogniteResourceList] | None = None
             missing_ids = [id for id in ids if id not in self._items_by_id.keys()]
@@ -168,7 +195,7 @@ class ResourceLoader(
             updated = self._update_force(items, drop_data=drop_data)
         else:
             try:
-                updated = self._fallback_one_by_one(self._update, items)
+                updated = self._fallback_by_bisection(self._update, items)
             except MultiCogniteAPIError as e:
                 updated = e.success
                 exception = e
@@ -186,7 +213,7 @@ class ResourceLoader(
         exception: MultiCogniteAPIError[T_ID, T_WritableCogniteResourceList] | None = None
         try:
             # We know that SequenceNotStr = Sequence
-            deleted = self._fallback_one_by_one(self._delete, id_list)  # type: ignore[arg-type]
+            deleted = self._fallback_by_bisection(self._delete, id_list)  # type: ignore[arg-type]
         except MultiCogniteAPIError as e:
             deleted = e.success
             exception = e
@@ -228,6 +255,10 @@ class ResourceLoader(
     def sort_by_dependencies(self, items: Sequence[T_WriteClass]) -> list[T_WriteClass]:
         return list(items)
 
+    def dependency_levels(self, items: Sequence[T_WriteClass]) -> list[list[T_WriteClass]]:
+        """Groups the items in levels, such that the items of a level only depend on items in earlier levels."""
+        return [self.sort_by_dependencies(items)] if items else []
+
     def _update_force(
         self,
         items: Sequence[T_WriteClass],
@@ -265,31 +296,99 @@ class ResourceLoader(
             forced.extend(success)
             return forced
 
-    def _fallback_one_by_one(self, method: Callable[[Sequence[T_Item]], T_Out], items: Sequence[T_Item]) -> T_Out:
+    def _fallback_by_bisection(self, method: Callable[[Sequence[T_Item]], T_Out], items: Sequence[T_Item]) -> T_Out:
+        """Calls the method with all items, and if that fails, retries the failed items in halves.
+
+        A single invalid item fails the whole request. Splitting the failed items in halves until the failing
+        items are found uses about 2 * log2(n) requests per failing item, instead of one request per item.
+
+        Bisection only helps if a few items cause the failure. Errors that are not caused by the items, such as
+        authorization, rate limiting and server errors, are not retried. If both halves of a split fail for the
+        same reason, most items are likely failing, and the items of the halves are retried one by one. Thus, a
+        batch where all n items fail uses n + 3 requests.
+        """
         try:
             return method(items)
         except CogniteAPIError as e:
             exception = MultiCogniteAPIError[T_ID, T_WritableCogniteResourceList](self._create_list([]))
             success = {self.get_id(success) for success in e.successful}
+            # We know that item is either T_ID or T_WriteClass
+            # but the T_Item cannot be bound to both types at the same time.
+            remaining = [item for item in items if self.get_id(item) not in success]  # type: ignore[arg-type]
+            if not _is_item_error(e) or len(remaining) == 1:
+                self._add_failed(exception, remaining, e)
+            else:
+                self._retry_by_bisection(method, remaining, exception, success)
             if success:
                 # Need read version of the items to put into cache.
                 retrieve_items = self.retrieve(list(success))
                 exception.success.extend(retrieve_items)
-            for item in items:
-                # We know that item is either T_ID or T_WriteClass
-                # but the T_Item cannot be bound to both types at the same time.
-                item_id = self.get_id(item)  # type: ignore[arg-type]
-                if item_id in success:
-                    continue
-                try:
-                    item_result = method([item])
-                except CogniteAPIError as item_exception:
-                    exception.errors.append(item_exception)
-                    exception.failed.extend(self.get_ids(item_exception.failed))
-                else:
-                    exception.success.extend(item_result)
             raise exception from None
 
+    def _retry_by_bisection(
+        self,
+        method: Callable[[Sequence[T_Item]], T_Out],
+        items: Sequence[T_Item],
+        exception: MultiCogniteAPIError[T_ID, T_WritableCogniteResourceList],
+        success: set[T_ID],
+    ) -> None:
+        middle = len(items) // 2
+        failed_parts: list[tuple[list[T_Item], CogniteAPIError]] = []
+        for part in [items[:middle], items[middle:]]:
+            try:
+                part_result = method(part)
+            except CogniteAPIError as part_exception:
+                # The SDK splits large requests, thus some of the items may have succeeded.
+                part_success = {self.get_id(success) for success in part_exception.successful}
+                success.update(part_success)
+                remaining = [item for item in part if self.get_id(item) not in part_success]  # type: ignore[arg-type]
+                if remaining:
+                    failed_parts.append((remaining, part_exception))
+            else:
+                exception.success.extend(part_result)
+
+        same_reason = len(failed_parts) == 2 and _is_same_error(failed_parts[0][1], failed_parts[1][1])
+        for remaining, part_exception in failed_parts:
+            if len(remaining) == 1 or not _is_item_error(part_exception):
+                self._add_failed(exception, remaining, part_exception)
+            elif same_reason:
+                # Most items are likely failing, thus bisecting further would double the number of requests.
+                self._retry_one_by_one(method, remaining, exception)
+            else:
+                self._retry_by_bisection(method, remaining, exception, success)
+
+    def _retry_one_by_one(
+        self,
+        method: Callable[[Sequence[T_Item]], T_Out],
+        items: Sequence[T_Item],
+        exception: MultiCogniteAPIError[T_ID, T_WritableCogniteResourceList],
+    ) -> None:
+        for item in items:
+            try:
+                item_result = method([item])
+            except CogniteAPIError as item_exception:
+                self._add_failed(exception, [item], item_exception)
+            else:
+                exception.success.extend(item_result)
+
+    def _add_failed(
+        self,
+        exception: MultiCogniteAPIError[T_ID, T_WritableCogniteResourceList],
+        items: Sequence[T_Item],
+        error: CogniteAPIError,
+    ) -> None:
+        exception.errors.append(error)
+        exception.failed.extend(self.get_ids(items))  # type: ignore[arg-type]
+
+
+def _is_item_error(error: CogniteAPIError) -> bool:
+    """Whether the error is caused by the items of the request, and thus, can be avoided by leaving items out."""
+    return 400 <= error.code < 500 and error.code not in (401, 403, 429)
+
+
+def _is_same_error(first: CogniteAPIError, second: CogniteAPIError) -> bool:
+    return (first.code, first.message) == (second.code, second.message)
+
 
 class DataModelingLoader(
     ResourceLoader[T_ID, T_WriteClass, T_WritableCogniteResource, T_CogniteResourceList, T_WritableCogniteResourceList],
@@ -408,6 +507,10 @@ class SpaceLoader(DataModelingLoader[str, SpaceApply, Space, SpaceApplyList, Spa
 class ContainerLoader(DataModelingLoader[ContainerId, ContainerApply, Container, ContainerApplyList, ContainerList]):
     resource_name = "containers"
     dependencies = frozenset({SpaceLoader})
+    # Number of containers in the same space to retrieve before listing the whole space instead.
+    prefetch_space_threshold = 10
+    # Maximum number of concurrent requests when retrieving the containers of a level of 'requires' constraints.
+    max_workers = 4
 
     @classmethod
     def get_id(cls, item: Container | ContainerApply | ContainerId | dict) -> ContainerId:
@@ -440,6 +543,9 @@ class ContainerLoader(DataModelingLoader[ContainerId, ContainerApply, Container,
         )
 
     def sort_by_dependencies(self, items: Sequence[ContainerApply]) -> list[ContainerApply]:
+        return [container for level in self.dependency_levels(items) for container in level]
+
+    def dependency_levels(self, items: Sequence[ContainerApply]) -> list[list[ContainerApply]]:
         container_by_id = {container.as_id(): container for container in items}
         container_dependencies = {
             container.as_id(): {
@@ -450,7 +556,8 @@ class ContainerLoader(DataModelingLoader[ContainerId, ContainerApply, Container,
             for container in items
         }
         return [
-            container_by_id[container_id] for container_id in TopologicalSorter(container_dependencies).static_order()
+            [container_by_id[container_id] for container_id in level]
+            for level in _topological_levels(container_dependencies)
         ]
 
     def _create(self, items: Sequence[ContainerApply]) -> ContainerList:
@@ -497,45 +604,23 @@ class ContainerLoader(DataModelingLoader[ContainerId, ContainerApply, Container,
         """Containers can reference each other through the 'requires' constraint.
 
         This method retrieves all containers that are referenced by other containers through the 'requires' constraint,
-        including their parents.
+        including their parents. The constraints are followed level by level until all referenced containers are
+        found, and the containers of a level that are not cached are retrieved in one round of concurrent requests.
         """
-        max_iterations = 10  # Limiting the number of iterations to avoid infinite loops
         found = ContainerList([])
         found_ids: set[ContainerId] = set()
-        last_batch = list(container_ids)
-        for _ in range(max_iterations):
-            if not last_batch:
-                break
-            to_retrieve_from_cdf: set[ContainerId] = set()
-            batch_ids: list[ContainerId] = []
-            for container_id in last_batch:
-                if container_id in found_ids:
+        level = list(dict.fromkeys(container_ids))
+        while level:
+            self._retrieve_to_cache([container_id for container_id in level if container_id not in self._items_by_id])
+            next_level: dict[ContainerId, None] = {}
+            for container_id in level:
+                # Containers that do not exist in CDF are not in the cache.
+                if container_id in found_ids or (container := self._items_by_id.get(container_id)) is None:
                     continue
-                elif container_id in self._items_by_id:
-                    container = self._items_by_id[container_id]
-                    found.append(container)
-                    batch_ids.extend(self.get_connected_containers(container, found_ids))
-                else:
-                    to_retrieve_from_cdf.add(container_id)
-
-            if to_retrieve_from_cdf:
-                retrieved_batch = self._client.data_modeling.containers.retrieve(list(to_retrieve_from_cdf))
-                self._items_by_id.update({view.as_id(): view for view in retrieved_batch})
-                found.extend(retrieved_batch)
-                found_ids.update({view.as_id() for view in retrieved_batch})
-                for container in retrieved_batch:
-                    batch_ids.extend(self.get_connected_containers(container, found_ids))
-
-            last_batch = batch_ids
-        else:
-            warnings.warn(
-                CDFMaxIterationsWarning(
-                    "The maximum number of iterations was reached while resolving referenced containers."
-                    "There might be referenced containers that are not included in the list of containers.",
-                    max_iterations=max_iterations,
-                ),
-                stacklevel=2,
-            )
+                found.append(container)
+                found_ids.add(container_id)
+                next_level.update(dict.fromkeys(self.get_connected_containers(container, found_ids)))
+            level = [container_id for container_id in next_level if container_id not in found_ids]
 
         if self.cache is False:
             # We must update the cache to retrieve recursively.
@@ -543,6 +628,32 @@ class ContainerLoader(DataModelingLoader[ContainerId, ContainerApply, Container,
             self.bust_cache()
         return found
 
+    def _retrieve_to_cache(self, container_ids: Sequence[ContainerId]) -> None:
+        """Retrieves the containers from CDF and stores them in the cache.
+
+        If at least `prefetch_space_threshold` of the containers are in the same space, all containers in that
+        space are listed instead of retrieved by ID. Containers typically require containers in the same space,
+        thus this usually resolves the next levels of the 'requires' constraints as well.
+        """
+        ids_by_space: dict[str, list[ContainerId]] = defaultdict(list)
+        for container_id in container_ids:
+            ids_by_space[container_id.space].append(container_id)
+        requests: list[Callable[[], ContainerList]] = []
+        by_id: list[ContainerId] = []
+        for space, space_ids in ids_by_space.items():
+            if len(space_ids) >= self.prefetch_space_threshold:
+                requests.append(partial(self._list_space, space))
+            else:
+                by_id.extend(space_ids)
+        if by_id:
+            requests.append(partial(self._retrieve, by_id))
+
+        for retrieved in map_concurrently(lambda request: request(), requests, max_workers=self.max_workers):
+            self._items_by_id.update({container.as_id(): container for container in retrieved})
+
+    def _list_space(self, space: str) -> ContainerList:
+        return self._client.data_modeling.containers.list(space=space, limit=-1, include_global=True)
+
     @staticmethod
     def get_connected_containers(
         container: Container | ContainerApply, skip: set[ContainerId] | None = None
@@ -630,7 +741,7 @@ class ViewLoader(DataModelingLoader[ViewId, ViewApply, View, ViewApplyList, View
         except CogniteAPIError as e1:
             if self._is_auto_retryable(e1):
                 # Fallback to creating one by one if the error is auto-retryable.
-                return self._fallback_one_by_one(self._create, items)
+                return self._fallback_by_bisection(self._create, items)
             elif self._is_false_not_exists(e1, {item.as_id() for item in items}):
                 return self._try_to_recover_coupled(items, e1)
             raise
@@ -640,7 +751,7 @@ class ViewLoader(DataModelingLoader[ViewId, ViewApply, View, ViewApplyList, View
 
         This method tries to recover from such errors by identifying the strongly connected components in the graph
         defined by the implements and through properties of the views. We then create the components in topological
-        order.
+        order, with the components that do not depend on each other created in the same request.
 
         Args:
             items: The items that failed to create.
@@ -669,9 +780,21 @@ class ViewLoader(DataModelingLoader[ViewId, ViewApply, View, ViewApplyList, View
                     if isinstance(properties.through.source, ViewId) and properties.through.source in views_by_id:
                         dependencies_by_id[view_id].add(properties.through.source)
 
+        component_no_by_view_id: dict[ViewId, int] = {}
+        components = tarjan(dependencies_by_id)
+        for component_no, strongly_connected in enumerate(components):
+            component_no_by_view_id.update(dict.fromkeys(strongly_connected, component_no))
+        dependencies_by_component_no: dict[int, set[int]] = defaultdict(set)
+        for view_id, dependencies in dependencies_by_id.items():
+            component_no = component_no_by_view_id[view_id]
+            dependencies_by_component_no[component_no].update(
+                component_no_by_view_id[dependency] for dependency in dependencies
+            )
+            dependencies_by_component_no[component_no].discard(component_no)
+
         created = ViewList([])
-        for strongly_connected in tarjan(dependencies_by_id):
-            to_create = [views_by_id[view_id] for view_id in strongly_connected]
+        for level in _topological_levels(dependencies_by_component_no):
+            to_create = [views_by_id[view_id] for component_no in level for view_id in components[component_no]]
             try:
                 created_set = self._client.data_modeling.views.apply(to_create)
             except CogniteAPIError:
@@ -1,10 +1,10 @@
 import itertools
 import warnings
-from collections import defaultdict
-from collections.abc import Hashable, ItemsView, Iterator, KeysView, MutableMapping, Set, ValuesView
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable, Hashable, ItemsView, Iterator, KeysView, MutableMapping, Set, ValuesView
 from dataclasses import dataclass, field
 from graphlib import TopologicalSorter
-from typing import Any, Literal, TypeVar, overload
+from typing import Any, ClassVar, Literal, TypeVar, overload
 
 import networkx as nx
 import pandas as pd
@@ -30,6 +30,7 @@ from cognite.neat._v0.core._issues.errors import NeatValueError
 from cognite.neat._v0.core._issues.warnings import NeatValueWarning
 
 T_Hashable = TypeVar("T_Hashable", bound=Hashable)
+T_Value = TypeVar("T_Value")
 
 
 @dataclass(frozen=True)
@@ -111,6 +112,17 @@ class ViewQueryDict(dict, MutableMapping[dm.ViewId, ViewQuery]):
 
 
 class DataModelAnalysis:
+    """Analysis of a conceptual and/or physical data model.
+
+    The derived maps, such as the properties by concept including ancestors, are computed once per
+    analysis and copies are returned, thus, the data models are expected to not be modified after
+    the analysis is created. Use `DataModelAnalysis.cached` to get the analysis shared by all consumers of
+    the same data models.
+    """
+
+    _max_cached: ClassVar[int] = 8
+    _cached_by_key: ClassVar["OrderedDict[tuple[Hashable, Hashable], DataModelAnalysis]"] = OrderedDict()
+
     def __init__(
         self,
         conceptual: ConceptualDataModel | None = None,
@@ -118,6 +130,41 @@ class DataModelAnalysis:
     ) -> None:
         self._conceptual = conceptual
         self._physical = physical
+        self._computed_by_key: dict[Hashable, tuple[Any, list[Warning]]] = {}
+
+    @classmethod
+    def cached(
+        cls,
+        conceptual: ConceptualDataModel | None = None,
+        physical: PhysicalDataModel | None = None,
+    ) -> "DataModelAnalysis":
+        """Get the analysis of the data models shared by all consumers, for example, loaders and transformers.
+
+        The data models are keyed by their identity and the identity of their rows. Computing
+        a content hash costs as much as the analysis itself, thus, a data model changed in place, without
+        adding, removing or replacing rows, is not detected.
+        """
+        key = (_data_model_key(conceptual), _data_model_key(physical))
+        if (analysis := cls._cached_by_key.get(key)) is None:
+            analysis = cls(conceptual, physical)
+            cls._cached_by_key[key] = analysis
+            while len(cls._cached_by_key) > cls._max_cached:
+                cls._cached_by_key.popitem(last=False)
+        else:
+            cls._cached_by_key.move_to_end(key)
+        return analysis
+
+    def _compute_once(self, key: Hashable, compute: Callable[[], T_Value]) -> T_Value:
+        """Computes the value once. The warnings of the computation are raised every time the value is used."""
+        if key not in self._computed_by_key:
+            with warnings.catch_warnings(record=True) as warning_logger:
+                warnings.simplefilter("always")
+                value = compute()
+            self._computed_by_key[key] = value, [warning.message for warning in warning_logger]
+        value, messages = self._computed_by_key[key]
+        for message in messages:
+            warnings.warn(message, stacklevel=3)
+        return value
 
     @property
     def conceptual(self) -> ConceptualDataModel:
@@ -143,6 +190,15 @@ class DataModelAnalysis:
         Returns:
             dict[ConceptEntity, set[ConceptEntity]]: Values parents with concept as key.
         """
+        parents_by_concept = self._compute_once(
+            ("parents_by_concept", include_ancestors, include_different_space),
+            lambda: self._parents_by_concept(include_ancestors, include_different_space),
+        )
+        return {concept: set(parents) for concept, parents in parents_by_concept.items()}
+
+    def _parents_by_concept(
+        self, include_ancestors: bool, include_different_space: bool
+    ) -> dict[ConceptEntity, set[ConceptEntity]]:
         parents_by_concept: dict[ConceptEntity, set[ConceptEntity]] = {}
         for concept in self.conceptual.concepts:
             parents_by_concept[concept.concept] = set()
@@ -188,6 +244,15 @@ class DataModelAnalysis:
             dict[ConceptEntity, list[ConceptualProperty]]: Values properties with concept as key.
 
         """
+        properties_by_concepts = self._compute_once(
+            ("properties_by_concepts", include_ancestors, include_different_space),
+            lambda: self._properties_by_concepts(include_ancestors, include_different_space),
+        )
+        return defaultdict(list, {concept: list(properties) for concept, properties in properties_by_concepts.items()})
+
+    def _properties_by_concepts(
+        self, include_ancestors: bool, include_different_space: bool
+    ) -> dict[ConceptEntity, list[ConceptualProperty]]:
         properties_by_concepts: dict[ConceptEntity, list[ConceptualProperty]] = defaultdict(list)
         for prop in self.conceptual.properties:
             properties_by_concepts[prop.concept].append(prop)
@@ -212,6 +277,15 @@ class DataModelAnalysis:
         self, include_ancestors: bool = False, include_different_space: bool = False
     ) -> dict[ViewEntity, set[ViewEntity]]:
         """Get a dictionary of views and their implemented views."""
+        implements_by_view = self._compute_once(
+            ("implements_by_view", include_ancestors, include_different_space),
+            lambda: self._implements_by_view(include_ancestors, include_different_space),
+        )
+        return {view: set(implements) for view, implements in implements_by_view.items()}
+
+    def _implements_by_view(
+        self, include_ancestors: bool, include_different_space: bool
+    ) -> dict[ViewEntity, set[ViewEntity]]:
         # This is a duplicate fo the parent_by_concept method, but for views
         # The choice to duplicate the code is to avoid generics which will make the code less readable
         implements_by_view: dict[ViewEntity, set[ViewEntity]] = {}
@@ -235,6 +309,15 @@ class DataModelAnalysis:
         self, include_ancestors: bool = False, include_different_space: bool = False
     ) -> dict[ViewEntity, list[PhysicalProperty]]:
         """Get a dictionary of views and their properties."""
+        properties_by_views = self._compute_once(
+            ("properties_by_view", include_ancestors, include_different_space),
+            lambda: self._properties_by_view(include_ancestors, include_different_space),
+        )
+        return defaultdict(list, {view: list(properties) for view, properties in properties_by_views.items()})
+
+    def _properties_by_view(
+        self, include_ancestors: bool, include_different_space: bool
+    ) -> dict[ViewEntity, list[PhysicalProperty]]:
         # This is a duplicate fo the properties_by_concept method, but for views
         # The choice to duplicate the code is to avoid generics which will make the code less readable.
         properties_by_views: dict[ViewEntity, list[PhysicalProperty]] = defaultdict(list)
@@ -324,6 +407,15 @@ class DataModelAnalysis:
         include_ancestors: bool = False,
     ) -> dict[ConceptEntity, dict[str, ConceptualProperty]]:
         """Get a dictionary of concept entities to dictionaries of property IDs to property entities."""
+        concept_property_pairs = self._compute_once(
+            ("properties_by_id_by_concept", has_instance_source, include_ancestors),
+            lambda: self._properties_by_id_by_concept(has_instance_source, include_ancestors),
+        )
+        return {concept: dict(properties) for concept, properties in concept_property_pairs.items()}
+
+    def _properties_by_id_by_concept(
+        self, has_instance_source: bool, include_ancestors: bool
+    ) -> dict[ConceptEntity, dict[str, ConceptualProperty]]:
         concept_property_pairs: dict[ConceptEntity, dict[str, ConceptualProperty]] = {}
         for concept, properties in self.properties_by_concepts(include_ancestors).items():
             processed_properties: dict[str, ConceptualProperty] = {}
@@ -379,6 +471,11 @@ class DataModelAnalysis:
         Returns:
 
         """
+        return LinkageSet(
+            self._compute_once(("concept_linkage", include_ancestors), lambda: self._concept_linkage(include_ancestors))
+        )
+
+    def _concept_linkage(self, include_ancestors: bool) -> LinkageSet:
         concept_linkage = LinkageSet()
 
         properties_by_concept = self.properties_by_concepts(include_ancestors)
@@ -457,6 +554,15 @@ class DataModelAnalysis:
     def view_query_by_id(
         self,
     ) -> "ViewQueryDict":
+        view_query_by_id = self._compute_once("view_query_by_id", self._view_query_by_id)
+        return ViewQueryDict(
+            {
+                view_id: ViewQuery(query.view_id, query.rdf_type, dict(query.property_renaming_config))
+                for view_id, query in view_query_by_id.items()
+            }
+        )
+
+    def _view_query_by_id(self) -> "ViewQueryDict":
         # Trigger error if any of these are missing
         _ = self.conceptual
         _ = self.physical
@@ -576,3 +682,15 @@ class DataModelAnalysis:
                     )
 
         return di_graph
+
+
+def _data_model_key(data_model: ConceptualDataModel | PhysicalDataModel | None) -> Hashable:
+    if data_model is None:
+        return None
+    # The cached analysis keeps the data model alive, thus, its identity is not reused by another object.
+    row_ids: list[int] = [id(data_model), id(data_model.metadata)]
+    for name in type(data_model).model_fields:
+        if isinstance(sheet := getattr(data_model, name), list):
+            row_ids.append(len(sheet))
+            row_ids.extend(map(id, sheet))
+    return tuple(row_ids)
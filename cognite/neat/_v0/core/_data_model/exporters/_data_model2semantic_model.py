@@ -1,16 +1,16 @@
-import sys
-import warnings
-from abc import ABC
+import re
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, ClassVar
+from typing import IO, TYPE_CHECKING, Any
 
-from pydantic import BaseModel, ConfigDict, ValidationInfo, field_validator
 from rdflib import DCTERMS, OWL, RDF, RDFS, XSD, BNode, Graph, Literal, Namespace, URIRef
-from rdflib.collection import Collection as GraphCollection
+from rdflib.graph import DATASET_DEFAULT_GRAPH_ID
 
 from cognite.neat._v0.core._constants import DEFAULT_NAMESPACE as NEAT_NAMESPACE
 from cognite.neat._v0.core._data_model._constants import EntityTypes
-from cognite.neat._v0.core._data_model.analysis import DataModelAnalysis
 from cognite.neat._v0.core._data_model.models.conceptual import (
     Concept,
     ConceptualDataModel,
@@ -19,628 +19,295 @@ from cognite.neat._v0.core._data_model.models.conceptual import (
 )
 from cognite.neat._v0.core._data_model.models.data_types import DataType
 from cognite.neat._v0.core._data_model.models.entities import ConceptEntity
-from cognite.neat._v0.core._issues.errors import (
-    PropertyDefinitionDuplicatedError,
-)
-from cognite.neat._v0.core._issues.warnings import PropertyDefinitionDuplicatedWarning
-from cognite.neat._v0.core._utils.rdf_ import remove_namespace_from_uri
+from cognite.neat._v0.core._shared import Triple
+from cognite.neat._v0.core._utils.rdf_ import iterate_oxigraph_quads, remove_namespace_from_uri, to_ntriples_row
 
 from ._base import BaseExporter
 
-if sys.version_info >= (3, 11):
-    from typing import Self
-else:
-    from typing_extensions import Self
+if TYPE_CHECKING:
+    import pyoxigraph  # type: ignore[import-untyped]
 
 SHACL = Namespace("http://www.w3.org/ns/shacl#")
 
-
-class GraphExporter(BaseExporter[ConceptualDataModel, Graph], ABC):
-    def export_to_file(self, data_model: ConceptualDataModel, filepath: Path) -> None:
-        self.export(data_model).serialize(destination=filepath, encoding=self._encoding, newline=self._new_line)
-
-
-class OWLExporter(GraphExporter):
-    """Exports verified conceptual data model to an OWL ontology."""
-
-    def export(self, data_model: ConceptualDataModel) -> Graph:
-        return Ontology.from_data_model(data_model).graph
-
-    @property
-    def description(self) -> str:
-        return "Export verified conceptual data model to OWL."
-
-
-class SHACLExporter(GraphExporter):
-    """Exports data_model to a SHACL graph."""
-
-    def export(self, data_model: ConceptualDataModel) -> Graph:
-        return ShaclShapes.from_data_model(data_model).graph
-
-    @property
-    def description(self) -> str:
-        return "Export verified conceptual data model to SHACL."
+# Written in the header of every Turtle file in addition to the prefixes of the data model.
+_TURTLE_PREFIXES = {"rdf": RDF, "rdfs": RDFS, "owl": OWL, "xsd": XSD, "dcterms": DCTERMS, "sh": SHACL}
+# Conservative subsets of the prefixes and local names allowed in a Turtle prefixed name.
+_TURTLE_PREFIX = re.compile(r"[A-Za-z](?:[A-Za-z0-9_\-.]*[A-Za-z0-9_\-])?")
+_TURTLE_LOCAL_NAME = re.compile(r"[A-Za-z0-9_](?:[A-Za-z0-9_\-.]*[A-Za-z0-9_\-])?")
 
 
-class _ModelConfig(BaseModel):
-    model_config: ClassVar[ConfigDict] = ConfigDict(arbitrary_types_allowed=True, strict=False, extra="allow")
-
-
-class Ontology(_ModelConfig):
-    """
-    Represents an ontology. This class is used to generate an OWL ontology from conceptual data model.
+class GraphExporter(BaseExporter[ConceptualDataModel, Graph], ABC):
+    """Base class for exporters generating the triples of a conceptual data model.
 
-    Args:
-        properties: A list of OWL properties.
-        classes: A list of OWL classes.
-        metadata: Metadata about the ontology.
-        prefixes: A dictionary of prefixes and namespaces.
+    The triples are generated one at a time, such that they can be written straight to a file or an
+    Oxigraph store without building an intermediate graph.
     """
 
-    metadata: "OWLMetadata"
-    properties: list["OWLProperty"]
-    classes: list["OWLClass"]
-    prefixes: dict[str, Namespace]
-
-    @classmethod
-    def from_data_model(cls, data_model: ConceptualDataModel) -> Self:
-        """
-        Generates an ontology from a set of transformation data_model.
-
-        Args:
-            data_model: The data_model to generate the ontology from.
-
-        Returns:
-            An instance of Ontology.
-        """
-        analysis = DataModelAnalysis(data_model)
-        return cls(
-            properties=[
-                OWLProperty.from_list_of_properties(definition, data_model.metadata.namespace)
-                for definition in analysis.property_by_id().values()
-            ],
-            classes=[
-                OWLClass.from_concept(definition, data_model.metadata.namespace, data_model.prefixes)
-                for definition in data_model.concepts
-            ],
-            metadata=OWLMetadata(**data_model.metadata.model_dump()),
-            prefixes=data_model.prefixes,
-        )
-
-    @property
-    def graph(self) -> Graph:
-        """
-        Generates an OWL graph from the ontology.
-
-        Returns:
-            An OWL graph.
-        """
-        owl = Graph()
-        owl.bind(self.metadata.prefix, self.metadata.namespace)
-        for prefix, namespace in self.prefixes.items():
-            owl.bind(prefix, namespace)
-
-        owl.add((URIRef(self.metadata.namespace), RDF.type, OWL.Ontology))
-        for property_ in self.properties:
-            for triple in property_.triples:
-                owl.add(triple)  # type: ignore[arg-type]
-
-        for class_ in self.classes:
-            for triple in class_.triples:
-                owl.add(triple)  # type: ignore[arg-type]
-
-        for triple in self.metadata.triples:
-            owl.add(triple)  # type: ignore[arg-type]
-
-        return owl
-
-
-class OWLMetadata(ConceptualMetadata):
-    @property
-    def triples(self) -> list[tuple]:
-        # Mandatory triples originating from Metadata mandatory fields
-        triples: list[tuple] = [
-            (URIRef(self.namespace), DCTERMS.hasVersion, Literal(self.version)),
-            (URIRef(self.namespace), OWL.versionInfo, Literal(self.version)),
-            (URIRef(self.namespace), RDFS.label, Literal(self.name)),
-            (URIRef(self.namespace), NEAT_NAMESPACE.prefix, Literal(self.prefix)),
-            (URIRef(self.namespace), DCTERMS.title, Literal(self.name)),
-            (URIRef(self.namespace), DCTERMS.created, Literal(self.created, datatype=XSD.dateTime)),
-            (URIRef(self.namespace), DCTERMS.description, Literal(self.description)),
-        ]
-        if isinstance(self.creator, list):
-            triples.extend([(URIRef(self.namespace), DCTERMS.creator, Literal(creator)) for creator in self.creator])
-        else:
-            triples.append((URIRef(self.namespace), DCTERMS.creator, Literal(self.creator)))
-
-        # Optional triples originating from Metadata optional fields
-        if self.updated:
-            triples.append((URIRef(self.namespace), DCTERMS.modified, Literal(self.updated, datatype=XSD.dateTime)))
-
-        return triples
-
-
-class OWLClass(_ModelConfig):
-    id_: URIRef
-    type_: URIRef = OWL.Class
-    label: str | None
-    comment: str | None
-    sub_class_of: list[URIRef] | None
-    namespace: Namespace
-
-    @classmethod
-    def from_concept(cls, definition: Concept, namespace: Namespace, prefixes: dict) -> Self:
-        if definition.implements and isinstance(definition.implements, list):
-            sub_class_of = []
-            for parent_class in definition.implements:
-                try:
-                    sub_class_of.append(prefixes[str(parent_class.prefix)][str(parent_class.suffix)])
-                except KeyError:
-                    sub_class_of.append(namespace[str(parent_class.suffix)])
-        else:
-            sub_class_of = None
-
-        return cls(
-            id_=namespace[str(definition.concept.suffix)],
-            label=definition.name if definition.name else None,
-            comment=definition.description,
-            sub_class_of=sub_class_of,
-            namespace=namespace,
-        )
-
-    @property
-    def type_triples(self) -> list[tuple]:
-        return [(self.id_, RDF.type, self.type_)]
-
-    @property
-    def label_triples(self) -> list[tuple]:
-        if self.label:
-            return [(self.id_, RDFS.label, Literal(self.label))]
-        else:  # If comment is None, return empty list
-            return []
-
-    @property
-    def title_triples(self) -> list[tuple]:
-        if self.label:
-            return [
-                (
-                    self.id_,
-                    DCTERMS.title,
-                    Literal(f"{remove_namespace_from_uri(self.id_)} - {self.label}"),
-                )
-            ]
-        else:
-            return []
-
-    @property
-    def comment_triples(self) -> list[tuple]:
-        if self.comment:
-            return [(self.id_, RDFS.comment, Literal(self.comment))]
-        else:  # If comment is None, return empty list
-            return []
-
-    @property
-    def subclass_triples(self) -> list[tuple]:
-        if self.sub_class_of:
-            return [(self.id_, RDFS.subClassOf, sub_class_of) for sub_class_of in self.sub_class_of]
-        else:
-            return []
-
-    @property
-    def triples(self) -> list[tuple]:
-        return (
-            self.type_triples + self.label_triples + self.title_triples + self.comment_triples + self.subclass_triples
-        )
+    @abstractmethod
+    def iterate_triples(self, data_model: ConceptualDataModel) -> Iterable[Triple]:
+        raise NotImplementedError
 
+    def prefixes(self, data_model: ConceptualDataModel) -> dict[str, Namespace]:
+        return data_model.prefixes
 
-class OWLProperty(_ModelConfig):
-    id_: URIRef
-    type_: set[URIRef]
-    label: set[str]
-    comment: set[str]
-    domain: set[URIRef]
-    range_: set[URIRef]
-    namespace: Namespace
-
-    @classmethod
-    def from_list_of_properties(cls, definitions: list[ConceptualProperty], namespace: Namespace) -> "OWLProperty":
-        """Here list of properties is a list of properties with the same id, but different definitions."""
-        property_ids = {definition.property_ for definition in definitions}
-        if len(property_ids) != 1:
-            raise PropertyDefinitionDuplicatedError(
-                definitions[0].concept,
-                "class",
-                definitions[0].property_,
-                frozenset(property_ids),
-            )
-
-        owl_property = cls.model_construct(
-            id_=namespace[definitions[0].property_],
-            namespace=namespace,
-            label=set(),
-            comment=set(),
-            domain=set(),
-            range_=set(),
-            type_=set(),
-        )
-        for definition in definitions:
-            owl_property.type_.add(OWL[definition.type_])
+    def export(self, data_model: ConceptualDataModel) -> Graph:
+        graph = Graph()
+        for prefix, namespace in self.prefixes(data_model).items():
+            graph.bind(prefix, namespace)
+        for triple in self.iterate_triples(data_model):
+            graph.add(triple)
+        return graph
 
-            if isinstance(definition.value_type, DataType):
-                owl_property.range_.add(XSD[definition.value_type.xsd])
-            elif isinstance(definition.value_type, ConceptEntity):
-                owl_property.range_.add(namespace[str(definition.value_type.suffix)])
+    def export_to_file(self, data_model: ConceptualDataModel, filepath: Path) -> None:
+        """Writes the triples as N-Triples if the file has the .nt suffix, otherwise as Turtle."""
+        triples = self.iterate_triples(data_model)
+        with filepath.open("w", encoding=self._encoding, newline=self._new_line) as file:
+            if filepath.suffix == ".nt":
+                file.writelines(to_ntriples_row(triple) for triple in triples)
             else:
-                raise ValueError(f"Value type {definition.value_type.type_} is not supported")
-            owl_property.domain.add(namespace[str(definition.concept.suffix)])
-            if definition.name:
-                owl_property.label.add(definition.name)
-            if definition.description:
-                owl_property.comment.add(definition.description)
-
-        return owl_property
-
-    @field_validator("type_")
-    def is_multi_type(cls, v: Any, info: ValidationInfo) -> Any:
-        if len(v) > 1:
-            warnings.warn(
-                PropertyDefinitionDuplicatedWarning(
-                    remove_namespace_from_uri(info.data["id"]),
-                    "class",
-                    "type",
-                    frozenset({remove_namespace_from_uri(t) for t in v}),
-                    "This warning occurs when a same property is define for two object/classes where"
-                    " its expected value type is different in one definition, e.g. acts as an edge, while in "
-                    "other definition acts as and attribute",
-                    "If a property takes different value types for different objects, simply define new property",
-                ),
-                stacklevel=2,
-            )
-        return v
-
-    @field_validator("range_")
-    def is_multi_range(cls, v: Any, info: ValidationInfo) -> Any:
-        if len(v) > 1:
-            warnings.warn(
-                PropertyDefinitionDuplicatedWarning(
-                    remove_namespace_from_uri(info.data["id_"]),
-                    "class",
-                    "range",
-                    frozenset({remove_namespace_from_uri(t) for t in v}),
-                    "This warning occurs when a property takes range of "
-                    "values which consists of union of multiple value types.",
-                    "If value types for different objects, simply define new property",
-                ),
-                stacklevel=2,
-            )
-        return v
-
-    @field_validator("domain")
-    def is_multi_domain(cls, v: Any, info: ValidationInfo) -> Any:
-        if len(v) > 1:
-            warnings.warn(
-                PropertyDefinitionDuplicatedWarning(
-                    remove_namespace_from_uri(info.data["id_"]),
-                    "class",
-                    "domain",
-                    frozenset({remove_namespace_from_uri(t) for t in v}),
-                    "This warning occurs when a same property is define for two object/classes where"
-                    " its expected value type is different in one definition, e.g. acts as an edge, while in "
-                    "other definition acts as and attribute",
-                    "If value types for different objects, simply define new property",
-                ),
-                stacklevel=2,
-            )
-        return v
-
-    @field_validator("label")
-    def has_multi_name(cls, v: Any, info: ValidationInfo) -> Any:
-        if len(v) > 1:
-            warnings.warn(
-                PropertyDefinitionDuplicatedWarning(
-                    remove_namespace_from_uri(info.data["id_"]),
-                    "class",
-                    "label",
-                    frozenset(v),
-                    f"Only the first label (name) will be used, {v[0]}",
-                ),
-                stacklevel=2,
-            )
-        return v
-
-    @field_validator("comment")
-    def has_multi_comment(cls, v: Any, info: ValidationInfo) -> Any:
-        if len(v) > 1:
-            warnings.warn(
-                PropertyDefinitionDuplicatedWarning(
-                    remove_namespace_from_uri(info.data["id_"]),
-                    "class",
-                    "comment",
-                    frozenset(v),
-                    "All definitions will be concatenated to form a single definition.",
-                ),
-                stacklevel=2,
-            )
-        return v
-
-    @property
-    def domain_triples(self) -> list[tuple]:
-        triples: list[tuple] = []
-        if len(self.domain) == 1:
-            triples.append((self.id_, RDFS.domain, next(iter(self.domain))))
-        else:
-            _graph = Graph()
-            b_union = BNode()
-            b_domain = BNode()
-            _graph.add((self.id_, RDFS.domain, b_domain))
-            _graph.add((b_domain, OWL.unionOf, b_union))
-            _graph.add((b_domain, RDF.type, OWL.Class))
-            _ = GraphCollection(_graph, b_union, list(self.domain))
-            triples.extend(list(_graph))
-        return triples
-
-    @property
-    def range_triples(self) -> list[tuple]:
-        triples: list[tuple] = []
-        if len(self.range_) == 1:
-            triples.append((self.id_, RDFS.range, next(iter(self.range_))))
-        else:
-            _graph = Graph()
-            b_union = BNode()
-            b_range = BNode()
-            _graph.add((self.id_, RDFS.range, b_range))
-            _graph.add((b_range, OWL.unionOf, b_union))
-            _graph.add((b_range, RDF.type, OWL.Class))
-            _graph.add((b_range, OWL.unionOf, b_union))
-            _graph.add((b_range, RDF.type, OWL.Class))
-            _ = GraphCollection(_graph, b_union, list(self.range_))
-            triples.extend(list(_graph))
-        return triples
-
-    @property
-    def type_triples(self) -> list[tuple]:
-        return [(self.id_, RDF.type, type_) for type_ in self.type_]
-
-    @property
-    def label_triples(self) -> list[tuple]:
-        if label := list(filter(None, self.label)):
-            return [(self.id_, RDFS.label, Literal(label[0]))]
-        else:
-            return []
-
-    @property
-    def title_triples(self) -> list[tuple]:
-        if label := list(filter(None, self.label)):
-            return [
-                (
-                    self.id_,
-                    DCTERMS.title,
-                    Literal(f"{remove_namespace_from_uri(self.id_)} - {label[0]}"),
-                )
-            ]
-        else:
-            return []
-
-    @property
-    def comment_triples(self) -> list[tuple]:
-        return [(self.id_, RDFS.comment, Literal("\n".join(filter(None, self.comment))))]
-
-    @property
-    def triples(self) -> list[tuple]:
-        return (
-            self.type_triples
-            + self.label_triples
-            + self.title_triples
-            + self.comment_triples
-            + self.domain_triples
-            + self.range_triples
-        )
+                _write_turtle(file, triples, self.prefixes(data_model))
 
-
-class ShaclShapes(_ModelConfig):
-    """
-    Represents a SHACL shapes. This class is used to generate a SHACL graph from conceptual data model.
-
-    Args:
-        shapes: A list of SHACL node shapes.
-        prefixes: A dictionary of prefixes and namespaces.
-    """
-
-    shapes: list["SHACLNodeShape"]
-    prefixes: dict[str, Namespace]
-
-    @classmethod
-    def from_data_model(cls, data_model: ConceptualDataModel) -> Self:
-        """
-        Generates shacl shapes from a conceptual data model.
+    def export_to_oxigraph(
+        self, data_model: ConceptualDataModel, store: "pyoxigraph.Store", named_graph: URIRef | None = None
+    ) -> None:
+        """Adds the triples to an Oxigraph store.
 
         Args:
-            data_model: The data_model to generate the shacl shapes from.
-
-        Returns:
-            An instance of ShaclShapes.
+            data_model: The conceptual data model to export.
+            store: The Oxigraph store to add the triples to.
+            named_graph: The named graph to add the triples to. Defaults to the default graph.
         """
-        analysis = DataModelAnalysis(data_model)
-        concepts_by_concept_entity = analysis.concept_by_concept_entity
-        properties_by_concept_entity = analysis.properties_by_concepts()
-        return cls(
-            shapes=[
-                # shapes that have property shapes as well
-                SHACLNodeShape.from_concept(
-                    concept_entity,
-                    concepts_by_concept_entity,
-                    properties,
-                    data_model.metadata.namespace,
-                )
-                for concept_entity, properties in properties_by_concept_entity.items()
-            ]
-            + [
-                # shapes without any property shapes
-                SHACLNodeShape.from_concept(
-                    concept_entity,
-                    concepts_by_concept_entity,
-                    [],
-                    data_model.metadata.namespace,
-                )
-                for concept_entity in concepts_by_concept_entity.keys()
-                if concept_entity not in properties_by_concept_entity
-            ],
-            prefixes=data_model.prefixes,
+        store.bulk_extend(
+            iterate_oxigraph_quads(self.iterate_triples(data_model), named_graph or DATASET_DEFAULT_GRAPH_ID)
         )
 
-    @property
-    def graph(self) -> Graph:
-        """
-        Generates a SHACL graph from the class instance.
-
-        Returns:
-            A SHACL graph.
-        """
 
-        shacl = Graph()
-        for prefix, namespace in self.prefixes.items():
-            shacl.bind(prefix, namespace)
-
-        for shape in self.shapes:
-            for triple in shape.triples:
-                shacl.add(triple)  # type: ignore[arg-type]
-
-        return shacl
+class OWLExporter(GraphExporter):
+    """Exports verified conceptual data model to an OWL ontology."""
 
+    def iterate_triples(self, data_model: ConceptualDataModel) -> Iterable[Triple]:
+        return _iterate_ontology_triples(data_model)
 
-class SHACLNodeShape(_ModelConfig):
-    id_: URIRef
-    type_: URIRef = SHACL.NodeShape
-    target_class: URIRef
-    parent: list[URIRef] | None = None
-    property_shapes: list["SHACLPropertyShape"] | None = None
-    namespace: Namespace
+    def prefixes(self, data_model: ConceptualDataModel) -> dict[str, Namespace]:
+        return {data_model.metadata.prefix: data_model.metadata.namespace, **data_model.prefixes}
 
     @property
-    def type_triples(self) -> list[tuple]:
-        return [(self.id_, RDF.type, self.type_)]
+    def description(self) -> str:
+        return "Export verified conceptual data model to OWL."
 
-    @property
-    def target_class_triples(self) -> list[tuple]:
-        return [(self.id_, SHACL.targetClass, self.target_class)]
 
-    @property
-    def target_parent_class_triples(self) -> list[tuple]:
-        if self.parent:
-            return [(self.id_, RDFS.subClassOf, parent) for parent in self.parent]
-        else:
-            return []
+class SHACLExporter(GraphExporter):
+    """Exports data_model to a SHACL graph."""
 
-    @property
-    def property_shapes_triples(self) -> list[tuple]:
-        triples: list[tuple] = []
-        if self.property_shapes:
-            for property_shape in self.property_shapes:
-                triples.append((self.id_, SHACL.property, property_shape.id_))
-                triples.extend(property_shape.triples)
-        return triples
+    def iterate_triples(self, data_model: ConceptualDataModel) -> Iterable[Triple]:
+        return _iterate_shacl_triples(data_model)
 
     @property
-    def triples(self) -> list[tuple]:
-        return (
-            self.type_triples
-            + self.target_class_triples
-            + self.property_shapes_triples
-            + self.target_parent_class_triples
-        )
+    def description(self) -> str:
+        return "Export verified conceptual data model to SHACL."
 
-    @classmethod
-    def from_concept(
-        cls,
-        concept_entity: ConceptEntity,
-        concepts_by_concept_entity: dict[ConceptEntity, Concept],
-        properties: list[ConceptualProperty],
-        namespace: Namespace,
-    ) -> "SHACLNodeShape":
-        if not (concept := concepts_by_concept_entity.get(concept_entity)):
-            raise ValueError(f"Concept {concept_entity} not found in data model!")
-
-        if concept.implements:
-            parent = [namespace[str(parent.suffix) + "Shape"] for parent in concept.implements]
-        else:
-            parent = None
-        return cls(
-            id_=namespace[f"{concept.concept.suffix!s}Shape"],
-            target_class=concept.instance_source or namespace[str(concept.concept.suffix)],
-            parent=parent,
-            property_shapes=[
-                SHACLPropertyShape.from_property(property_, concepts_by_concept_entity, namespace)
-                for property_ in properties
-            ],
-            namespace=namespace,
-        )
 
+@dataclass
+class _OWLPropertyDefinition:
+    """The union of all definitions of a property. Dictionaries are used as ordered sets."""
 
-class SHACLPropertyShape(_ModelConfig):
-    id_: BNode
-    type_: URIRef = SHACL.property
-    path: URIRef  # URIRef to property in OWL
-    node_kind: URIRef  # SHACL.IRI or SHACL.Literal
-    expected_value_type: URIRef
-    min_count: int | None
-    max_count: int | None
-    namespace: Namespace
+    types: dict[URIRef, None] = field(default_factory=dict)
+    labels: dict[str, None] = field(default_factory=dict)
+    comments: dict[str, None] = field(default_factory=dict)
+    domains: dict[URIRef, None] = field(default_factory=dict)
+    ranges: dict[URIRef, None] = field(default_factory=dict)
 
-    @property
-    def path_triples(self) -> list[tuple]:
-        return [(self.id_, SHACL.path, self.path)]
 
-    @property
-    def node_kind_triples(self) -> list[tuple]:
-        triples: list[tuple] = [(self.id_, SHACL.nodeKind, self.node_kind)]
+def _iterate_ontology_triples(data_model: ConceptualDataModel) -> Iterator[Triple]:
+    namespace = data_model.metadata.namespace
+    yield URIRef(namespace), RDF.type, OWL.Ontology
 
-        if self.node_kind == SHACL.Literal:
-            triples.append((self.id_, SHACL.datatype, self.expected_value_type))
+    # Properties with the same id are defined for multiple concepts, they are grouped in a single pass.
+    definition_by_id: dict[str, _OWLPropertyDefinition] = defaultdict(_OWLPropertyDefinition)
+    for property_ in data_model.properties:
+        definition = definition_by_id[property_.property_]
+        definition.types[OWL[property_.type_]] = None
+        if isinstance(property_.value_type, DataType):
+            definition.ranges[XSD[property_.value_type.xsd]] = None
+        elif isinstance(property_.value_type, ConceptEntity):
+            definition.ranges[namespace[str(property_.value_type.suffix)]] = None
         else:
-            triples.append((self.id_, SHACL.node, self.expected_value_type))
-
-        return triples
-
-    @property
-    def cardinality_triples(self) -> list[tuple]:
-        triples: list[tuple] = []
-        if self.min_count:
-            triples.append((self.id_, SHACL.minCount, Literal(self.min_count)))
-        if self.max_count:
-            triples.append((self.id_, SHACL.maxCount, Literal(self.max_count)))
-
-        return triples
-
-    @property
-    def triples(self) -> list[tuple]:
-        return self.path_triples + self.node_kind_triples + self.cardinality_triples
-
-    @classmethod
-    def from_property(
-        cls,
-        property_: ConceptualProperty,
-        concepts_by_concept_entity: dict[ConceptEntity, Concept],
-        namespace: Namespace,
-    ) -> "SHACLPropertyShape":
-        if isinstance(property_.value_type, ConceptEntity):
-            concept = concepts_by_concept_entity.get(property_.value_type)
-            value_type_uri = concept.instance_source if concept else None
-            expected_value_type = value_type_uri or namespace[f"{property_.value_type.suffix}"]
-        elif isinstance(property_.value_type, DataType):
-            expected_value_type = XSD[property_.value_type.xsd]
+            raise ValueError(f"Value type {property_.value_type.type_} is not supported")
+        definition.domains[namespace[str(property_.concept.suffix)]] = None
+        if property_.name:
+            definition.labels[property_.name] = None
+        if property_.description:
+            definition.comments[property_.description] = None
+
+    for property_id, definition in definition_by_id.items():
+        yield from _iterate_owl_property_triples(namespace[property_id], definition)
+
+    for concept in data_model.concepts:
+        yield from _iterate_owl_class_triples(concept, namespace, data_model.prefixes)
+
+    yield from _iterate_owl_metadata_triples(data_model.metadata)
+
+
+def _iterate_owl_property_triples(id_: URIRef, definition: _OWLPropertyDefinition) -> Iterator[Triple]:
+    for type_ in definition.types:
+        yield id_, RDF.type, type_
+    # Only the first label (name) is used.
+    if label := next(iter(definition.labels), None):
+        yield id_, RDFS.label, Literal(label)
+        yield id_, DCTERMS.title, Literal(f"{remove_namespace_from_uri(id_)} - {label}")
+    yield id_, RDFS.comment, Literal("\n".join(definition.comments))
+    yield from _iterate_union_triples(id_, RDFS.domain, list(definition.domains))
+    yield from _iterate_union_triples(id_, RDFS.range, list(definition.ranges))
+
+
+def _iterate_union_triples(id_: URIRef, predicate: URIRef, members: list[URIRef]) -> Iterator[Triple]:
+    if len(members) == 1:
+        yield id_, predicate, members[0]
+        return
+    union = BNode()
+    yield id_, predicate, union
+    yield union, RDF.type, OWL.Class
+    node: URIRef | BNode = BNode()
+    yield union, OWL.unionOf, node
+    for no, member in enumerate(members, 1):
+        yield node, RDF.first, member
+        next_node = BNode() if no < len(members) else RDF.nil
+        yield node, RDF.rest, next_node
+        node = next_node
+
+
+def _iterate_owl_class_triples(
+    concept: Concept, namespace: Namespace, prefixes: dict[str, Namespace]
+) -> Iterator[Triple]:
+    id_ = namespace[str(concept.concept.suffix)]
+    yield id_, RDF.type, OWL.Class
+    if concept.name:
+        yield id_, RDFS.label, Literal(concept.name)
+        yield id_, DCTERMS.title, Literal(f"{remove_namespace_from_uri(id_)} - {concept.name}")
+    if concept.description:
+        yield id_, RDFS.comment, Literal(concept.description)
+    if concept.implements and isinstance(concept.implements, list):
+        for parent in concept.implements:
+            try:
+                parent_id = prefixes[str(parent.prefix)][str(parent.suffix)]
+            except KeyError:
+                parent_id = namespace[str(parent.suffix)]
+            yield id_, RDFS.subClassOf, parent_id
+
+
+def _iterate_owl_metadata_triples(metadata: ConceptualMetadata) -> Iterator[Triple]:
+    id_ = URIRef(metadata.namespace)
+    yield id_, DCTERMS.hasVersion, Literal(metadata.version)
+    yield id_, OWL.versionInfo, Literal(metadata.version)
+    yield id_, RDFS.label, Literal(metadata.name)
+    yield id_, NEAT_NAMESPACE.prefix, Literal(metadata.prefix)
+    yield id_, DCTERMS.title, Literal(metadata.name)
+    yield id_, DCTERMS.created, Literal(metadata.created, datatype=XSD.dateTime)
+    yield id_, DCTERMS.description, Literal(metadata.description)
+    creators = metadata.creator if isinstance(metadata.creator, list) else [metadata.creator]
+    for creator in creators:
+        yield id_, DCTERMS.creator, Literal(creator)
+    if metadata.updated:
+        yield id_, DCTERMS.modified, Literal(metadata.updated, datatype=XSD.dateTime)
+
+
+def _iterate_shacl_triples(data_model: ConceptualDataModel) -> Iterator[Triple]:
+    namespace = data_model.metadata.namespace
+    concept_by_entity = {concept.concept: concept for concept in data_model.concepts}
+    properties_by_concept: dict[ConceptEntity, list[ConceptualProperty]] = defaultdict(list)
+    for property_ in data_model.properties:
+        properties_by_concept[property_.concept].append(property_)
+
+    for concept_entity, properties in properties_by_concept.items():
+        yield from _iterate_node_shape_triples(concept_entity, concept_by_entity, properties, namespace)
+    # Shapes without any property shapes
+    for concept_entity in concept_by_entity:
+        if concept_entity in properties_by_concept:
+            continue
+        yield from _iterate_node_shape_triples(concept_entity, concept_by_entity, [], namespace)
+
+
+def _iterate_node_shape_triples(
+    concept_entity: ConceptEntity,
+    concept_by_entity: dict[ConceptEntity, Concept],
+    properties: list[ConceptualProperty],
+    namespace: Namespace,
+) -> Iterator[Triple]:
+    if not (concept := concept_by_entity.get(concept_entity)):
+        raise ValueError(f"Concept {concept_entity} not found in data model!")
+
+    id_ = namespace[f"{concept.concept.suffix!s}Shape"]
+    yield id_, RDF.type, SHACL.NodeShape
+    yield id_, SHACL.targetClass, concept.instance_source or namespace[str(concept.concept.suffix)]
+    property_shape_ids = [BNode() for _ in properties]
+    for property_shape_id in property_shape_ids:
+        yield id_, SHACL.property, property_shape_id
+    for parent in concept.implements or []:
+        yield id_, RDFS.subClassOf, namespace[str(parent.suffix) + "Shape"]
+    # The property shapes follow the node shape, such that the triples of each subject are consecutive.
+    for property_shape_id, property_ in zip(property_shape_ids, properties, strict=True):
+        yield from _iterate_property_shape_triples(property_shape_id, property_, concept_by_entity, namespace)
+
+
+def _iterate_property_shape_triples(
+    id_: BNode,
+    property_: ConceptualProperty,
+    concept_by_entity: dict[ConceptEntity, Concept],
+    namespace: Namespace,
+) -> Iterator[Triple]:
+    if isinstance(property_.value_type, ConceptEntity):
+        concept = concept_by_entity.get(property_.value_type)
+        value_type_uri = concept.instance_source if concept else None
+        expected_value_type = value_type_uri or namespace[f"{property_.value_type.suffix}"]
+    elif isinstance(property_.value_type, DataType):
+        expected_value_type = XSD[property_.value_type.xsd]
+    else:
+        raise NotImplementedError(f"Value type {property_.value_type.type_} is not supported yet")
+
+    if property_.instance_source and len(property_.instance_source) == 1:
+        path = property_.instance_source[0]
+    else:
+        path = namespace[property_.property_]
+    yield id_, SHACL.path, path
+    if property_.type_ == EntityTypes.object_property:
+        yield id_, SHACL.nodeKind, SHACL.IRI
+        yield id_, SHACL.node, expected_value_type
+    else:
+        yield id_, SHACL.nodeKind, SHACL.Literal
+        yield id_, SHACL.datatype, expected_value_type
+    if property_.min_count:
+        yield id_, SHACL.minCount, Literal(property_.min_count)
+    if property_.max_count and property_.max_count != float("inf"):
+        yield id_, SHACL.maxCount, Literal(int(property_.max_count))
+
+
+def _write_turtle(file: IO[str], triples: Iterable[Triple], prefixes: dict[str, Namespace]) -> None:
+    """Writes the triples as Turtle without building a graph.
+
+    Consecutive triples with the same subject are written as a single statement.
+    """
+    prefix_by_namespace: dict[str, str] = {}
+    for prefix, namespace in {**_TURTLE_PREFIXES, **prefixes}.items():
+        if str(namespace) not in prefix_by_namespace and _TURTLE_PREFIX.fullmatch(prefix):
+            prefix_by_namespace[str(namespace)] = prefix
+            file.write(f"@prefix {prefix}: <{namespace}> .\n")
+
+    def as_turtle(term: Any) -> str:
+        if isinstance(term, URIRef):
+            split = max(term.rfind("#"), term.rfind("/")) + 1
+            prefix = prefix_by_namespace.get(term[:split])
+            if prefix is not None and _TURTLE_LOCAL_NAME.fullmatch(local_name := term[split:]):
+                return f"{prefix}:{local_name}"
+        return term.n3()
+
+    last_subject = None
+    for subject, predicate, object_ in triples:
+        if subject == last_subject:
+            file.write(f" ;\n    {as_turtle(predicate)} {as_turtle(object_)}")
         else:
-            raise NotImplementedError(f"Value type {property_.value_type.type_} is not supported yet")
-
-        return cls(
-            id_=BNode(),
-            path=property_.instance_source[0]
-            if property_.instance_source and len(property_.instance_source) == 1
-            else namespace[property_.property_],
-            node_kind=SHACL.IRI if property_.type_ == EntityTypes.object_property else SHACL.Literal,
-            expected_value_type=expected_value_type,
-            min_count=property_.min_count,
-            max_count=(
-                int(property_.max_count) if property_.max_count and property_.max_count != float("inf") else None
-            ),
-            namespace=namespace,
-        )
+            if last_subject is not None:
+                file.write(" .\n")
+            file.write(f"\n{as_turtle(subject)} {as_turtle(predicate)} {as_turtle(object_)}")
+            last_subject = subject
+    if last_subject is not None:
+        file.write(" .\n")
@@ -1,14 +1,15 @@
 import itertools
 from collections import Counter, defaultdict
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Iterator, Mapping
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, ClassVar, cast
 
 from cognite.client import data_modeling as dm
-from rdflib import RDF, RDFS, Graph, Namespace, URIRef
+from rdflib import RDF, RDFS, XSD, Graph, Namespace, URIRef
 from rdflib import Literal as RdfLiteral
+from rdflib.term import Node
 
 from cognite.neat._v0.core._config import GLOBAL_CONFIG
 from cognite.neat._v0.core._constants import NEAT, get_default_prefixes_and_namespaces
@@ -38,21 +39,13 @@ ORDERED_CLASSES_QUERY = """SELECT ?class (count(?s) as ?instances )
                            WHERE { ?s a ?class . }
                            group by ?class order by DESC(?instances)"""
 
-INSTANCES_OF_CLASS_QUERY = """SELECT ?s ?propertyCount WHERE { ?s a <class> . BIND ('Unknown' as ?propertyCount) }"""
-
-
 INSTANCES_OF_CLASS_RICHNESS_ORDERED_QUERY = """SELECT ?s (COUNT(?p) as ?propertyCount)
                                                WHERE { ?s a <class> ; ?p ?o . }
                                                GROUP BY ?s
                                                ORDER BY DESC(?propertyCount)"""
 
-INSTANCE_PROPERTIES_DEFINITION = """SELECT ?property (count(?property) as ?occurrence) ?dataType ?objectType
-                                    WHERE {<instance_id> ?property ?value .
-
-                                           BIND(datatype(?value) AS ?dataType)
-
-                                           OPTIONAL {?value rdf:type ?objectType .}}
-                                    GROUP BY ?property ?dataType ?objectType"""
+# Maximum number of nodes which types are kept while inferring.
+_MAX_CACHED_OBJECT_TYPES = 100_000
 
 
 class InferenceImporter(BaseRDFImporter):
@@ -72,7 +65,10 @@ class InferenceImporter(BaseRDFImporter):
         max_number_of_instance: Maximum number of instances to be used in inference
         prefix: Prefix to be used for the inferred model
 
-
+    !!! note "Inference"
+        The instances of each class are scanned once, reading their properties directly from the graph
+        index, and the property, data type and object type occurrences are counted in Python. If
+        max_number_of_instance is set, the instances with the most properties are used.
     """
 
     overwrite_data_types: ClassVar[Mapping[URIRef, URIRef]] = {
@@ -177,25 +173,15 @@ class InferenceImporter(BaseRDFImporter):
 
             self._add_uri_namespace_to_prefixes(cast(URIRef, concept_uri), prefixes)
 
-        instances_query = (
-            INSTANCES_OF_CLASS_QUERY if self.max_number_of_instance == -1 else INSTANCES_OF_CLASS_RICHNESS_ORDERED_QUERY
-        )
-
         classes_iterable = iterate_progress_bar(concepts.items(), len(concepts), "Inferring classes")
+        object_types_by_node: dict[Node, list[URIRef]] = {}
 
         # Infers all the properties of the class
         for concept_id, class_definition in classes_iterable:
-            for (  # type: ignore[misc]
-                instance,
-                _,
-            ) in self.graph.query(  # type: ignore[misc]
-                instances_query.replace("class", class_definition["uri"])
-                if self.max_number_of_instance < 0
-                else instances_query.replace("class", class_definition["uri"]) + f" LIMIT {self.max_number_of_instance}"
-            ):
-                for property_uri, occurrence, data_type_uri, object_type_uri in self.graph.query(  # type: ignore[misc]
-                    INSTANCE_PROPERTIES_DEFINITION.replace("instance_id", instance)
-                ):  # type: ignore[misc]
+            for instance in self._iterate_instances(class_definition["uri"]):
+                for property_uri, occurrence, data_type_uri, object_type_uri in self._iterate_property_definitions(
+                    instance, object_types_by_node
+                ):
                     # this is to skip rdf:type property
 
                     if property_uri == RDF.type:
@@ -230,7 +216,7 @@ class InferenceImporter(BaseRDFImporter):
                     definition = {
                         "concept": concept_id,
                         "property_": property_id,
-                        "max_count": cast(RdfLiteral, occurrence).value,
+                        "max_count": occurrence,
                         "value_type": value_type_id,
                         "instance_source": (
                             f"{uri_to_short_form(class_definition['uri'], prefixes)}"
@@ -270,6 +256,49 @@ class InferenceImporter(BaseRDFImporter):
             "prefixes": prefixes,
         }
 
+    def _iterate_instances(self, class_uri: URIRef) -> Iterator[URIRef]:
+        if self.max_number_of_instance < 0:
+            instances: Iterable[Node] = self.graph.subjects(RDF.type, class_uri)
+        else:
+            query = INSTANCES_OF_CLASS_RICHNESS_ORDERED_QUERY.replace("class", class_uri)
+            instances = (row[0] for row in self.graph.query(f"{query} LIMIT {self.max_number_of_instance}"))  # type: ignore[index]
+        for instance in instances:
+            # Blank nodes cannot be referred to across queries, thus they have never been part of the inference.
+            if isinstance(instance, URIRef):
+                yield instance
+
+    def _iterate_property_definitions(
+        self, instance: URIRef, object_types_by_node: dict[Node, list[URIRef]]
+    ) -> Iterable[tuple[URIRef, int, URIRef | None, URIRef | None]]:
+        """The properties of an instance, with the datatype or object type of their values, and how many
+        values of each (property, datatype, object type) the instance has.
+
+        This is the same as the SPARQL query
+            SELECT ?property (count(?property) as ?occurrence) ?dataType ?objectType
+            WHERE {<instance> ?property ?value .
+                   BIND(datatype(?value) AS ?dataType)
+                   OPTIONAL {?value rdf:type ?objectType .}}
+            GROUP BY ?property ?dataType ?objectType
+        without having to run one query per instance.
+        """
+        occurrence_by_definition: dict[tuple[URIRef, URIRef | None, URIRef | None], int] = {}
+        for property_uri, value in self.graph.predicate_objects(instance):
+            data_type_uri: URIRef | None = None
+            object_type_uris: list[URIRef] | list[None] = [None]
+            if isinstance(value, RdfLiteral):
+                data_type_uri = RDF.langString if value.language else (value.datatype or XSD.string)
+            else:
+                if (types := object_types_by_node.get(value)) is None:
+                    if len(object_types_by_node) >= _MAX_CACHED_OBJECT_TYPES:
+                        object_types_by_node.clear()
+                    types = object_types_by_node[value] = cast(list[URIRef], list(self.graph.objects(value, RDF.type)))
+                object_type_uris = types or object_type_uris
+            for object_type_uri in object_type_uris:
+                key = (cast(URIRef, property_uri), data_type_uri, object_type_uri)
+                occurrence_by_definition[key] = occurrence_by_definition.get(key, 0) + 1
+        for (property_uri, data_type_uri, object_type_uri), occurrence in occurrence_by_definition.items():
+            yield property_uri, occurrence, data_type_uri, object_type_uri
+
     def _default_metadata(self) -> dict[str, Any]:
         now = datetime.now(timezone.utc)
         return ConceptualMetadata(
@@ -6,7 +6,7 @@ import math
 import sys
 import types
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Hashable, Iterator, MutableSequence, Sequence
+from collections.abc import Callable, Hashable, Iterator, MutableSequence
 from datetime import datetime
 from typing import Annotated, Any, ClassVar, Literal, SupportsIndex, TypeVar, get_args, get_origin, overload
 
@@ -330,7 +330,7 @@ class BaseVerifiedDataModel(SchemaModel, ABC):
             exclude_defaults: Whether to exclude fields that are set to their default value.
         """
         if sort:
-            for field_name in self.model_fields.keys():
+            for field_name in type(self).model_fields.keys():
                 value = getattr(self, field_name)
                 # Ensure deterministic order of properties, classes, views, and so on
                 if isinstance(value, SheetList):
@@ -382,9 +382,11 @@ class SheetList(list, MutableSequence[T_SheetRow]):
             raise TypeError("SheetList must be used with a type argument, e.g., SheetList[InformationProperty]")
 
         instance_schema = core_schema.is_instance_schema(cls)
-        sequence_row_schema = handler.generate_schema(Sequence[item_type])  # type: ignore[valid-type]
+        # The rows are validated in one batch with the list schema, which is faster than the generic sequence
+        # schema. In lax mode, it also accepts tuples, sets, and generators.
+        list_row_schema = handler.generate_schema(list[item_type])  # type: ignore[valid-type]
 
-        non_instance_schema = core_schema.no_info_after_validator_function(SheetList, sequence_row_schema)
+        non_instance_schema = core_schema.no_info_after_validator_function(SheetList, list_row_schema)
         return core_schema.union_schema([instance_schema, non_instance_schema])
 
     def to_pandas(self, drop_na_columns: bool = True, include: list[str] | None = None) -> pd.DataFrame:
@@ -103,11 +103,11 @@ class DataType(BaseModel):
         return str(self)
 
     def __str__(self) -> str:
-        return self._suffix_extra_args(self.model_fields["name"].default)
+        return self._suffix_extra_args(type(self).model_fields["name"].default)
 
     def _suffix_extra_args(self, base: str) -> str:
         extra_fields: dict[str, str] = {}
-        for field_id, field_ in self.model_fields.items():
+        for field_id, field_ in type(self).model_fields.items():
             if field_id == "name":
                 continue
             value = getattr(self, field_id)
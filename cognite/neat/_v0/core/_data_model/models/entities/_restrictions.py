@@ -94,7 +94,7 @@ class ConceptPropertyRestriction(ABC, BaseModel):
         extra: tuple[str, ...] = tuple(
             [
                 str(v or "")
-                for field_name in self.model_fields.keys()
+                for field_name in type(self).model_fields.keys()
                 if (v := getattr(self, field_name)) and field_name not in {"property_"}
             ]
         )
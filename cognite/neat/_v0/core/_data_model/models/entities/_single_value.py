@@ -3,7 +3,7 @@ import sys
 from abc import ABC, abstractmethod
 from functools import total_ordering
 from types import UnionType
-from typing import Any, ClassVar, Generic, Literal, TypeVar, Union, cast, get_args, get_origin, overload
+from typing import Any, ClassVar, Generic, Literal, NamedTuple, TypeVar, Union, cast, get_args, get_origin, overload
 
 from cognite.client.data_classes.data_modeling import DirectRelationReference
 from cognite.client.data_classes.data_modeling.data_types import UnitReference
@@ -48,6 +48,26 @@ from ._constants import (
     _UnknownType,
 )
 
+# The same entity strings are loaded many times, for example, the view of every property in a spreadsheet,
+# thus the loaded entities are kept by class, string and defaults.
+_MAX_CACHED_ENTITIES = 10_000
+_entity_by_key: dict[tuple[type, str, tuple], "ConceptualEntity"] = {}
+
+
+class _EntityFields(NamedTuple):
+    """The fields of an entity class, computed once per class.
+
+    Args:
+        entity_type_by_alias: The class of the fields that are entities by field alias, None for the other fields.
+        entity_field_names: The names of the fields that are entities.
+    """
+
+    entity_type_by_alias: dict[str, "type[ConceptualEntity] | None"]
+    entity_field_names: tuple[str, ...]
+
+
+_entity_fields_by_class: dict[type, _EntityFields] = {}
+
 
 @total_ordering
 class ConceptualEntity(BaseModel, extra="ignore"):
@@ -116,16 +136,61 @@ class ConceptualEntity(BaseModel, extra="ignore"):
             if strict:
                 raise NeatValueError(f"Failed to load entity {data!s}")
             return UnknownEntity(prefix=Undefined, suffix=Unknown)
+        key = cls._cache_key(data, defaults)
+        if key is not None and (cached := _entity_by_key.get(key)) is not None:
+            return cached._copy()
         try:
             if defaults and isinstance(defaults, dict):
                 # This is a trick to pass in default values
-                return cls.model_validate({_PARSE: data, "defaults": defaults})
+                entity = cls.model_validate({_PARSE: data, "defaults": defaults})
             else:
-                return cls.model_validate(data)
+                entity = cls.model_validate(data)
         except ValueError:
             if return_on_failure:
                 return data
             raise
+        if key is not None:
+            if len(_entity_by_key) >= _MAX_CACHED_ENTITIES:
+                _entity_by_key.clear()
+            # Entities are mutable, thus the cache keeps its own copy.
+            _entity_by_key[key] = entity._copy()
+        return entity
+
+    @classmethod
+    def _cache_key(cls, data: Any, defaults: dict[str, Any]) -> tuple[type, str, tuple] | None:
+        if not isinstance(data, str):
+            return None
+        key = (cls, data, tuple(sorted(defaults.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _copy(self) -> "Self":
+        copied = self.model_copy()
+        for field_name in type(self)._entity_fields().entity_field_names:
+            if isinstance(value := getattr(copied, field_name), ConceptualEntity):
+                setattr(copied, field_name, value._copy())
+        return copied
+
+    @classmethod
+    def _entity_fields(cls) -> "_EntityFields":
+        if (entity_fields := _entity_fields_by_class.get(cls)) is None:
+            entity_type_by_alias: dict[str, type[ConceptualEntity] | None] = {}
+            entity_field_names: list[str] = []
+            for field_name, field_ in cls.model_fields.items():
+                annotation = field_.annotation
+                if isinstance(annotation, UnionType) or get_origin(annotation) is Union:
+                    annotation = get_args(annotation)[0]
+                if inspect.isclass(annotation) and issubclass(annotation, ConceptualEntity):  # type: ignore[arg-type]
+                    entity_type_by_alias[field_.alias or field_name] = annotation
+                    entity_field_names.append(field_name)
+                else:
+                    entity_type_by_alias[field_.alias or field_name] = None
+            entity_fields = _EntityFields(entity_type_by_alias, tuple(entity_field_names))
+            _entity_fields_by_class[cls] = entity_fields
+        return entity_fields
 
     @model_validator(mode="before")
     def _load(cls, data: Any) -> "dict | ConceptualEntity":
@@ -188,20 +253,14 @@ class ConceptualEntity(BaseModel, extra="ignore"):
                 )
         except ValueError:
             raise NeatValueError(f"Invalid {cls.type_.value} entity: {raw!r}") from None
-        expected_args = {
-            field_.alias or field_name: field_.annotation for field_name, field_ in cls.model_fields.items()
-        }
+        entity_type_by_alias = cls._entity_fields().entity_type_by_alias
         for key in list(extra_args):
-            if key not in expected_args:
+            if key not in entity_type_by_alias:
                 # Todo Warning about unknown key
                 del extra_args[key]
                 continue
-            annotation = expected_args[key]
-            if isinstance(annotation, UnionType) or get_origin(annotation) is Union:
-                annotation = get_args(annotation)[0]
-
-            if inspect.isclass(annotation) and issubclass(annotation, ConceptualEntity):  # type: ignore[arg-type]
-                extra_args[key] = annotation.load(extra_args[key], **defaults)  # type: ignore[union-attr, assignment]
+            if (entity_type := entity_type_by_alias[key]) is not None:
+                extra_args[key] = entity_type.load(extra_args[key], **defaults)  # type: ignore[assignment]
         return dict(prefix=prefix, suffix=suffix, **extra_args)
 
     def dump(self, **defaults: Any) -> str:
@@ -212,7 +271,7 @@ class ConceptualEntity(BaseModel, extra="ignore"):
         extra: tuple[str, ...] = tuple(
             [
                 str(v or "")
-                for field_name in self.model_fields.keys()
+                for field_name in type(self).model_fields.keys()
                 if (v := getattr(self, field_name)) and field_name not in {"prefix", "suffix"}
             ]
         )
@@ -239,7 +298,7 @@ class ConceptualEntity(BaseModel, extra="ignore"):
 
     def __repr__(self) -> str:
         # We have overwritten the serialization to str, so we need to do it manually
-        model_dump = ((k, v) for k in self.model_fields if (v := getattr(self, k)) is not None)
+        model_dump = ((k, v) for k in type(self).model_fields if (v := getattr(self, k)) is not None)
         args = ",".join([f"{k}={v}" for k, v in model_dump])
         return f"{self.type_.value}({args})"
 
@@ -251,7 +310,7 @@ class ConceptualEntity(BaseModel, extra="ignore"):
         # We have overwritten the serialization to str, so we need to do it manually
         model_dump = {
             field.alias or field_name: v.dump(**defaults) if isinstance(v, ConceptualEntity) else v
-            for field_name, field in self.model_fields.items()
+            for field_name, field in type(self).model_fields.items()
             if (v := getattr(self, field_name)) is not None and field_name not in {"prefix", "suffix"}
         }
         # We only remove the default values if all the fields are default
@@ -1,6 +1,6 @@
 import warnings
 from collections import defaultdict
-from collections.abc import Collection, Hashable, Sequence
+from collections.abc import Collection, Sequence
 from typing import Any, cast
 
 from cognite.client.data_classes import data_modeling as dm
@@ -450,10 +450,12 @@ class _DMSExporter:
         view_by_view_id = {view.view.as_id(): view for view in views}
         for view in views:
             view_id = view.view.as_id()
-            seen: set[Hashable] = set()
+            # The identifiers of the properties as strings, as hashing the view entity of every property is slow.
+            view_str = str(view.view)
+            seen: set[tuple[str, str]] = set()
             if view_properties := all_view_properties_by_id.get(view_id):
                 view_properties_with_parents_by_id[view_id].extend(view_properties)
-                seen.update(prop._identifier() for prop in view_properties)
+                seen.update((str(prop.view), prop.view_property) for prop in view_properties)
             if not view.implements:
                 continue
             parents = view.implements.copy()
@@ -470,11 +472,10 @@ class _DMSExporter:
                 if not (parent_view_properties := all_view_properties_by_id.get(parent_view_id)):
                     continue
                 for prop in parent_view_properties:
-                    new_prop = prop.model_copy(update={"view": view.view})
-
-                    if new_prop._identifier() not in seen:
-                        view_properties_with_parents_by_id[view_id].append(new_prop)
-                        seen.add(new_prop._identifier())
+                    identifier = (view_str, prop.view_property)
+                    if identifier not in seen:
+                        view_properties_with_parents_by_id[view_id].append(prop.model_copy(update={"view": view.view}))
+                        seen.add(identifier)
 
         return view_properties_with_parents_by_id
 
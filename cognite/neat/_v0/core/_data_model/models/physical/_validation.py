@@ -2,7 +2,7 @@ import warnings
 from collections import Counter, defaultdict
 from collections.abc import Mapping
 from dataclasses import dataclass
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from typing import cast
 
 from cognite.client import data_modeling as dm
@@ -105,21 +105,19 @@ class PhysicalValidation:
     def imported_views_and_containers_ids(
         self, include_views_with_no_properties: bool = True
     ) -> tuple[set[ViewEntity], set[ContainerEntity]]:
-        existing_views = {view.view for view in self._views}
+        existing_views = self._defined_views
         imported_views: set[ViewEntity] = set()
         for view in self._views:
             for parent in view.implements or []:
                 if parent not in existing_views:
                     imported_views.add(parent)
-        existing_containers = {container.container for container in self._containers or []}
+        existing_containers = self._defined_containers
         imported_containers: set[ContainerEntity] = set()
-        view_with_properties: set[ViewEntity] = set()
         for prop in self._properties:
             if prop.container and prop.container not in existing_containers:
                 imported_containers.add(prop.container)
-            if prop.view not in existing_views:
-                imported_views.add(prop.view)
-            view_with_properties.add(prop.view)
+        view_with_properties = self._property_views
+        imported_views.update(view_with_properties - existing_views)
 
         for container in self._containers or []:
             for constraint in container.constraint or []:
@@ -203,13 +201,28 @@ class PhysicalValidation:
         )
         issue_list.extend(self._validate_schema(dms_schema, all_views_by_id, all_containers_by_id))
         issue_list.extend(self._validate_referenced_container_limits(dms_schema.views, view_properties_by_id))
-        issue_list.extend(self._same_space_views_and_data_model())
+        issue_list.extend(self._same_space_views_and_data_model(dms_schema))
         return issue_list
 
+    @cached_property
+    def _defined_views(self) -> set[ViewEntity]:
+        """The views in the Views sheet, shared by the checks as hashing entities is expensive."""
+        return {view.view for view in self._views}
+
+    @cached_property
+    def _property_views(self) -> set[ViewEntity]:
+        """The views of the properties in the Properties sheet."""
+        return {prop.view for prop in self._properties}
+
+    @cached_property
+    def _defined_containers(self) -> set[ContainerEntity]:
+        """The containers in the Containers sheet."""
+        return {container.container for container in self._containers or []}
+
     def _views_without_properties_exist(self) -> IssueList:
         """Check if there are views that do not have any properties defined directly or inherited."""
         issue_list = IssueList()
-        views = {view.view for view in self._views}
+        views = self._defined_views
         ancestors_by_view = self.analysis.implements_by_view(include_ancestors=True, include_different_space=True)
         views_with_properties = self.analysis.defined_views().union(self._cdf_concepts)
 
@@ -223,14 +236,14 @@ class PhysicalValidation:
 
         return issue_list
 
-    def _same_space_views_and_data_model(self) -> IssueList:
+    @staticmethod
+    def _same_space_views_and_data_model(dms_schema: DMSSchema) -> IssueList:
         issue_list = IssueList()
 
-        schema = self._data_model.as_schema(remove_cdf_spaces=True)
-
-        if schema.data_model and schema.views:
-            data_model_space = schema.data_model.space
-            views_spaces = {view.space for view in schema.views.values()}
+        # The views in the CDF spaces are not part of the data model, see remove_cdf_spaces in as_schema.
+        views_spaces = {view.space for view in dms_schema.views.values() if view.space not in COGNITE_SPACES}
+        if dms_schema.data_model and views_spaces:
+            data_model_space = dms_schema.data_model.space
 
             if data_model_space not in views_spaces:
                 issue_list.append(
@@ -638,7 +651,7 @@ class PhysicalValidation:
         return issue_list
 
     def _validate_value_type_existence(self) -> IssueList:
-        views = {prop_.view for prop_ in self._properties}.union({view_.view for view_ in self._views})
+        views = self._property_views | self._defined_views
         issue_list = IssueList()
         for prop_ in self._properties:
             if isinstance(prop_.value_type, ViewEntity) and prop_.value_type not in views:
@@ -680,7 +680,10 @@ class ToEnterpriseModel(ToExtensionModel):
         return self._to_enterprise(data_model)
 
     def _to_enterprise(self, reference_model: PhysicalDataModel) -> PhysicalDataModel:
-        enterprise_model = reference_model.model_copy(deep=True)
+        # The reference containers and properties are replaced below, thus, they are not copied.
+        enterprise_model = reference_model.model_copy(
+            update={"properties": SheetList[PhysicalProperty](), "containers": None}
+        ).model_copy(deep=True)
 
         enterprise_model.metadata.name = f"{self.org_name} {self.type_} data model"
         enterprise_model.metadata.space = self.new_model_id.space
@@ -696,7 +699,7 @@ class ToEnterpriseModel(ToExtensionModel):
 
         if self.move_connections:
             # Move connections from reference model to new enterprise model
-            enterprise_properties.extend(self._create_connection_properties(enterprise_model, enterprise_views))
+            enterprise_properties.extend(self._create_connection_properties(reference_model, enterprise_views))
 
         # ... however, we do not want to keep the reference containers and properties
         # these we are getting for free through the implements.
@@ -851,7 +854,12 @@ class ToSolutionModel(ToExtensionModel):
 
     def _to_solution(self, reference_data_model: PhysicalDataModel) -> PhysicalDataModel:
         """For creation of solution data model / data_model specifically for mapping over existing containers."""
-        reference_data_model = self._expand_properties(reference_data_model.model_copy(deep=True))
+        # Only the views and properties kept in the solution model are copied, the reference model is only read.
+        reference_data_model = self._expand_properties(
+            reference_data_model.model_copy(
+                update={"properties": SheetList[PhysicalProperty](reference_data_model.properties)}
+            )
+        )
 
         new_views, new_properties, read_view_by_new_view = self._create_views(reference_data_model)
         new_containers, new_container_properties = self._create_containers_update_view_filter(
@@ -884,8 +892,12 @@ class ToSolutionModel(ToExtensionModel):
             properties=new_properties,
             views=new_views,
             containers=new_containers or None,
-            enum=reference_data_model.enum,
-            nodes=reference_data_model.nodes,
+            enum=SheetList[PhysicalEnum](item.model_copy(deep=True) for item in reference_data_model.enum)
+            if reference_data_model.enum
+            else None,
+            nodes=SheetList[PhysicalNodeType](item.model_copy(deep=True) for item in reference_data_model.nodes)
+            if reference_data_model.nodes
+            else None,
         )
 
     @staticmethod
@@ -958,18 +970,22 @@ class ToSolutionModel(ToExtensionModel):
             renaming[ref_view.view] = new_entity
             new_views.append(ref_view.model_copy(deep=True, update={"implements": None, "view": new_entity}))
 
+        # Properties and connections are kept if their view is renamed or already in the new model.
+        new_view_by_view = dict(renaming)
+        for view in new_views:
+            new_view_by_view.setdefault(view.view, view.view)
+
         new_properties = SheetList[PhysicalProperty]()
-        new_view_entities = {view.view for view in new_views}
         for prop in reference.properties:
-            new_property = prop.model_copy(deep=True)
-            if new_property.value_type in renaming and isinstance(new_property.value_type, ViewEntity):
-                new_property.value_type = renaming[new_property.value_type]
-            if new_property.view in renaming:
-                new_property.view = renaming[new_property.view]
-            if new_property.view in new_view_entities and (
-                not isinstance(new_property.value_type, ViewEntity) or new_property.value_type in new_view_entities
-            ):
-                new_properties.append(new_property)
+            if (new_view := new_view_by_view.get(prop.view)) is None:
+                continue
+            update: dict[str, Any] = {"view": new_view}
+            if isinstance(prop.value_type, ViewEntity):
+                if (new_value_type := new_view_by_view.get(prop.value_type)) is None:
+                    continue
+                update["value_type"] = new_value_type
+            # Only the properties kept in the new model are copied.
+            new_properties.append(prop.model_copy(deep=True, update=update))
         return new_views, new_properties, read_view_by_new_view
 
     def _create_containers_update_view_filter(
@@ -1043,11 +1059,12 @@ class ToSolutionModel(ToExtensionModel):
         ref_containers_by_ref_view: dict[ViewEntity, set[ContainerEntity]],
         ref_view: PhysicalView,
     ) -> None:
+        # The entities are copied, as the reference model is not copied and entities are mutable.
         if self.filter_type == "view":
-            view.filter_ = HasDataFilter(inner=[ref_view.view])
+            view.filter_ = HasDataFilter(inner=[ref_view.view.model_copy()])
         elif self.filter_type == "container" and (ref_containers := ref_containers_by_ref_view.get(ref_view.view)):
             # Sorting to ensure deterministic order
-            view.filter_ = HasDataFilter(inner=sorted(ref_containers))
+            view.filter_ = HasDataFilter(inner=sorted(container.model_copy() for container in ref_containers))
 
 
 class ToDataProductModel(ToSolutionModel):
@@ -1473,7 +1490,7 @@ class _ConceptualDataModelConverter:
             and isinstance(prop.value_type, ConceptEntity)
         }
         ancestors_by_view: dict[ViewEntity, set[ViewEntity]] = {}
-        parents_by_concept = DataModelAnalysis(self.conceptual_data_model).parents_by_concept(
+        parents_by_concept = DataModelAnalysis.cached(self.conceptual_data_model).parents_by_concept(
             include_ancestors=True, include_different_space=True
         )
         for concept, parents in parents_by_concept.items():
@@ -2188,7 +2205,7 @@ class SubsetPhysicalDataModel(VerifiedDataModelTransformer[PhysicalDataModel, Ph
         self._views = views
 
     def transform(self, data_model: PhysicalDataModel) -> PhysicalDataModel:
-        analysis = DataModelAnalysis(physical=data_model)
+        analysis = DataModelAnalysis.cached(physical=data_model)
 
         views_by_view = analysis.view_by_view_entity
         implements_by_view = analysis.implements_by_view()
@@ -2260,7 +2277,7 @@ class SubsetConceptualDataModel(VerifiedDataModelTransformer[ConceptualDataModel
         self._concepts = concepts
 
     def transform(self, data_model: ConceptualDataModel) -> ConceptualDataModel:
-        analysis = DataModelAnalysis(conceptual=data_model)
+        analysis = DataModelAnalysis.cached(conceptual=data_model)
 
         concept_by_concept_entity = analysis.concept_by_concept_entity
         parent_entity_by_concept_entity = analysis.parents_by_concept()
@@ -11,6 +11,15 @@ def quad_formats() -> list[str]:
     return ["trig", "nquads", "nq", "nt"]
 
 
+def is_quad_format(rdflib_format: str) -> bool:
+    """Whether the documents of the format give the named graph of each triple.
+
+    This excludes N-Triples, which is among the quad_formats as a single N-Triples file is parsed
+    into the dataset.
+    """
+    return rdflib_format in quad_formats() and rdflib_format != "nt"
+
+
 def rdflib_to_oxi_type(rdflib_format: str) -> str | None:
     """Convert an RDFlib format to a MIME type.
 
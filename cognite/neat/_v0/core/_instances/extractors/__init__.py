@@ -15,7 +15,7 @@ from ._dms import DMSExtractor
 from ._dms_graph import DMSGraphExtractor
 from ._mock_graph_generator import MockGraphGenerator
 from ._raw import RAWExtractor
-from ._rdf_file import RdfFileExtractor
+from ._rdf_file import RdfFileExtractor, RdfFilesExtractor
 
 __all__ = [
     "AssetsExtractor",
@@ -33,6 +33,7 @@ __all__ = [
     "MockGraphGenerator",
     "RAWExtractor",
     "RdfFileExtractor",
+    "RdfFilesExtractor",
     "RelationshipsExtractor",
     "SequencesExtractor",
     "TimeSeriesExtractor",
@@ -49,6 +50,7 @@ TripleExtractors = (
     | FilesExtractor
     | LabelsExtractor
     | RdfFileExtractor
+    | RdfFilesExtractor
     | DMSExtractor
     | ClassicGraphExtractor
     | DataSetExtractor
@@ -15,19 +15,23 @@ class AssetsExtractor(ClassicCDFBaseExtractor[Asset]):
     _instance_id_prefix = InstanceIdPrefix.asset
 
     @classmethod
-    def _from_dataset(cls, client: CogniteClient, data_set_external_id: str) -> tuple[int | None, Iterable[Asset]]:
+    def _from_dataset(
+        cls, client: CogniteClient, data_set_external_id: str, partitions: int | None = None
+    ) -> tuple[int | None, Iterable[Asset]]:
         total = client.assets.aggregate_count(filter=AssetFilter(data_set_ids=[{"externalId": data_set_external_id}]))
-        items = client.assets(data_set_external_ids=data_set_external_id)
+        items = cls._list_resources(client.assets, partitions, data_set_external_ids=data_set_external_id)
         return total, items
 
     @classmethod
-    def _from_hierarchy(cls, client: CogniteClient, root_asset_external_id: str) -> tuple[int | None, Iterable[Asset]]:
+    def _from_hierarchy(
+        cls, client: CogniteClient, root_asset_external_id: str, partitions: int | None = None
+    ) -> tuple[int | None, Iterable[Asset]]:
         total = client.assets.aggregate_count(
             filter=AssetFilter(asset_subtree_ids=[{"externalId": root_asset_external_id}])
         )
         items = cast(
             Iterable[Asset],
-            client.assets(asset_subtree_external_ids=root_asset_external_id),
+            cls._list_resources(client.assets, partitions, asset_subtree_external_ids=root_asset_external_id),
         )
         return total, items
 
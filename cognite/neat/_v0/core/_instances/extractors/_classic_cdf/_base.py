@@ -31,6 +31,30 @@ T_CogniteResource = TypeVar("T_CogniteResource", bound=WriteableCogniteResource)
 
 DEFAULT_SKIP_METADATA_VALUES = frozenset({"nan", "null", "none", ""})
 
+_PARENT_RENAMING = {"parent_external_id": "parent_id", "parentExternalId": "parentId"}
+_PARENT_KEYS = frozenset(_PARENT_RENAMING.keys()) | frozenset(_PARENT_RENAMING.values())
+_SCALAR_TYPES = frozenset({str, int, float, bool})
+
+# Upper bound on the number of distinct values an extractor keeps the converted RDF terms for.
+_MAX_CACHED_OBJECTS = 100_000
+# The conversion of these keys depends on the state of the extractor, or the values are unique, thus not cached.
+_UNCACHED_OBJECT_KEYS = frozenset(
+    {
+        "assetId",
+        "asset_id",
+        "assetIds",
+        "asset_ids",
+        "rootId",
+        "root_id",
+        "parentId",
+        "parent_id",
+        "parentExternalId",
+        "parent_external_id",
+        "externalId",
+        "external_id",
+    }
+)
+
 if sys.version_info >= (3, 11):
     from enum import StrEnum
 else:
@@ -122,6 +146,13 @@ class ClassicCDFBaseExtractor(BaseExtractor, ABC, Generic[T_CogniteResource]):
         self._uriref_by_external_id: dict[str, URIRef] = {}
         self.asset_parent_uri_by_id: dict[int, URIRef] = {}
         self.asset_parent_uri_by_external_id: dict[str, URIRef] = {}
+        # The same keys and values are repeated across millions of items, thus the predicates
+        # and literals are created once per distinct key/value.
+        self._predicate_by_key: dict[str, URIRef] = {}
+        self._metadata_predicate_by_key: dict[str, URIRef] = {}
+        self._metadata_literal_by_value: dict[str, Literal] = {}
+        self._object_by_key_value: dict[tuple[str, str | int], Literal | URIRef | None] = {}
+        self._rdf_type_uri: URIRef | None = None
 
     def extract(self) -> Iterable[Triple]:
         """Extracts an asset with the given asset_id."""
@@ -168,10 +199,10 @@ class ClassicCDFBaseExtractor(BaseExtractor, ABC, Generic[T_CogniteResource]):
         if self._log_urirefs and hasattr(item, "external_id"):
             self._uriref_by_external_id[item.external_id] = id_
 
-        type_ = self._get_rdf_type()
+        type_uri = self._get_rdf_type_uri()
 
         # Set rdf type
-        triples: list[Triple] = [(id_, RDF.type, self.namespace[type_])]
+        triples: list[Triple] = [(id_, RDF.type, type_uri)]
         if self.as_write:
             item = item.as_write()
         dumped = item.dump(self.camel_case)
@@ -182,18 +213,19 @@ class ClassicCDFBaseExtractor(BaseExtractor, ABC, Generic[T_CogniteResource]):
 
         triples.extend(self._item2triples_special_cases(id_, dumped))
 
-        parent_renaming = {"parent_external_id": "parent_id", "parentExternalId": "parentId"}
-        parent_key = set(parent_renaming.keys()) | set(parent_renaming.values())
-
         for key, value in dumped.items():
             if value is None or value == []:
                 continue
-            values = value if isinstance(value, Sequence) and not isinstance(value, str) else [value]
+            if type(value) in _SCALAR_TYPES:
+                # Fast path, avoids the comparatively slow isinstance check against the Sequence ABC.
+                values = [value]
+            else:
+                values = value if isinstance(value, Sequence) and not isinstance(value, str) else [value]
             for raw in values:
-                object_ = self._as_object(raw, key)
+                object_ = self._as_object_cached(raw, key)
                 if object_ is None:
                     continue
-                if key in parent_key:
+                if key in _PARENT_KEYS:
                     parent_id = cast(URIRef, object_)
                     if isinstance(raw, str):
                         self.asset_parent_uri_by_external_id[raw] = parent_id
@@ -201,11 +233,13 @@ class ClassicCDFBaseExtractor(BaseExtractor, ABC, Generic[T_CogniteResource]):
                         self.asset_parent_uri_by_id[raw] = parent_id
                     # We add a triple to include the parent. This is such that for example the parent
                     # externalID will remove the prefix when loading.
-                    triples.append((parent_id, RDF.type, self.namespace[self._get_rdf_type()]))
+                    triples.append((parent_id, RDF.type, type_uri))
                     # Parent external ID must be renamed to parent id to match the data model.
-                    key = parent_renaming.get(key, key)
+                    key = _PARENT_RENAMING.get(key, key)
 
-                triples.append((id_, self.namespace[key], object_))
+                if (predicate := self._predicate_by_key.get(key)) is None:
+                    predicate = self._predicate_by_key[key] = self.namespace[key]
+                triples.append((id_, predicate, object_))
         return triples
 
     def _item2triples_special_cases(self, id_: URIRef, dumped: dict[str, Any]) -> list[Triple]:
@@ -235,13 +269,19 @@ class ClassicCDFBaseExtractor(BaseExtractor, ABC, Generic[T_CogniteResource]):
 
     def _metadata_to_triples(self, id_: URIRef, metadata: dict[str, str]) -> Iterable[Triple]:
         if self.unpack_metadata:
+            predicate_by_key = self._metadata_predicate_by_key
+            literal_by_value = self._metadata_literal_by_value
+            skip_values = self.skip_metadata_values
             for key, value in metadata.items():
-                if value and (self.skip_metadata_values is None or value.casefold() not in self.skip_metadata_values):
-                    yield (
-                        id_,
-                        self.namespace[urllib.parse.quote(key)],
-                        Literal(string_to_ideal_type(value)),
-                    )
+                if not value or (skip_values is not None and value.casefold() in skip_values):
+                    continue
+                if (predicate := predicate_by_key.get(key)) is None:
+                    predicate = predicate_by_key[key] = self.namespace[urllib.parse.quote(key)]
+                if (object_ := literal_by_value.get(value)) is None:
+                    object_ = Literal(string_to_ideal_type(value))
+                    if len(literal_by_value) < _MAX_CACHED_OBJECTS:
+                        literal_by_value[value] = object_
+                yield id_, predicate, object_
         else:
             yield id_, self.namespace.metadata, Literal(json.dumps(metadata), datatype=XSD._NS["json"])
 
@@ -251,6 +291,11 @@ class ClassicCDFBaseExtractor(BaseExtractor, ABC, Generic[T_CogniteResource]):
             type_ = f"{self.prefix}{type_}"
         return self._SPACE_PATTERN.sub("_", type_)
 
+    def _get_rdf_type_uri(self) -> URIRef:
+        if self._rdf_type_uri is None:
+            self._rdf_type_uri = self.namespace[self._get_rdf_type()]
+        return self._rdf_type_uri
+
     def _as_object(self, raw: Any, key: str) -> Literal | URIRef | None:
         """Return properly formatted object part of s-p-o triple"""
         if key in {"data_set_id", "dataSetId"}:
@@ -323,6 +368,22 @@ class ClassicCDFBaseExtractor(BaseExtractor, ABC, Generic[T_CogniteResource]):
                 ...
         return Literal(raw)
 
+    def _as_object_cached(self, raw: Any, key: str) -> Literal | URIRef | None:
+        """Same as _as_object, but reuses the converted object for repeated (key, value) pairs."""
+        # Bool is excluded as True == 1 and False == 0 would share the cache entry with the integers.
+        if (type(raw) is not str and type(raw) is not int) or key in _UNCACHED_OBJECT_KEYS:
+            return self._as_object(raw, key)
+        if self.identifier == "externalId" and key in {"data_set_id", "dataSetId"}:
+            # The lookup of the data set external id has its own cache and warns on failure.
+            return self._as_object(raw, key)
+        cache_key = (key, raw)
+        if cache_key in self._object_by_key_value:
+            return self._object_by_key_value[cache_key]
+        object_ = self._as_object(raw, key)
+        if len(self._object_by_key_value) < _MAX_CACHED_OBJECTS:
+            self._object_by_key_value[cache_key] = object_
+        return object_
+
     @classmethod
     def from_dataset(
         cls,
@@ -337,8 +398,9 @@ class ClassicCDFBaseExtractor(BaseExtractor, ABC, Generic[T_CogniteResource]):
         prefix: str | None = None,
         identifier: typing.Literal["id", "externalId"] = "id",
         skip_connections: bool = False,
+        partitions: int | None = None,
     ) -> Self:
-        total, items = cls._handle_no_access(lambda: cls._from_dataset(client, data_set_external_id))
+        total, items = cls._handle_no_access(lambda: cls._from_dataset(client, data_set_external_id, partitions))
         return cls(
             items,
             namespace,
@@ -356,7 +418,7 @@ class ClassicCDFBaseExtractor(BaseExtractor, ABC, Generic[T_CogniteResource]):
     @classmethod
     @abstractmethod
     def _from_dataset(
-        cls, client: CogniteClient, data_set_external_id: str
+        cls, client: CogniteClient, data_set_external_id: str, partitions: int | None = None
     ) -> tuple[int | None, Iterable[T_CogniteResource]]:
         raise NotImplementedError
 
@@ -373,8 +435,9 @@ class ClassicCDFBaseExtractor(BaseExtractor, ABC, Generic[T_CogniteResource]):
         as_write: bool = False,
         prefix: str | None = None,
         identifier: typing.Literal["id", "externalId"] = "id",
+        partitions: int | None = None,
     ) -> BaseExtractor:
-        total, items = cls._handle_no_access(lambda: cls._from_hierarchy(client, root_asset_external_id))
+        total, items = cls._handle_no_access(lambda: cls._from_hierarchy(client, root_asset_external_id, partitions))
         return cls(
             items,
             namespace,
@@ -391,7 +454,7 @@ class ClassicCDFBaseExtractor(BaseExtractor, ABC, Generic[T_CogniteResource]):
     @classmethod
     @abstractmethod
     def _from_hierarchy(
-        cls, client: CogniteClient, root_asset_external_id: str
+        cls, client: CogniteClient, root_asset_external_id: str, partitions: int | None = None
     ) -> tuple[int | None, Iterable[T_CogniteResource]]:
         raise NotImplementedError
 
@@ -427,6 +490,18 @@ class ClassicCDFBaseExtractor(BaseExtractor, ABC, Generic[T_CogniteResource]):
     def _from_file(cls, file_path: str | Path) -> tuple[int | None, Iterable[T_CogniteResource]]:
         raise NotImplementedError
 
+    @staticmethod
+    def _list_resources(api: Any, partitions: int | None = None, **filters: Any) -> Iterable[Any]:
+        """Lists the resources of a classic CDF API matching the filters.
+
+        Without partitions, the resources are fetched lazily as they are iterated over. With partitions,
+        the resources are fetched with that many parallel requests, which is significantly faster for large
+        resource types, but keeps all the resources of the type in memory.
+        """
+        if partitions:
+            return api.list(partitions=partitions, limit=None, **filters)
+        return api(**filters)
+
     @classmethod
     def _handle_no_access(
         cls, action: Callable[[], tuple[int | None, Iterable[T_CogniteResource]]]
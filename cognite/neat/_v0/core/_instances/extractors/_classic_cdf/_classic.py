@@ -1,8 +1,9 @@
+import threading
 import typing
 import urllib.parse
 import warnings
 from collections import defaultdict
-from collections.abc import Generator, Iterable, Sequence
+from collections.abc import Callable, Generator, Iterable, Sequence
 from typing import Any, ClassVar, NamedTuple, cast
 
 from cognite.client import CogniteClient
@@ -25,11 +26,12 @@ from cognite.neat._v0.core._issues.errors import NeatValueError, ResourceNotFoun
 from cognite.neat._v0.core._issues.warnings import CDFAuthWarning, NeatValueWarning
 from cognite.neat._v0.core._shared import Triple
 from cognite.neat._v0.core._utils.collection_ import chunker, iterate_progress_bar
+from cognite.neat._v0.core._utils.concurrency import iterate_concurrently
 from cognite.neat._v0.core._utils.rdf_ import remove_namespace_from_uri
 from cognite.neat._v0.core._utils.text import to_snake_case
 
 from ._assets import AssetsExtractor
-from ._base import ClassicCDFBaseExtractor, InstanceIdPrefix
+from ._base import InstanceIdPrefix
 from ._data_sets import DataSetExtractor
 from ._events import EventsExtractor
 from ._files import FilesExtractor
@@ -89,6 +91,12 @@ class ClassicGraphExtractor(KnowledgeGraphExtractor):
         data_set_external_id (str, optional): The data set external id to extract from. Defaults to None.
         root_asset_external_id (str, optional): The root asset external id to extract from. Defaults to None.
         namespace (Namespace, optional): The namespace to use. Defaults to DEFAULT_NAMESPACE.
+        max_workers (int): Number of threads used to extract the core resource types, relationships, and
+            end nodes concurrently. The items are converted to triples in the worker threads, while the triples
+            are yielded from a single iterator. Defaults to 1, which extracts everything sequentially.
+        partitions (int, optional): If set, the core resource types are fetched with this number of parallel
+            partitioned requests (maximum 10). This is significantly faster for large data sets and hierarchies,
+            but keeps all the resources of a type in memory. Defaults to None, which fetches the resources lazily.
     """
 
     # These are the core resource types in the classic CDF.
@@ -111,6 +119,8 @@ class ClassicGraphExtractor(KnowledgeGraphExtractor):
         identifier: typing.Literal["id", "externalId"] = "id",
         unpack_metadata: bool = False,
         skip_sequence_rows: bool = False,
+        max_workers: int = 1,
+        partitions: int | None = None,
     ):
         self._client = client
         if sum([bool(data_set_external_id), bool(root_asset_external_id)]) != 1:
@@ -131,6 +141,10 @@ class ClassicGraphExtractor(KnowledgeGraphExtractor):
         self._prefix = prefix
         self._limit_per_type = limit_per_type
         self._skip_sequence_rows = skip_sequence_rows
+        self._max_workers = max_workers
+        self._partitions = partitions
+        # Guards the lookups that are updated by the extraction threads.
+        self._lock = threading.Lock()
 
         self._uris_by_external_id_by_type: dict[InstanceIdPrefix, dict[str, URIRef]] = defaultdict(dict)
         self._source_external_ids_by_type: dict[InstanceIdPrefix, set[str]] = defaultdict(set)
@@ -276,29 +290,46 @@ class ClassicGraphExtractor(KnowledgeGraphExtractor):
             raise ValueError("Exactly one of data_set_external_id or root_asset_external_id must be set.")
 
     def _extract_core_start_nodes(self) -> Generator[Triple, None, None]:
-        for core_node in self._classic_node_types:
-            kwargs = self._extractor_args.copy()
-            if core_node.extractor_cls == SequencesExtractor and self._skip_sequence_rows:
-                kwargs["skip_rows"] = True
-
-            if self._data_set_external_id:
-                extractor = core_node.extractor_cls.from_dataset(self._client, self._data_set_external_id, **kwargs)  # type: ignore
-            elif self._root_asset_external_id:
-                extractor = core_node.extractor_cls.from_hierarchy(self._client, self._root_asset_external_id, **kwargs)  # type: ignore
-            else:
-                raise ValueError("Exactly one of data_set_external_id or root_asset_external_id must be set.")
+        core_nodes = list(self._classic_node_types)
+        if self._identifier == "externalId" and core_nodes[0].extractor_cls is AssetsExtractor:
+            # The other resource types look up the asset external ids, thus the assets must be extracted first.
+            yield from self._log_label_dataset(self._iterate_core_start_nodes(core_nodes.pop(0)))
+
+        yield from self._log_label_dataset(
+            iterate_concurrently(
+                [self._iterate_core_start_nodes(core_node) for core_node in core_nodes], max_workers=self._max_workers
+            )
+        )
 
-            if self._identifier == "externalId":
-                if isinstance(extractor, AssetsExtractor):
-                    self._asset_external_ids_by_id = extractor.asset_external_ids_by_id
-                else:
-                    extractor.asset_external_ids_by_id = self._asset_external_ids_by_id
-                extractor.lookup_dataset_external_id = self._lookup_dataset
-            elif self._identifier == "id":
-                extractor._log_urirefs = True
+    def _iterate_core_start_nodes(
+        self, core_node: _ClassicCoreType
+    ) -> Iterable[tuple[InstanceIdPrefix | None, Triple]]:
+        kwargs = self._extractor_args.copy()
+        if core_node.extractor_cls == SequencesExtractor and self._skip_sequence_rows:
+            kwargs["skip_rows"] = True
+        if self._partitions:
+            kwargs["partitions"] = self._partitions
+
+        if self._data_set_external_id:
+            extractor = core_node.extractor_cls.from_dataset(self._client, self._data_set_external_id, **kwargs)  # type: ignore
+        elif self._root_asset_external_id:
+            extractor = core_node.extractor_cls.from_hierarchy(self._client, self._root_asset_external_id, **kwargs)  # type: ignore
+        else:
+            raise ValueError("Exactly one of data_set_external_id or root_asset_external_id must be set.")
+
+        if self._identifier == "externalId":
+            if isinstance(extractor, AssetsExtractor):
+                self._asset_external_ids_by_id = extractor.asset_external_ids_by_id
+            else:
+                extractor.asset_external_ids_by_id = self._asset_external_ids_by_id
+            extractor.lookup_dataset_external_id = self._lookup_dataset
+        elif self._identifier == "id":
+            extractor._log_urirefs = True
 
-            yield from self._extract_with_logging_label_dataset(extractor, core_node.resource_type)
+        for triple in extractor.extract():
+            yield core_node.resource_type, triple
 
+        with self._lock:
             if self._identifier == "id":
                 self._uris_by_external_id_by_type[core_node.resource_type].update(extractor._uriref_by_external_id)
 
@@ -309,71 +340,81 @@ class ClassicGraphExtractor(KnowledgeGraphExtractor):
     def _extract_start_node_relationships(self) -> Generator[Triple, None, None]:
         for start_resource_type, source_external_ids in self._source_external_ids_by_type.items():
             start_type = start_resource_type.removesuffix("_")
-            for chunk in self._chunk(list(source_external_ids), description=f"Extracting {start_type} relationships"):
-                relationship_iterator = self._client.relationships(
-                    source_external_ids=list(chunk), source_types=[start_type]
-                )
-                # this needs some further attention. Duplicated code + untyped dict when unpacking the parameters.
-                # I am deliberately adding type ignore now, needs to be checked later.
-                extractor = RelationshipsExtractor(relationship_iterator, **self._extractor_args)  # type: ignore
-
-                # This is a private attribute, but we need to set it to log the target nodes.
-                extractor._log_target_nodes = True
-                if self._identifier == "id":
-                    extractor._uri_by_external_id_by_type = self._uris_by_external_id_by_type
-                elif self._identifier == "externalId":
-                    extractor.lookup_dataset_external_id = self._lookup_dataset
-
-                yield from extractor.extract()
-
-                # After the extraction is done, we need to update all the new target nodes so
-                # we can extract them in the next step.
-                for end_type, target_external_ids in extractor._target_external_ids_by_type.items():
-                    for external_id in target_external_ids:
-                        # We only want to extract the target nodes that are not already extracted.
-                        # Even though _source_external_ids_by_type is a defaultdict, we have to check if the key exists.
-                        # This is because we might not have extracted any nodes of that type yet, and looking up
-                        # a key that does not exist will create it. We are iterating of this dictionary, and
-                        # we do not want to create new keys while iterating.
-                        if (
-                            end_type not in self._source_external_ids_by_type
-                            or external_id not in self._source_external_ids_by_type[end_type]
-                        ):
-                            self._target_external_ids_by_type[end_type].add(external_id)
-
-                if self._identifier == "id":
-                    # We need to store all future target triples which we will lookup after fetching
-                    # the target nodes.
-                    self._relationship_subject_predicate_type_external_id.extend(extractor._target_triples)
-
-                if isinstance(extractor, AssetsExtractor):
-                    self._asset_parent_uri_by_id.update(extractor.asset_parent_uri_by_id)
-                    self._asset_parent_uri_by_external_id.update(extractor.asset_parent_uri_by_external_id)
+            yield from self._iterate_chunks(
+                lambda chunk, start_type=start_type: self._iterate_relationships(chunk, start_type),  # type: ignore[misc]
+                list(source_external_ids),
+                description=f"Extracting {start_type} relationships",
+            )
+
+    def _iterate_relationships(self, source_external_ids: list[str], start_type: str) -> Iterable[Triple]:
+        relationship_iterator = self._client.relationships(
+            source_external_ids=source_external_ids, source_types=[start_type]
+        )
+        # this needs some further attention. Duplicated code + untyped dict when unpacking the parameters.
+        # I am deliberately adding type ignore now, needs to be checked later.
+        extractor = RelationshipsExtractor(relationship_iterator, **self._extractor_args)  # type: ignore
+
+        # This is a private attribute, but we need to set it to log the target nodes.
+        extractor._log_target_nodes = True
+        if self._identifier == "id":
+            extractor._uri_by_external_id_by_type = self._uris_by_external_id_by_type
+        elif self._identifier == "externalId":
+            extractor.lookup_dataset_external_id = self._lookup_dataset
+
+        yield from extractor.extract()
+
+        with self._lock:
+            # After the extraction is done, we need to update all the new target nodes so
+            # we can extract them in the next step.
+            for end_type, target_external_ids in extractor._target_external_ids_by_type.items():
+                for external_id in target_external_ids:
+                    # We only want to extract the target nodes that are not already extracted.
+                    # Even though _source_external_ids_by_type is a defaultdict, we have to check if the key exists.
+                    # This is because we might not have extracted any nodes of that type yet, and looking up
+                    # a key that does not exist will create it. We are iterating of this dictionary, and
+                    # we do not want to create new keys while iterating.
+                    if (
+                        end_type not in self._source_external_ids_by_type
+                        or external_id not in self._source_external_ids_by_type[end_type]
+                    ):
+                        self._target_external_ids_by_type[end_type].add(external_id)
+
+            if self._identifier == "id":
+                # We need to store all future target triples which we will lookup after fetching
+                # the target nodes.
+                self._relationship_subject_predicate_type_external_id.extend(extractor._target_triples)
 
     def _extract_core_end_nodes(self) -> Generator[Triple, None, None]:
         for core_node in self._classic_node_types:
             target_external_ids = self._target_external_ids_by_type[core_node.resource_type]
-            api = getattr(self._client, core_node.api_name)
-            for chunk in self._chunk(
-                list(target_external_ids),
-                description=f"Extracting end nodes {core_node.resource_type.removesuffix('_')}",
-            ):
-                # TO DO: this should be typed.
-                resource_iterator = api.retrieve_multiple(external_ids=list(chunk), ignore_unknown_ids=True)
+            yield from self._log_label_dataset(
+                (None, triple)
+                for triple in self._iterate_chunks(
+                    lambda chunk, core_node=core_node: self._iterate_core_end_nodes(chunk, core_node),  # type: ignore[misc]
+                    list(target_external_ids),
+                    description=f"Extracting end nodes {core_node.resource_type.removesuffix('_')}",
+                )
+            )
 
-                # this needs some further attention. Duplicated code + untyped dict when unpacking the parameters.
-                # I am deliberately adding type ignore now, needs to be checked later.
-                extractor = core_node.extractor_cls(resource_iterator, **self._extractor_args)  # type: ignore
+    def _iterate_core_end_nodes(self, external_ids: list[str], core_node: _ClassicCoreType) -> Iterable[Triple]:
+        api = getattr(self._client, core_node.api_name)
+        # TO DO: this should be typed.
+        resource_iterator = api.retrieve_multiple(external_ids=external_ids, ignore_unknown_ids=True)
 
-                extractor.asset_external_ids_by_id = self._asset_external_ids_by_id
-                extractor.lookup_dataset_external_id = self._lookup_dataset
-                if self._identifier == "id":
-                    extractor._log_urirefs = True
+        # this needs some further attention. Duplicated code + untyped dict when unpacking the parameters.
+        # I am deliberately adding type ignore now, needs to be checked later.
+        extractor = core_node.extractor_cls(resource_iterator, **self._extractor_args)  # type: ignore
+
+        extractor.asset_external_ids_by_id = self._asset_external_ids_by_id
+        extractor.lookup_dataset_external_id = self._lookup_dataset
+        if self._identifier == "id":
+            extractor._log_urirefs = True
 
-                yield from self._extract_with_logging_label_dataset(extractor)
+        yield from extractor.extract()
 
-                if self._identifier == "id":
-                    self._uris_by_external_id_by_type[core_node.resource_type].update(extractor._uriref_by_external_id)
+        if self._identifier == "id":
+            with self._lock:
+                self._uris_by_external_id_by_type[core_node.resource_type].update(extractor._uriref_by_external_id)
 
     def _extract_relationship_target_triples(self) -> Generator[tuple[URIRef, URIRef, URIRef], None, None]:
         for id_, predicate, type_, external_id in self._relationship_subject_predicate_type_external_id:
@@ -442,10 +483,11 @@ class ClassicGraphExtractor(KnowledgeGraphExtractor):
                             object_,
                         )
 
-    def _extract_with_logging_label_dataset(
-        self, extractor: ClassicCDFBaseExtractor, resource_type: InstanceIdPrefix | None = None
+    def _log_label_dataset(
+        self, triples_with_resource_type: Iterable[tuple[InstanceIdPrefix | None, Triple]]
     ) -> Iterable[Triple]:
-        for triple in extractor.extract():
+        # This runs in the consuming thread, thus the logged sets do not need to be guarded by the lock.
+        for resource_type, triple in triples_with_resource_type:
             if triple[1] == self._namespace.externalId and resource_type is not None:
                 self._source_external_ids_by_type[resource_type].add(remove_namespace_from_uri(triple[2]))
             elif triple[1] == self._namespace.labels:
@@ -458,6 +500,19 @@ class ClassicGraphExtractor(KnowledgeGraphExtractor):
                     self._data_set_external_ids.add(identifier)
             yield triple
 
+    def _iterate_chunks(
+        self, chunk_to_triples: Callable[[list[str]], Iterable[Triple]], items: list[str], description: str
+    ) -> Iterable[Triple]:
+        """Extracts the items in chunks of 1000, concurrently if max_workers is above 1."""
+        if self._max_workers <= 1:
+            for chunk in self._chunk(items, description=description):
+                yield from chunk_to_triples(list(chunk))
+        else:
+            yield from iterate_concurrently(
+                [chunk_to_triples(list(chunk)) for chunk in chunker(items, chunk_size=1000)],
+                max_workers=self._max_workers,
+            )
+
     @staticmethod
     def _chunk(items: Sequence, description: str) -> Iterable:
         to_iterate: Iterable = chunker(items, chunk_size=1000)
@@ -19,13 +19,14 @@ class DataSetExtractor(ClassicCDFBaseExtractor[DataSet]):
         cls,
         client: CogniteClient,
         data_set_external_id: SequenceNotStr[str],  # type: ignore[override]
+        partitions: int | None = None,
     ) -> tuple[int | None, Iterable[DataSet]]:
         items = client.data_sets.retrieve_multiple(external_ids=data_set_external_id)
         return len(items), items
 
     @classmethod
     def _from_hierarchy(
-        cls, client: CogniteClient, root_asset_external_id: str
+        cls, client: CogniteClient, root_asset_external_id: str, partitions: int | None = None
     ) -> tuple[int | None, Iterable[T_CogniteResource]]:
         raise NotImplementedError("DataSets do not have a hierarchy.")
 
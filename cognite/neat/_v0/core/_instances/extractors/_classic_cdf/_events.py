@@ -14,17 +14,21 @@ class EventsExtractor(ClassicCDFBaseExtractor[Event]):
     _instance_id_prefix = InstanceIdPrefix.event
 
     @classmethod
-    def _from_dataset(cls, client: CogniteClient, data_set_external_id: str) -> tuple[int | None, Iterable[Event]]:
+    def _from_dataset(
+        cls, client: CogniteClient, data_set_external_id: str, partitions: int | None = None
+    ) -> tuple[int | None, Iterable[Event]]:
         total = client.events.aggregate_count(filter=EventFilter(data_set_ids=[{"externalId": data_set_external_id}]))
-        items = client.events(data_set_external_ids=data_set_external_id)
+        items = cls._list_resources(client.events, partitions, data_set_external_ids=data_set_external_id)
         return total, items
 
     @classmethod
-    def _from_hierarchy(cls, client: CogniteClient, root_asset_external_id: str) -> tuple[int | None, Iterable[Event]]:
+    def _from_hierarchy(
+        cls, client: CogniteClient, root_asset_external_id: str, partitions: int | None = None
+    ) -> tuple[int | None, Iterable[Event]]:
         total = client.events.aggregate_count(
             filter=EventFilter(asset_subtree_ids=[{"externalId": root_asset_external_id}])
         )
-        items = client.events(asset_subtree_external_ids=[root_asset_external_id])
+        items = cls._list_resources(client.events, partitions, asset_subtree_external_ids=[root_asset_external_id])
         return total, items
 
     @classmethod
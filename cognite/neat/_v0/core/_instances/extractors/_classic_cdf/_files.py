@@ -18,18 +18,19 @@ class FilesExtractor(ClassicCDFBaseExtractor[FileMetadata]):
         cls,
         client: CogniteClient,
         data_set_external_id: str,
+        partitions: int | None = None,
     ) -> tuple[int | None, Iterable[FileMetadata]]:
-        items = client.files(data_set_external_ids=data_set_external_id)
+        items = cls._list_resources(client.files, partitions, data_set_external_ids=data_set_external_id)
         return None, cls._filter_out_instance_id(items)
 
     @classmethod
     def _from_hierarchy(
-        cls, client: CogniteClient, root_asset_external_id: str
+        cls, client: CogniteClient, root_asset_external_id: str, partitions: int | None = None
     ) -> tuple[int | None, Iterable[FileMetadata]]:
         total = client.files.aggregate(
             filter=FileMetadataFilter(asset_subtree_ids=[{"externalId": root_asset_external_id}])
         )[0].count
-        items = client.files(asset_subtree_external_ids=root_asset_external_id)
+        items = cls._list_resources(client.files, partitions, asset_subtree_external_ids=root_asset_external_id)
         return total, cls._filter_out_instance_id(items)
 
     @classmethod
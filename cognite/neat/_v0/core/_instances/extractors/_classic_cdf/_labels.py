@@ -16,14 +16,14 @@ class LabelsExtractor(ClassicCDFBaseExtractor[LabelDefinition]):
 
     @classmethod
     def _from_dataset(
-        cls, client: CogniteClient, data_set_external_id: str
+        cls, client: CogniteClient, data_set_external_id: str, partitions: int | None = None
     ) -> tuple[int | None, Iterable[LabelDefinition]]:
         items = client.labels(data_set_external_ids=data_set_external_id)
         return None, items
 
     @classmethod
     def _from_hierarchy(
-        cls, client: CogniteClient, root_asset_external_id: str
+        cls, client: CogniteClient, root_asset_external_id: str, partitions: int | None = None
     ) -> tuple[int | None, Iterable[T_CogniteResource]]:
         raise NotImplementedError("Hierarchy is not supported for labels")
 
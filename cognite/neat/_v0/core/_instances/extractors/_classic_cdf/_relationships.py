@@ -101,13 +101,14 @@ class RelationshipsExtractor(ClassicCDFBaseExtractor[Relationship]):
         cls,
         client: CogniteClient,
         data_set_external_id: str,
+        partitions: int | None = None,
     ) -> tuple[int | None, Iterable[Relationship]]:
-        items = client.relationships(data_set_external_ids=data_set_external_id)
+        items = cls._list_resources(client.relationships, partitions, data_set_external_ids=data_set_external_id)
         return None, items
 
     @classmethod
     def _from_hierarchy(
-        cls, client: CogniteClient, root_asset_external_id: str
+        cls, client: CogniteClient, root_asset_external_id: str, partitions: int | None = None
     ) -> tuple[int | None, Iterable[T_CogniteResource]]:
         raise NotImplementedError("Relationships do not have a hierarchy.")
 
@@ -89,8 +89,11 @@ class SequencesExtractor(ClassicCDFBaseExtractor[NeatSequence]):
         identifier: typing.Literal["id", "externalId"] = "id",
         unpack_columns: bool = False,
         skip_rows: bool = False,
+        partitions: int | None = None,
     ) -> Self:
-        total, items = cls._handle_no_access(lambda: cls._from_dataset(client, data_set_external_id, skip_rows))
+        total, items = cls._handle_no_access(
+            lambda: cls._from_dataset(client, data_set_external_id, partitions, skip_rows)
+        )
         return cls(
             items,
             namespace,
@@ -120,8 +123,11 @@ class SequencesExtractor(ClassicCDFBaseExtractor[NeatSequence]):
         identifier: typing.Literal["id", "externalId"] = "id",
         unpack_columns: bool = False,
         skip_rows: bool = False,
+        partitions: int | None = None,
     ) -> ClassicCDFBaseExtractor:
-        total, items = cls._handle_no_access(lambda: cls._from_hierarchy(client, root_asset_external_id, skip_rows))
+        total, items = cls._handle_no_access(
+            lambda: cls._from_hierarchy(client, root_asset_external_id, partitions, skip_rows)
+        )
         return cls(
             items,
             namespace,
@@ -167,12 +173,16 @@ class SequencesExtractor(ClassicCDFBaseExtractor[NeatSequence]):
 
     @classmethod
     def _from_dataset(
-        cls, client: CogniteClient, data_set_external_id: str, skip_rows: bool = False
+        cls,
+        client: CogniteClient,
+        data_set_external_id: str,
+        partitions: int | None = None,
+        skip_rows: bool = False,
     ) -> tuple[int | None, Iterable[NeatSequence]]:
         total = client.sequences.aggregate_count(
             filter=SequenceFilter(data_set_ids=[{"externalId": data_set_external_id}])
         )
-        items = client.sequences(data_set_external_ids=data_set_external_id)
+        items = cls._list_resources(client.sequences, partitions, data_set_external_ids=data_set_external_id)
         if skip_rows:
             return total, (NeatSequence.from_cognite_sequence(seq) for seq in items)
         else:
@@ -180,12 +190,16 @@ class SequencesExtractor(ClassicCDFBaseExtractor[NeatSequence]):
 
     @classmethod
     def _from_hierarchy(
-        cls, client: CogniteClient, root_asset_external_id: str, skip_rows: bool = False
+        cls,
+        client: CogniteClient,
+        root_asset_external_id: str,
+        partitions: int | None = None,
+        skip_rows: bool = False,
     ) -> tuple[int | None, Iterable[NeatSequence]]:
         total = client.sequences.aggregate_count(
             filter=SequenceFilter(asset_subtree_ids=[{"externalId": root_asset_external_id}])
         )
-        items = client.sequences(asset_subtree_external_ids=[root_asset_external_id])
+        items = cls._list_resources(client.sequences, partitions, asset_subtree_external_ids=[root_asset_external_id])
         if skip_rows:
             return total, (NeatSequence.from_cognite_sequence(seq) for seq in items)
         else:
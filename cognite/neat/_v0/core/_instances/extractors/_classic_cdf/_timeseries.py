@@ -18,21 +18,22 @@ class TimeSeriesExtractor(ClassicCDFBaseExtractor[TimeSeries]):
         cls,
         client: CogniteClient,
         data_set_external_id: str,
+        partitions: int | None = None,
     ) -> tuple[int | None, Iterable[TimeSeries]]:
         total = client.time_series.aggregate_count(
             filter=TimeSeriesFilter(data_set_ids=[{"externalId": data_set_external_id}])
         )
-        items = client.time_series(data_set_external_ids=data_set_external_id)
+        items = cls._list_resources(client.time_series, partitions, data_set_external_ids=data_set_external_id)
         return total, cls._filter_out_instance_id(items)
 
     @classmethod
     def _from_hierarchy(
-        cls, client: CogniteClient, root_asset_external_id: str
+        cls, client: CogniteClient, root_asset_external_id: str, partitions: int | None = None
     ) -> tuple[int | None, Iterable[TimeSeries]]:
         total = client.time_series.aggregate_count(
             filter=TimeSeriesFilter(asset_subtree_ids=[{"externalId": root_asset_external_id}])
         )
-        items = client.time_series(asset_subtree_external_ids=root_asset_external_id)
+        items = cls._list_resources(client.time_series, partitions, asset_subtree_external_ids=root_asset_external_id)
         return total, cls._filter_out_instance_id(items)
 
     @classmethod
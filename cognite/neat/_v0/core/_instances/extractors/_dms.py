@@ -1,3 +1,5 @@
+import itertools
+import threading
 import typing
 import urllib.parse
 from collections.abc import Callable, Iterable, Iterator, Set
@@ -15,6 +17,7 @@ from cognite.neat._v0.core._constants import DEFAULT_SPACE_URI, is_readonly_prop
 from cognite.neat._v0.core._issues.errors import ResourceRetrievalError
 from cognite.neat._v0.core._shared import Triple
 from cognite.neat._v0.core._utils.collection_ import iterate_progress_bar
+from cognite.neat._v0.core._utils.concurrency import iterate_concurrently, map_concurrently
 
 from ._base import BaseExtractor
 from ._dict import DEFAULT_EMPTY_VALUES, DMSPropertyExtractor
@@ -37,6 +40,10 @@ class DMSExtractor(BaseExtractor):
             means the externalId of the view used as type, while type is the node.type.
         edge_type: The prioritized order of the edge type to use. The options are "view" and "type". "view"
             means the externalId of the view used as type, while type is the edge.type.
+        max_workers: The number of instance streams to download in parallel. The streams are the nodes, edges,
+            and edge types of each view. If 1, the views are extracted one by one.
+        buffer_size: If max_workers is above 1, the maximum number of downloaded instances, in chunks of 100,
+            held in memory before they are converted to triples.
     """
 
     def __init__(
@@ -49,6 +56,8 @@ class DMSExtractor(BaseExtractor):
         str_to_ideal_type: bool = False,
         node_type: tuple[typing.Literal["view", "type"], ...] = ("view",),
         edge_type: tuple[typing.Literal["view", "type"], ...] = ("view", "type"),
+        max_workers: int = 1,
+        buffer_size: int = 100,
     ) -> None:
         self.total_instances_pair_by_view = total_instances_pair_by_view
         self.limit = limit
@@ -58,6 +67,8 @@ class DMSExtractor(BaseExtractor):
         self.str_to_ideal_type = str_to_ideal_type
         self.node_type = node_type
         self.edge_type = edge_type
+        self.max_workers = max_workers
+        self.buffer_size = buffer_size
 
     @classmethod
     def from_data_model(
@@ -69,6 +80,7 @@ class DMSExtractor(BaseExtractor):
         instance_space: str | SequenceNotStr[str] | None = None,
         unpack_json: bool = False,
         str_to_ideal_type: bool = False,
+        max_workers: int = 1,
     ) -> "DMSExtractor":
         """Create an extractor from a data model.
 
@@ -79,6 +91,7 @@ class DMSExtractor(BaseExtractor):
             overwrite_namespace: If provided, this will overwrite the space of the extracted items.
             instance_space: The space to extract instances from.
             unpack_json: If True, JSON objects will be unpacked into RDF literals.
+            max_workers: The number of instance streams to download in parallel.
         """
         retrieved = client.data_modeling.data_models.retrieve(data_model, inline_views=True)
         if not retrieved:
@@ -91,6 +104,7 @@ class DMSExtractor(BaseExtractor):
             instance_space,
             unpack_json,
             str_to_ideal_type,
+            max_workers,
         )
 
     @classmethod
@@ -103,6 +117,7 @@ class DMSExtractor(BaseExtractor):
         instance_space: str | SequenceNotStr[str] | None = None,
         unpack_json: bool = False,
         str_to_ideal_type: bool = False,
+        max_workers: int = 1,
     ) -> "DMSExtractor":
         """Create an extractor from a set of views.
 
@@ -115,11 +130,28 @@ class DMSExtractor(BaseExtractor):
             unpack_json: If True, JSON objects will be unpacked into RDF literals.
             str_to_ideal_type: If True, when unpacking JSON objects, if the value is a string, the extractor will try to
                 convert it to the ideal type.
+            max_workers: The number of instance streams to download in parallel. This is also used to count the
+                instances of the views in parallel.
+
+        !!! note "Edge types"
+            Edges without properties are downloaded per edge type. If several views have an edge connection with
+            the same edge type, the edges are only downloaded for the first view with instances.
         """
-        total_instances_pair_by_view: dict[dm.ViewId, tuple[int | None, Iterable[Instance]]] = {}
-        for view in views:
-            instance_iterator = _ViewInstanceIterator(client, view, instance_space)
-            total_instances_pair_by_view[view.as_id()] = (instance_iterator.count, instance_iterator)
+        instance_iterators = [_ViewInstanceIterator(client, view, instance_space) for view in views]
+        counts = list(map_concurrently(lambda iterator: iterator.count, instance_iterators, max_workers))
+
+        # Views without instances are skipped by extract, thus, the edge types are assigned to views with instances.
+        seen_edge_types: set[dm.DirectRelationReference] = set()
+        for instance_iterator, count in zip(instance_iterators, counts, strict=True):
+            if count == 0:
+                continue
+            instance_iterator.skip_edge_types = seen_edge_types
+            seen_edge_types = seen_edge_types | instance_iterator.edge_types
+
+        total_instances_pair_by_view: dict[dm.ViewId, tuple[int | None, Iterable[Instance]]] = {
+            instance_iterator.view.as_id(): (count, instance_iterator)
+            for instance_iterator, count in zip(instance_iterators, counts, strict=True)
+        }
 
         return cls(
             total_instances_pair_by_view=total_instances_pair_by_view,
@@ -127,6 +159,7 @@ class DMSExtractor(BaseExtractor):
             overwrite_namespace=overwrite_namespace,
             unpack_json=unpack_json,
             str_to_ideal_type=str_to_ideal_type,
+            max_workers=max_workers,
         )
 
     def extract(self) -> Iterable[Triple]:
@@ -134,6 +167,9 @@ class DMSExtractor(BaseExtractor):
         use_progress_bar = (
             GLOBAL_CONFIG.use_iterate_bar_threshold and total_instances > GLOBAL_CONFIG.use_iterate_bar_threshold
         )
+        if self.max_workers > 1:
+            yield from self._extract_concurrently(total_instances, bool(use_progress_bar))
+            return
 
         for view_id, (total, instances) in self.total_instances_pair_by_view.items():
             if total == 0:
@@ -150,6 +186,29 @@ class DMSExtractor(BaseExtractor):
                     break
                 yield from self._extract_instance(item)
 
+    def _extract_concurrently(self, total_instances: int, use_progress_bar: bool) -> Iterable[Triple]:
+        """Downloads the instance streams of all views in parallel and merges them into one triple stream."""
+        streams: list[Iterable[Instance]] = []
+        for total, instances in self.total_instances_pair_by_view.values():
+            if total == 0:
+                continue
+            view_streams = instances.streams() if isinstance(instances, _ViewInstanceIterator) else [instances]
+            if self.limit:
+                # The limit is per view, shared by all streams of the view.
+                view_limit = _InstanceLimit(self.limit)
+                view_streams = [view_limit.apply(stream) for stream in view_streams]
+            streams.extend(view_streams)
+
+        instances_iterable: Iterable[Instance] = iterate_concurrently(
+            streams, max_workers=self.max_workers, buffer_size=self.buffer_size
+        )
+        if use_progress_bar:
+            instances_iterable = iterate_progress_bar(
+                instances_iterable, total_instances, f"Extracting instances from {len(streams)} streams"
+            )
+        for instance in instances_iterable:
+            yield from self._extract_instance(instance)
+
     def _extract_instance(self, instance: Instance) -> Iterable[Triple]:
         if isinstance(instance, dm.Edge):
             if not instance.properties:
@@ -236,11 +295,49 @@ class DMSExtractor(BaseExtractor):
         return Namespace(DEFAULT_SPACE_URI.format(space=urllib.parse.quote(space)))
 
 
+class _InstanceLimit:
+    """Thread-safe limit on the number of instances shared by several instance streams."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def _take(self) -> bool:
+        with self._lock:
+            if self._count >= self.limit:
+                return False
+            self._count += 1
+            return True
+
+    def apply(self, instances: Iterable[Instance]) -> Iterable[Instance]:
+        for instance in instances:
+            if not self._take():
+                break
+            yield instance
+
+
 class _ViewInstanceIterator(Iterable[Instance]):
-    def __init__(self, client: NeatClient, view: dm.View, instance_space: str | SequenceNotStr[str] | None = None):
+    def __init__(
+        self,
+        client: NeatClient,
+        view: dm.View,
+        instance_space: str | SequenceNotStr[str] | None = None,
+        skip_edge_types: Set[dm.DirectRelationReference] = frozenset(),
+    ):
         self.client = client
         self.view = view
         self.instance_space = instance_space
+        self.skip_edge_types = skip_edge_types
+
+    @property
+    def edge_types(self) -> set[dm.DirectRelationReference]:
+        """Edge types of the edge connections without edge source, these are downloaded per edge type."""
+        return {
+            prop.type
+            for prop in self.view.properties.values()
+            if isinstance(prop, dm.EdgeConnection) and not prop.edge_source
+        }
 
     @cached_property
     def count(self) -> int:
@@ -266,6 +363,34 @@ class _ViewInstanceIterator(Iterable[Instance]):
         return node_count + edge_count
 
     def __iter__(self) -> Iterator[Instance]:
+        return itertools.chain.from_iterable(self.streams())
+
+    def streams(self) -> list[Iterable[Instance]]:
+        """The independent instance streams of the view.
+
+        These are the nodes, the edges with properties, and the edges of each edge type. The streams
+        are lazy, nothing is downloaded before they are iterated.
+        """
+        streams: list[Iterable[Instance]] = []
+        # All nodes and edges with properties
+        if self.view.used_for in ("node", "all"):
+            streams.append(self._iterate_nodes())
+        if self.view.used_for in ("edge", "all"):
+            streams.append(self._iterate_edges())
+        seen_edge_types: set[dm.DirectRelationReference] = set()
+        for prop in self.view.properties.values():
+            if isinstance(prop, dm.EdgeConnection):
+                if prop.edge_source:
+                    # All edges with properties are extracted from the edge source
+                    continue
+                if prop.type in self.skip_edge_types or prop.type in seen_edge_types:
+                    # Already extracted by another view or another property.
+                    continue
+                seen_edge_types.add(prop.type)
+                streams.append(self._iterate_edges_of_type(prop.type))
+        return streams
+
+    def _iterate_nodes(self) -> Iterable[Instance]:
         view_id = self.view.as_id()
         read_only_properties = {
             prop_id
@@ -273,36 +398,30 @@ class _ViewInstanceIterator(Iterable[Instance]):
             if isinstance(prop, dm.MappedProperty)
             and is_readonly_property(prop.container, prop.container_property_identifier)
         }
-        # All nodes and edges with properties
-        if self.view.used_for in ("node", "all"):
-            node_iterable: Iterable[Instance] = self.client.instances.iterate(
-                instance_type="node",
-                source=view_id,
-                space=self.instance_space,
-            )
-            if read_only_properties:
-                node_iterable = self._remove_read_only_properties(node_iterable, read_only_properties, view_id)
-            yield from node_iterable
+        node_iterable: Iterable[Instance] = self.client.instances.iterate(
+            instance_type="node",
+            source=view_id,
+            space=self.instance_space,
+        )
+        if read_only_properties:
+            node_iterable = self._remove_read_only_properties(node_iterable, read_only_properties, view_id)
+        yield from node_iterable
 
-        if self.view.used_for in ("edge", "all"):
-            yield from self.client.instances.iterate(
-                instance_type="edge",
-                source=view_id,
-                space=self.instance_space,
-            )
+    def _iterate_edges(self) -> Iterable[Instance]:
+        yield from self.client.instances.iterate(
+            instance_type="edge",
+            source=self.view.as_id(),
+            space=self.instance_space,
+        )
 
-        for prop in self.view.properties.values():
-            if isinstance(prop, dm.EdgeConnection):
-                if prop.edge_source:
-                    # All edges with properties are extracted from the edge source
-                    continue
-                yield from self.client.instances.iterate(
-                    instance_type="edge",
-                    filter_=dm.filters.Equals(
-                        ["edge", "type"], {"space": prop.type.space, "externalId": prop.type.external_id}
-                    ),
-                    space=self.instance_space,
-                )
+    def _iterate_edges_of_type(self, edge_type: dm.DirectRelationReference) -> Iterable[Instance]:
+        yield from self.client.instances.iterate(
+            instance_type="edge",
+            filter_=dm.filters.Equals(
+                ["edge", "type"], {"space": edge_type.space, "externalId": edge_type.external_id}
+            ),
+            space=self.instance_space,
+        )
 
     @staticmethod
     def _remove_read_only_properties(
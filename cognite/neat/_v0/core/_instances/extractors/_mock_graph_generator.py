@@ -2,12 +2,15 @@
 It is a bit ugly and needs some proper refactoring, but it is not a priority at the moment.
 """
 
+import itertools
 import random
 import warnings
 from collections import OrderedDict
-from typing import cast
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, cast, overload
 
-import numpy
 import pandas as pd
 from rdflib import RDF, Literal, Namespace, URIRef
 
@@ -19,10 +22,22 @@ from cognite.neat._v0.core._data_model.models.data_types import DataType
 from cognite.neat._v0.core._data_model.models.entities import ConceptEntity
 from cognite.neat._v0.core._data_model.transformers import SubsetConceptualDataModel
 from cognite.neat._v0.core._shared import Triple
-from cognite.neat._v0.core._utils.rdf_ import remove_namespace_from_uri
+from cognite.neat._v0.core._utils.rdf_ import to_ntriples_row
 
 from ._base import BaseExtractor
 
+# Generates the value of a data property for the instance with the given (zero-based) number.
+ValueGenerator = Callable[[random.Random, int], Any]
+
+_EPOCH = datetime(2000, 1, 1, tzinfo=timezone.utc)
+_DEFAULT_VALUE_GENERATOR_BY_TYPE: dict[type, ValueGenerator] = {
+    int: lambda rng, _: rng.randint(1, 1983),
+    float: lambda rng, _: round(rng.uniform(1, 1983), 3),
+    bool: lambda rng, _: rng.random() < 0.5,
+    datetime: lambda rng, _: _EPOCH + timedelta(seconds=rng.randrange(25 * 365 * 24 * 3600)),
+    date: lambda rng, _: _EPOCH.date() + timedelta(days=rng.randrange(25 * 365)),
+}
+
 
 class MockGraphGenerator(BaseExtractor):
     """
@@ -34,6 +49,17 @@ class MockGraphGenerator(BaseExtractor):
         stop_on_exception: To stop if exception is encountered or not, default is False
         allow_isolated_classes: To allow generation of instances for classes that are not
                                  connected to any other class, default is True
+        seed: Seed of the random values and connections. The same seed, data model and counts give the same
+            triples. Defaults to None, which gives different values on every run.
+        max_fan_out: Maximum number of instances an instance connects to through a single object property
+            that allows several values. The number of connections follows a power law, most instances have
+            one connection and few have many. Defaults to 1, that is, every instance connects to one instance.
+        value_generators: Generators of data property values by Python type, for example, `{int: lambda
+            rng, no: rng.randint(0, 10)}`, overriding the default uniformly distributed values.
+
+    The triples are generated lazily, instance by instance, thus the generator can produce graphs that do
+    not fit in memory. Use `write_to_file` to dump them as N-Triples, which is the fastest format to bulk
+    load into the Oxigraph store with the RdfFileExtractor.
     """
 
     def __init__(
@@ -42,6 +68,9 @@ class MockGraphGenerator(BaseExtractor):
         concept_count: dict[str | ConceptEntity, int] | None = None,
         stop_on_exception: bool = False,
         allow_isolated_classes: bool = True,
+        seed: int | None = None,
+        max_fan_out: int = 1,
+        value_generators: dict[type, ValueGenerator] | None = None,
     ):
         if isinstance(data_model, PhysicalDataModel):
             # fixes potential issues with circular dependencies
@@ -55,7 +84,8 @@ class MockGraphGenerator(BaseExtractor):
 
         if not concept_count:
             self.concept_count = {
-                concept: 1 for concept in DataModelAnalysis(self.data_model).defined_concepts(include_ancestors=True)
+                concept: 1
+                for concept in DataModelAnalysis.cached(self.data_model).defined_concepts(include_ancestors=True)
             }
         elif all(isinstance(key, str) for key in concept_count.keys()):
             self.concept_count = {
@@ -69,21 +99,48 @@ class MockGraphGenerator(BaseExtractor):
 
         self.stop_on_exception = stop_on_exception
         self.allow_isolated_classes = allow_isolated_classes
+        if max_fan_out < 1:
+            raise ValueError("Max fan out must be at least 1!")
+        self.seed = seed
+        self.max_fan_out = max_fan_out
+        self.value_generators = value_generators or {}
 
-    def extract(self) -> list[Triple]:
+    def extract(self) -> Iterable[Triple]:
         """Generate mock triples based on data model and desired number
         of concept instances
 
         Returns:
-            List of RDF triples, represented as tuples `(subject, predicate, object)`, that define data model instances
+            Iterable of RDF triples, represented as tuples `(subject, predicate, object)`, that define data model
+            instances
         """
-        return generate_triples(
+        return iterate_triples(
             self.data_model,
             self.concept_count,
             stop_on_exception=self.stop_on_exception,
             allow_isolated_concepts=self.allow_isolated_classes,
+            seed=self.seed,
+            max_fan_out=self.max_fan_out,
+            value_generators=self.value_generators,
         )
 
+    def write_to_file(self, filepath: Path, batch_size: int = 10_000) -> int:
+        """Writes the mock triples to an N-Triples file without holding them in memory.
+
+        Args:
+            filepath: The file to write to.
+            batch_size: Number of triples written at once.
+
+        Returns:
+            The number of triples written.
+        """
+        triple_count = 0
+        triples = iter(self.extract())
+        with filepath.open("w", encoding="utf-8") as file:
+            while batch := list(itertools.islice(triples, batch_size)):
+                file.write("".join(map(to_ntriples_row, batch)))
+                triple_count += len(batch)
+        return triple_count
+
 
 def generate_triples(
     data_model: ConceptualDataModel,
@@ -104,9 +161,38 @@ def generate_triples(
     Returns:
         List of RDF triples, represented as tuples `(subject, predicate, object)`, that define data model instances
     """
+    return list(iterate_triples(data_model, concept_count, stop_on_exception, allow_isolated_concepts))
+
+
+def iterate_triples(
+    data_model: ConceptualDataModel,
+    concept_count: dict[ConceptEntity, int],
+    stop_on_exception: bool = False,
+    allow_isolated_concepts: bool = True,
+    seed: int | None = None,
+    max_fan_out: int = 1,
+    value_generators: dict[type, ValueGenerator] | None = None,
+) -> Iterator[Triple]:
+    """Lazily generate mock triples based on the conceptual data model defined and desired number
+    of class instances
+
+    Args:
+        data_model : Data model
+        concept_count: Target concept count for each class in the data model
+        stop_on_exception: To stop if exception is encountered or not, default is False
+        allow_isolated_concepts: To allow generation of instances for classes that are not
+                                 connected to any other class, default is True
+        seed: Seed of the random values and connections, default is None
+        max_fan_out: Maximum number of connections per instance and object property, default is 1
+        value_generators: Generators of data property values by Python type, default is None
+
+    Returns:
+        Iterator over RDF triples, represented as tuples `(subject, predicate, object)`, that define data model
+        instances
+    """
 
     namespace = data_model.metadata.namespace
-    analysis = DataModelAnalysis(data_model)
+    analysis = DataModelAnalysis.cached(data_model)
     defined_concepts = analysis.defined_concepts(include_ancestors=True)
 
     if non_existing_concepts := set(concept_count.keys()) - defined_concepts:
@@ -130,6 +216,11 @@ def generate_triples(
     )
 
     concept_linkage = analysis.concept_linkage().to_pandas()
+    if concept_linkage.empty:
+        # No object properties, thus no columns either
+        concept_linkage = pd.DataFrame(
+            columns=["source_concept", "connecting_property", "target_concept", "max_occurrence"]
+        )
 
     # Remove one of symmetric pairs from class linkage to maintain proper linking
     # among instances of symmetrically linked classes
@@ -145,49 +236,90 @@ def generate_triples(
     # Generated simple view of data model
     properties_by_concepts = analysis.properties_by_concepts(include_ancestors=True)
 
-    # pregenerate instance ids for each remaining class
-    instance_ids = {
-        key: [URIRef(namespace[f"{key.suffix}-{i + 1}"]) for i in range(value)] for key, value in concept_count.items()
-    }
+    # instance ids for each remaining class, these are created when they are used
+    instance_ids = {key: _InstanceIds(namespace, key.suffix, value) for key, value in concept_count.items()}
+    options = _GenerationOptions(seed, max_fan_out, {**_DEFAULT_VALUE_GENERATOR_BY_TYPE, **(value_generators or {})})
 
     # create triple for each class instance defining its type
-    triples: list[Triple] = []
     for concept in concept_count:
-        triples += [
-            (concept_instance_id, RDF.type, URIRef(namespace[str(concept.suffix)]))
-            for concept_instance_id in instance_ids[concept]
-        ]
+        concept_type = URIRef(namespace[str(concept.suffix)])
+        for concept_instance_id in instance_ids[concept]:
+            yield concept_instance_id, RDF.type, concept_type
 
     # generate triples for connected classes
     for concept in generation_order:
-        triples += _generate_triples_per_class(
+        yield from _generate_triples_per_class(
             concept,
             properties_by_concepts,
             sym_pairs,
             instance_ids,
             namespace,
             stop_on_exception,
+            options,
         )
 
-    # generate triples for isolated classes
+    # generate triples for isolated classes, sorted such that the same seed gives the same triples
     if allow_isolated_concepts:
-        for concept in set(concept_count.keys()) - set(generation_order):
-            triples += _generate_triples_per_class(
+        for concept in sorted(set(concept_count.keys()) - set(generation_order), key=str):
+            yield from _generate_triples_per_class(
                 concept,
                 properties_by_concepts,
                 sym_pairs,
                 instance_ids,
                 namespace,
                 stop_on_exception,
+                options,
             )
 
-    return triples
+
+class _InstanceIds(Sequence[URIRef]):
+    """The ids of the instances of a concept, created on demand instead of being held in memory."""
+
+    def __init__(self, namespace: Namespace, suffix: str, count: int) -> None:
+        self._prefix = f"{namespace}{suffix}-"
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    @overload
+    def __getitem__(self, index: int) -> URIRef: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[URIRef]: ...
+
+    def __getitem__(self, index: int | slice) -> URIRef | list[URIRef]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if not -self._count <= index < self._count:
+            raise IndexError(index)
+        return URIRef(f"{self._prefix}{index % self._count + 1}")
+
+    def __iter__(self) -> Iterator[URIRef]:
+        prefix = self._prefix
+        for no in range(1, self._count + 1):
+            yield URIRef(f"{prefix}{no}")
+
+
+class _GenerationOptions:
+    def __init__(self, seed: int | None, max_fan_out: int, value_generators: dict[type, ValueGenerator]) -> None:
+        self.seed = seed
+        self.max_fan_out = max_fan_out
+        self.value_generators = value_generators
+        # Power law, the probability of k connections is proportional to 1/k^2.
+        self.fan_out_cum_weights = list(itertools.accumulate(1 / k**2 for k in range(1, max_fan_out + 1)))
+
+    def random(self, concept: ConceptEntity, property_: str) -> random.Random:
+        """Random generator for a single property, such that the values do not depend on the generation order."""
+        if self.seed is None:
+            return random.Random()
+        return random.Random(f"{self.seed}:{concept}:{property_}")
 
 
 def _get_generation_order(
     concept_linkage: pd.DataFrame,
-    parent_col: str = "source_class",
-    child_col: str = "target_class",
+    parent_col: str = "source_concept",
+    child_col: str = "target_concept",
 ) -> dict:
     parent_child_list: list[list[str]] = concept_linkage[[parent_col, child_col]].values.tolist()  # type: ignore[assignment]
     # Build a directed graph and a list of all names that have no parent
@@ -227,16 +359,16 @@ def _remove_higher_occurring_sym_pair(
     rows_to_remove = set()
     for source, target in sym_pairs:
         first_sym_property_occurrence = concept_linkage[
-            (concept_linkage.source_class == source) & (concept_linkage.target_class == target)
+            (concept_linkage.source_concept == source) & (concept_linkage.target_concept == target)
         ].max_occurrence.values[0]
         second_sym_property_occurrence = concept_linkage[
-            (concept_linkage.source_class == target) & (concept_linkage.target_class == source)
+            (concept_linkage.source_concept == target) & (concept_linkage.target_concept == source)
         ].max_occurrence.values[0]
 
         if first_sym_property_occurrence is None:
             # this means that source occurrence is unbounded
             index = concept_linkage[
-                (concept_linkage.source_class == source) & (concept_linkage.target_class == target)
+                (concept_linkage.source_concept == source) & (concept_linkage.target_concept == target)
             ].index.values[0]
         elif second_sym_property_occurrence is None or (
             first_sym_property_occurrence <= second_sym_property_occurrence
@@ -244,11 +376,11 @@ def _remove_higher_occurring_sym_pair(
         ):
             # this means that target occurrence is unbounded
             index = concept_linkage[
-                (concept_linkage.source_class == target) & (concept_linkage.target_class == source)
+                (concept_linkage.source_concept == target) & (concept_linkage.target_concept == source)
             ].index.values[0]
         else:
             index = concept_linkage[
-                (concept_linkage.source_class == source) & (concept_linkage.target_class == target)
+                (concept_linkage.source_concept == source) & (concept_linkage.target_concept == target)
             ].index.values[0]
         rows_to_remove.add(index)
 
@@ -257,43 +389,31 @@ def _remove_higher_occurring_sym_pair(
 
 def _remove_non_requested_sym_pairs(class_linkage: pd.DataFrame, concept_count: dict) -> pd.DataFrame:
     """Remove symmetric pairs which classes are not found in class count."""
-    rows_to_remove = set(class_linkage[~(class_linkage["source_class"].isin(set(concept_count.keys())))].index.values)
-    rows_to_remove |= set(class_linkage[~(class_linkage["target_class"].isin(set(concept_count.keys())))].index.values)
+    rows_to_remove = set(class_linkage[~(class_linkage["source_concept"].isin(set(concept_count.keys())))].index.values)
+    rows_to_remove |= set(
+        class_linkage[~(class_linkage["target_concept"].isin(set(concept_count.keys())))].index.values
+    )
 
     return class_linkage.drop(list(rows_to_remove))
 
 
 def _generate_mock_data_property_triples(
-    instance_ids: list[URIRef],
+    instance_ids: Sequence[URIRef],
     property_: str,
     namespace: Namespace,
     value_type: DataType,
-) -> list[tuple[URIRef, URIRef, Literal]]:
+    rng: random.Random,
+    value_generators: dict[type, ValueGenerator],
+) -> Iterator[tuple[URIRef, URIRef, Literal]]:
     """Generates triples for data properties."""
-
-    python_type = value_type.python
-    triples = []
-    for id_ in instance_ids:
-        if python_type is int:
-            triples.append((id_, URIRef(namespace[property_]), Literal(random.randint(1, 1983))))
-        elif python_type is float:
-            triples.append(
-                (
-                    id_,
-                    URIRef(namespace[property_]),
-                    Literal(numpy.float32(random.uniform(1, 1983))),
-                )
-            )
-        # generate string
-        else:
-            triples.append(
-                (
-                    id_,
-                    URIRef(namespace[property_]),
-                    Literal(f"{property_}-{remove_namespace_from_uri(id_).split('-')[-1]}"),
-                )
-            )
-    return triples
+    predicate = URIRef(namespace[property_])
+    if value_generator := value_generators.get(value_type.python):
+        for no, id_ in enumerate(instance_ids):
+            yield id_, predicate, Literal(value_generator(rng, no))
+    # generate string
+    else:
+        for no, id_ in enumerate(instance_ids, start=1):
+            yield id_, predicate, Literal(f"{property_}-{no}")
 
 
 def _generate_mock_object_property_triples(
@@ -301,10 +421,11 @@ def _generate_mock_object_property_triples(
     property_definition: ConceptualProperty,
     concept_property_pairs: dict[ConceptEntity, list[ConceptualProperty]],
     sym_pairs: set[tuple[ConceptEntity, ConceptEntity]],
-    instance_ids: dict[ConceptEntity, list[URIRef]],
+    instance_ids: dict[ConceptEntity, _InstanceIds],
     namespace: Namespace,
     stop_on_exception: bool,
-) -> list[tuple[URIRef, URIRef, URIRef]]:
+    options: _GenerationOptions,
+) -> Iterator[tuple[URIRef, URIRef, URIRef]]:
     """Generates triples for object properties."""
     if property_definition.value_type not in instance_ids:
         msg = f"Concept {property_definition.value_type} not found in concept count! "
@@ -316,7 +437,7 @@ def _generate_mock_object_property_triples(
                 f"of concept {concept.suffix} which expects values of this type!"
             )
             warnings.warn(msg, stacklevel=2)
-            return []
+            return
 
     # Handling symmetric property
 
@@ -338,57 +459,55 @@ def _generate_mock_object_property_triples(
     else:
         symmetric_property = None
 
-    triples = []
+    predicate = URIRef(namespace[property_definition.property_])
+    symmetric_predicate = URIRef(namespace[symmetric_property.property_]) if symmetric_property else None
+    targets = instance_ids[cast(ConceptEntity, property_definition.value_type)]
+    max_fan_out = int(min(options.max_fan_out, property_definition.max_count or options.max_fan_out, len(targets)))
+    rng = options.random(concept, property_definition.property_)
+    fan_outs = range(1, max_fan_out + 1)
+    cum_weights = options.fan_out_cum_weights[:max_fan_out]
 
     for i, source in enumerate(instance_ids[concept]):
-        target = instance_ids[cast(ConceptEntity, property_definition.value_type)][
-            i % len(instance_ids[cast(ConceptEntity, property_definition.value_type)])
-        ]
-        triples += [
-            (
-                URIRef(source),
-                URIRef(namespace[property_definition.property_]),
-                URIRef(target),
-            )
-        ]
-
-        if symmetric_property:
-            triples += [
-                (
-                    URIRef(target),
-                    URIRef(namespace[symmetric_property.property_]),
-                    URIRef(source),
-                )
-            ]
+        # The first target is picked round-robin, such that all targets are connected
+        source_targets = [targets[i % len(targets)]]
+        if max_fan_out > 1:
+            fan_out = rng.choices(fan_outs, cum_weights=cum_weights)[0]
+            while len(source_targets) < fan_out:
+                if (target := targets[rng.randrange(len(targets))]) not in source_targets:
+                    source_targets.append(target)
+
+        for target in source_targets:
+            yield source, predicate, target
+            if symmetric_predicate:
+                yield target, symmetric_predicate, source
 
     if symmetric_property:
         concept_property_pairs[cast(ConceptEntity, property_definition.value_type)].remove(symmetric_property)
 
-    return triples
-
 
 def _generate_triples_per_class(
     concept: ConceptEntity,
     concept_properties_pairs: dict[ConceptEntity, list[ConceptualProperty]],
     sym_pairs: set[tuple[ConceptEntity, ConceptEntity]],
-    instance_ids: dict[ConceptEntity, list[URIRef]],
+    instance_ids: dict[ConceptEntity, _InstanceIds],
     namespace: Namespace,
     stop_on_exception: bool,
-) -> list[Triple]:
+    options: _GenerationOptions,
+) -> Iterator[Triple]:
     """Generate triples for a given class."""
-    triples: list[Triple] = []
-
     for property_ in concept_properties_pairs[concept]:
         if property_.type_ == EntityTypes.data_property:
-            triples += _generate_mock_data_property_triples(
+            yield from _generate_mock_data_property_triples(
                 instance_ids[concept],
                 property_.property_,
                 namespace,
                 cast(DataType, property_.value_type),
+                options.random(concept, property_.property_),
+                options.value_generators,
             )
 
         elif property_.type_ == EntityTypes.object_property:
-            triples += _generate_mock_object_property_triples(
+            yield from _generate_mock_object_property_triples(
                 concept,
                 property_,
                 concept_properties_pairs,
@@ -396,9 +515,8 @@ def _generate_triples_per_class(
                 instance_ids,
                 namespace,
                 stop_on_exception,
+                options,
             )
 
         else:
             raise ValueError(f"Property type {property_.value_type} not supported!")
-
-    return triples
@@ -1,20 +1,117 @@
 import urllib.parse
-from collections.abc import Iterable, Set
+from collections.abc import Callable, Iterable, Iterator, Set
+from datetime import datetime
 from typing import Any, cast
 
 from cognite.client.data_classes import Row, RowList
 from cognite.client.utils.useful_types import SequenceNotStr
-from rdflib import RDF, Namespace, URIRef
+from rdflib import RDF, Literal, Namespace, URIRef
 
 from cognite.neat._v0.core._client import NeatClient
 from cognite.neat._v0.core._constants import DEFAULT_RAW_URI
 from cognite.neat._v0.core._shared import Triple
+from cognite.neat._v0.core._utils.auxiliary import string_to_ideal_type
+from cognite.neat._v0.core._utils.concurrency import map_concurrently
 
 from ._base import BaseExtractor
 from ._dict import DEFAULT_EMPTY_VALUES, DictExtractor
 
+# Number of rows used to infer the type of the columns in a table.
+_SAMPLE_SIZE = 1_000
+# Maximum number of distinct values per column that are kept as ready-made literals.
+_MAX_CACHED_LITERALS = 10_000
+
+
+def _as_float_or_int(value: str) -> int | float:
+    # float() accepts everything int() does, thus the value is an int if it has no fraction,
+    # exponent, nan or inf, which is what string_to_ideal_type tries first.
+    number = float(value)
+    if any(char in value for char in ".eEnN"):
+        return number
+    return int(value)
+
+
+def _as_bool(value: str) -> bool:
+    lowered = value.lower()
+    if lowered == "true":
+        return True
+    elif lowered == "false":
+        return False
+    raise ValueError(value)
+
+
+def _as_datetime(value: str) -> datetime:
+    if value.isdigit():
+        # For example, 20240101 is a valid ISO date, but string_to_ideal_type makes it an int.
+        raise ValueError(value)
+    return datetime.fromisoformat(value)
+
+
+# The fast path converters by the type string_to_ideal_type returns. Each gives the same result as
+# string_to_ideal_type when it succeeds, and raises a ValueError otherwise.
+_CONVERTER_BY_IDEAL_TYPE: dict[type, Callable[[str], Any]] = {
+    int: int,
+    float: _as_float_or_int,
+    bool: _as_bool,
+    datetime: _as_datetime,
+}
+
+
+class _RawColumn:
+    """Converts the values of a single RAW column to literals.
+
+    The type of the column is inferred once from a sample of the values, and the matching converter is
+    tried first for every value, before falling back to the full `string_to_ideal_type`. Literals for
+    repeated values are reused.
+    """
+
+    def __init__(self, predicate: URIRef, str_to_ideal_type: bool, sample: Iterable[Any] = ()) -> None:
+        self.predicate = predicate
+        self.str_to_ideal_type = str_to_ideal_type
+        self._converter: Callable[[str], Any] | None = None
+        if str_to_ideal_type:
+            ideal_types = {type(string_to_ideal_type(value)) for value in sample if isinstance(value, str)}
+            if len(ideal_types) == 1:
+                self._converter = _CONVERTER_BY_IDEAL_TYPE.get(ideal_types.pop())
+        self._literal_by_value: dict[str, Literal] = {}
+
+    def as_literal(self, value: str) -> Literal:
+        if (literal := self._literal_by_value.get(value)) is not None:
+            return literal
+        if not self.str_to_ideal_type:
+            literal = Literal(value)
+        elif self._converter is None:
+            literal = Literal(string_to_ideal_type(value))
+        else:
+            try:
+                literal = Literal(self._converter(value))
+            except ValueError:
+                literal = Literal(string_to_ideal_type(value))
+        if len(self._literal_by_value) < _MAX_CACHED_LITERALS:
+            self._literal_by_value[value] = literal
+        return literal
+
 
 class RAWExtractor(BaseExtractor):
+    """Extracts the rows of a RAW table as instances, with the columns as properties.
+
+    Args:
+        client: The client to use.
+        db_name: The name of the RAW database.
+        table_name: The name of the RAW table.
+        table_type: The type of the instances. Defaults to the table name.
+        foreign_keys: Columns which values are row keys, these become connections to the other rows.
+        namespace: The namespace to use. Defaults to DEFAULT_RAW_URI.
+        empty_values: Values that are considered empty when unpacking JSON columns.
+        str_to_ideal_type: Whether to convert string values to int, float, bool or datetime if possible.
+        unpack_json: Whether to unpack JSON columns into one property per key.
+        max_workers: Number of threads converting the rows to triples. The rows are downloaded in
+            10 partitions in parallel, and converted in chunks of 10 000 rows. Defaults to 1, which converts
+            the rows in the consuming thread.
+    """
+
+    _chunk_size = 10_000
+
     def __init__(
         self,
         client: NeatClient,
@@ -26,6 +123,7 @@ class RAWExtractor(BaseExtractor):
         empty_values: Set[str] = DEFAULT_EMPTY_VALUES,
         str_to_ideal_type: bool = False,
         unpack_json: bool = False,
+        max_workers: int = 1,
     ) -> None:
         self.client = client
         self.db_name = db_name
@@ -36,32 +134,85 @@ class RAWExtractor(BaseExtractor):
         self.empty_values = empty_values
         self.str_to_ideal_type = str_to_ideal_type
         self.unpack_json = unpack_json
+        self.max_workers = max_workers
+        self._column_by_key: dict[str, _RawColumn] = {}
+        # Used for the values that are not plain strings, that is, numbers, lists and JSON objects.
+        # The identifier is not used when converting single values.
+        self._dict_extractor = DictExtractor(
+            self.namespace[""],
+            {},
+            self.namespace,
+            self.foreign_keys,
+            self.empty_values,
+            self.str_to_ideal_type,
+            self.unpack_json,
+        )
 
     @property
     def _rdf_type(self) -> URIRef:
         return self.namespace[urllib.parse.quote(self.table_type or self.table_name)]
 
     def extract(self) -> Iterable[Triple]:
+        chunks = self._iterate_row_chunks()
+        first_chunk = next(chunks, None)
+        if first_chunk is None:
+            return
+        self._infer_columns(first_chunk[:_SAMPLE_SIZE])
+        yield from self._rows2triples(first_chunk)
+        for triples in map_concurrently(self._rows2triples, chunks, self.max_workers):
+            yield from triples
+
+    def _iterate_row_chunks(self) -> Iterator[list[Row]]:
+        chunk: list[Row] = []
         for row in self.client.raw.rows(self.db_name, self.table_name, partitions=10, chunk_size=None):
             if isinstance(row, Row):
-                yield from self._row2triples(row)
+                chunk.append(row)
             elif isinstance(row, RowList):
                 # Bug in SDK returning row list with chunk_size= None
-                for item in row:
-                    yield from self._row2triples(item)
-
-    def _row2triples(self, row: Row) -> Iterable[Triple]:
-        # The row is always set. It is just the PySDK that have it as str | None
-        key, data = cast(tuple[str, dict[str, Any]], (row.key, row.columns))
-        identifier = self.namespace[urllib.parse.quote(key)]
-        yield identifier, RDF.type, self._rdf_type
-
-        yield from DictExtractor(
-            identifier,
-            data,
-            self.namespace,
-            self.foreign_keys,
-            self.empty_values,
-            self.str_to_ideal_type,
-            self.unpack_json,
-        ).extract()
+                chunk.extend(row)
+            if len(chunk) >= self._chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def _infer_columns(self, sample: list[Row]) -> None:
+        values_by_key: dict[str, list[Any]] = {}
+        for row in sample:
+            for key, value in (row.columns or {}).items():
+                values_by_key.setdefault(key, []).append(value)
+        for key, values in values_by_key.items():
+            self._column_by_key[key] = _RawColumn(
+                self.namespace[urllib.parse.quote(key)], self.str_to_ideal_type, values
+            )
+
+    def _get_column(self, key: str) -> _RawColumn:
+        if (column := self._column_by_key.get(key)) is None:
+            # A column which is not in the sample. Setting a dict item is atomic, thus at worst
+            # two threads create the same column.
+            column = _RawColumn(self.namespace[urllib.parse.quote(key)], self.str_to_ideal_type)
+            self._column_by_key[key] = column
+        return column
+
+    def _rows2triples(self, rows: Iterable[Row]) -> list[Triple]:
+        triples: list[Triple] = []
+        rdf_type = self._rdf_type
+        for row in rows:
+            # The row is always set. It is just the PySDK that have it as str | None
+            key, data = cast(tuple[str, dict[str, Any]], (row.key, row.columns))
+            identifier = self.namespace[urllib.parse.quote(key)]
+            triples.append((identifier, RDF.type, rdf_type))
+            for column_key, value in data.items():
+                if isinstance(value, str) and column_key not in self.foreign_keys:
+                    column = self._get_column(column_key)
+                    triples.append((identifier, column.predicate, column.as_literal(value)))
+                    continue
+                for predicate_str, object_ in self._dict_extractor._get_predicate_objects_pair(
+                    column_key, value, self.unpack_json
+                ):
+                    if predicate_str == column_key:
+                        predicate = self._get_column(column_key).predicate
+                    else:
+                        predicate = self.namespace[urllib.parse.quote(predicate_str)]
+                    triples.append((identifier, predicate, object_))
+        return triples
@@ -1,7 +1,14 @@
+import bz2
+import gzip
+import io
+import lzma
+import tarfile
+import warnings
 import zipfile
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
 from pathlib import Path
-from typing import cast, get_args
+from typing import IO, Any, cast, get_args
 
 from rdflib import URIRef
 from rdflib.util import guess_format
@@ -16,6 +23,7 @@ from cognite.neat._v0.core._issues.errors import (
     FileTypeUnexpectedError,
 )
 from cognite.neat._v0.core._issues.errors._general import NeatValueError
+from cognite.neat._v0.core._issues.warnings import FileReadWarning
 from cognite.neat._v0.core._shared import Triple
 
 
@@ -78,3 +86,230 @@ class RdfFileExtractor(BaseExtractor):
                     return cls(cast(zipfile.ZipExtFile, file), base_uri, issue_list)
 
         raise NeatValueError(f"Cannot extract {filename} from zip file {filepath}")
+
+
+# Compressed files are decompressed while they are read.
+_DECOMPRESSOR_BY_SUFFIX: dict[str, Callable[[IO[bytes]], IO[bytes]]] = {
+    ".gz": lambda file: cast(IO[bytes], gzip.GzipFile(fileobj=file)),
+    ".bz2": lambda file: cast(IO[bytes], bz2.BZ2File(file)),
+    ".xz": lambda file: cast(IO[bytes], lzma.LZMAFile(file)),
+}
+
+
+class _ClosingStream(io.BufferedIOBase):
+    """Wraps a binary stream and closes the resources it was opened from together with it."""
+
+    def __init__(self, stream: IO[bytes], *resources: Any) -> None:
+        super().__init__()
+        self._stream = stream
+        self._resources = resources
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int | None = -1) -> bytes:
+        return self._stream.read(-1 if size is None else size)
+
+    def read1(self, size: int = -1) -> bytes:
+        return self.read(size)
+
+    def close(self) -> None:
+        if not self.closed:
+            self._stream.close()
+            for resource in self._resources:
+                resource.close()
+        super().close()
+
+
+class _PrefixedStream(io.BufferedIOBase):
+    """A binary stream that first returns the prefix, and then the rest of the stream."""
+
+    def __init__(self, prefix: bytes, stream: IO[bytes]) -> None:
+        super().__init__()
+        self._prefix = prefix
+        self._stream = stream
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int | None = -1) -> bytes:
+        if size is None or size < 0:
+            data, self._prefix = self._prefix + self._stream.read(), b""
+            return data
+        if self._prefix:
+            data, self._prefix = self._prefix[:size], self._prefix[size:]
+            return data
+        return self._stream.read(size)
+
+    def read1(self, size: int = -1) -> bytes:
+        return self.read(size)
+
+    def close(self) -> None:
+        if not self.closed:
+            self._stream.close()
+        super().close()
+
+
+def _decompress(file: IO[bytes], compression_suffix: str | None) -> IO[bytes]:
+    if compression_suffix is None:
+        return file
+    # The decompressors do not close the file they read from.
+    return cast(IO[bytes], _ClosingStream(_DECOMPRESSOR_BY_SUFFIX[compression_suffix](file), file))
+
+
+# Formats with one triple or quad per line, that can be split into chunks of lines.
+_LINE_BASED_FORMATS = frozenset({"nt", "nquads"})
+
+
+@dataclass(frozen=True)
+class RdfSource:
+    """A single RDF document, which is either a file, or a member of an archive.
+
+    Args:
+        name: The name of the document, used when reporting issues.
+        format: The rdflib format of the document.
+        open: Opens the document as a binary stream, decompressing it if needed.
+        is_independent: Whether the stream can be read independently of the other sources, for example,
+            in another thread. This is not the case for the members of a tar archive, which must be read in order.
+    """
+
+    name: str
+    format: str
+    open: Callable[[], IO[bytes]]
+    is_independent: bool = True
+
+    def iterate_chunks(self, chunk_size: int | None) -> Iterator[bytes | IO[bytes]]:
+        """Splits line based documents, N-Triples and N-Quads, into chunks of whole lines.
+
+        The chunks can be parsed independently, except when there are blank nodes, as these are only
+        identified within a single document. Thus, from the first chunk with a blank node, the rest of the
+        document is returned as a single stream. Other formats are returned as a single stream. The caller
+        is responsible for closing the returned streams.
+
+        Args:
+            chunk_size: The approximate size of each chunk in bytes. If None, the document is not split.
+        """
+        stream = self.open()
+        if chunk_size is None or self.format not in _LINE_BASED_FORMATS:
+            yield stream
+            return
+        is_stream_returned = False
+        try:
+            while chunk := stream.read(chunk_size):
+                if not chunk.endswith(b"\n"):
+                    chunk += stream.readline()
+                if b"_:" in chunk:
+                    is_stream_returned = True
+                    yield cast(IO[bytes], _PrefixedStream(chunk, stream))
+                    return
+                yield chunk
+        finally:
+            if not is_stream_returned:
+                stream.close()
+
+
+class RdfFilesExtractor(BaseExtractor):
+    """Extract data from many RDF files into Neat.
+
+    The sources can be RDF files, directories with RDF files, or zip and tar archives with RDF files. Files
+    compressed with gzip, bz2 or xz, for example, `model.ttl.gz` or `export.tar.gz`, are decompressed while they
+    are read. Files that cannot be loaded are reported as issues, while the other files are still loaded.
+
+    Args:
+        sources: The RDF files, directories, and archives to load.
+        base_uri: The base URI to use. Defaults to DEFAULT_BASE_URI.
+        max_workers: The number of files, or chunks of N-Triples/N-Quads files, that are loaded in parallel
+            with the Oxigraph store. Other stores load the files one by one. Defaults to 1.
+        issue_list: Issue list to report the issues found when listing the sources to.
+    """
+
+    def __init__(
+        self,
+        sources: Path | Sequence[Path],
+        base_uri: URIRef = DEFAULT_BASE_URI,
+        max_workers: int = 1,
+        issue_list: IssueList | None = None,
+    ):
+        self.sources = [sources] if isinstance(sources, Path) else list(sources)
+        self.base_uri = base_uri
+        self.max_workers = max_workers
+        self.issue_list = issue_list or IssueList(title="RDF files")
+        for source in self.sources:
+            if not source.exists():
+                self.issue_list.append(FileNotFoundNeatError(source))
+            elif source.is_file() and not (self._is_archive(source) or self._guess_format(source.name)):
+                self.issue_list.append(FileTypeUnexpectedError(source, frozenset(get_args(RDFTypes))))
+
+    def extract(self) -> Iterable[Triple]:
+        raise NotImplementedError()
+
+    def iterate_sources(self) -> Iterator[RdfSource]:
+        """Iterates over all RDF documents in the sources, skipping files that are not RDF."""
+        for source in self.sources:
+            if source.is_dir():
+                for filepath in sorted(source.rglob("*")):
+                    if filepath.is_file():
+                        yield from self._iterate_file(filepath)
+            elif source.exists():
+                yield from self._iterate_file(source)
+
+    def _iterate_file(self, filepath: Path) -> Iterator[RdfSource]:
+        try:
+            if zipfile.is_zipfile(filepath):
+                yield from self._iterate_zip(filepath)
+            elif self._is_archive(filepath):
+                yield from self._iterate_tar(filepath)
+            elif format_ := self._guess_format(filepath.name):
+                compression = self._compression_suffix(filepath.name)
+
+                def open_file(filepath: Path = filepath, compression: str | None = compression) -> IO[bytes]:
+                    return _decompress(cast(IO[bytes], filepath.open("rb")), compression)
+
+                yield RdfSource(str(filepath), format_, open_file)
+        except (OSError, EOFError, tarfile.TarError, zipfile.BadZipFile) as error:
+            # A corrupt archive is skipped, such that the other sources are still loaded.
+            warnings.warn(FileReadWarning(filepath, str(error)), stacklevel=2)
+
+    def _iterate_zip(self, filepath: Path) -> Iterator[RdfSource]:
+        with zipfile.ZipFile(filepath, "r") as zip_ref:
+            names = [info.filename for info in zip_ref.infolist() if not info.is_dir()]
+        for name in names:
+            if not (format_ := self._guess_format(name)):
+                continue
+            compression = self._compression_suffix(name)
+
+            def open_member(name: str = name, compression: str | None = compression) -> IO[bytes]:
+                # Each member gets its own handle to the zip file, such that the members can be read in parallel.
+                zip_ref = zipfile.ZipFile(filepath, "r")
+                return _decompress(cast(IO[bytes], _ClosingStream(zip_ref.open(name), zip_ref)), compression)
+
+            yield RdfSource(f"{filepath}/{name}", format_, open_member)
+
+    def _iterate_tar(self, filepath: Path) -> Iterator[RdfSource]:
+        # Streaming mode, such that compressed archives are decompressed once, from start to end.
+        with tarfile.open(filepath, "r|*") as tar:
+            for member in tar:
+                if not member.isfile() or not (format_ := self._guess_format(member.name)):
+                    continue
+                file = tar.extractfile(member)
+                if file is None:
+                    continue
+                stream = _decompress(cast(IO[bytes], file), self._compression_suffix(member.name))
+                # The member must be read before moving on to the next member.
+                yield RdfSource(f"{filepath}/{member.name}", format_, lambda stream=stream: stream, False)  # type: ignore[misc]
+
+    @staticmethod
+    def _is_archive(filepath: Path) -> bool:
+        name = filepath.name.casefold()
+        return name.endswith((".zip", ".tar", ".tgz", ".tar.gz", ".tar.bz2", ".tar.xz"))
+
+    @staticmethod
+    def _compression_suffix(name: str) -> str | None:
+        suffix = Path(name).suffix.casefold()
+        return suffix if suffix in _DECOMPRESSOR_BY_SUFFIX else None
+
+    @classmethod
+    def _guess_format(cls, name: str) -> str | None:
+        if cls._compression_suffix(name):
+            name = str(Path(name).with_suffix(""))
+        return guess_format(name)
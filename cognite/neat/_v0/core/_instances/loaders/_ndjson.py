@@ -0,0 +1,215 @@
+import gzip
+import json
+from collections.abc import Iterable
+from pathlib import Path
+from types import TracebackType
+from typing import IO, Literal
+
+from cognite.client import data_modeling as dm
+
+from cognite.neat._v0.core._issues import NeatIssue
+
+NDJSON_SUFFIXES = frozenset({".ndjson", ".jsonl"})
+_GZIP_SUFFIX = ".gz"
+_MANIFEST_SUFFIX = ".shards"
+
+
+def is_ndjson_file(filepath: Path) -> bool:
+    """Whether the file is a newline delimited JSON file, for example, 'instances.ndjson' or 'instances.ndjson.gz'."""
+    return _split_suffix(filepath)[1].removesuffix(_GZIP_SUFFIX) in NDJSON_SUFFIXES
+
+
+class NDJSONInstanceWriter:
+    """Writes nodes, edges and issues to newline delimited JSON (NDJSON) files, one dumped item per line.
+
+    Only the open file is kept in memory, such that any number of instances can be written. The file is gzip
+    compressed if the file name ends with '.gz', for example, 'instances.ndjson.gz'.
+
+    With sharding, the shards are written next to the given file path and named after it, for example,
+    'instances-Car.ndjson.gz' when sharding per view, and 'instances-00000.ndjson.gz' when sharding per number
+    of instances. Each shard can be read, and uploaded, independently of the others. When sharding per view,
+    issues raised outside a view are written to the 'instances-issues.ndjson.gz' shard. The shards are listed,
+    in the order they were written, in the manifest 'instances.ndjson.gz.shards'.
+
+    The output of an earlier write to the same file path, the file or the shards in its manifest, is deleted
+    before writing.
+
+    Args:
+        filepath: The file to write to.
+        shard_by: How to shard the output. None writes a single file, 'view' writes one shard per view,
+            and an integer is the maximum number of instances per shard.
+        encoding: The encoding of the files.
+        new_line: The line separator.
+    """
+
+    def __init__(
+        self,
+        filepath: Path,
+        shard_by: Literal["view"] | int | None = None,
+        encoding: str = "utf-8",
+        new_line: str = "\n",
+    ) -> None:
+        if not is_ndjson_file(filepath):
+            raise ValueError(f"File format {''.join(filepath.suffixes)} is not a newline delimited JSON format")
+        if isinstance(shard_by, int) and shard_by < 1:
+            raise ValueError(f"The number of instances per shard must be positive, got {shard_by}")
+        self.filepath = filepath
+        self.shard_by = shard_by
+        self.encoding = encoding
+        self.new_line = new_line
+        self.paths: list[Path] = []
+        self._file: IO[str] | None = None
+        self._instance_count = 0
+        self._issue_file: IO[str] | None = None
+
+    def __enter__(self) -> "NDJSONInstanceWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def start_view(self, view_name: str | None) -> None:
+        """Starts writing the instances of a view, which opens a new shard when sharding per view."""
+        if self.shard_by == "view":
+            self._close_file()
+            self._file = self._open(view_name or "instances")
+
+    def end_view(self) -> None:
+        """Ends writing the instances of a view, which closes its shard when sharding per view."""
+        if self.shard_by == "view":
+            self._close_file()
+
+    def write(self, item: dm.InstanceApply | NeatIssue) -> None:
+        if isinstance(item, NeatIssue):
+            self._write_line(self._get_issue_file(), item.dump())
+            return
+        if isinstance(self.shard_by, int) and self._instance_count >= self.shard_by:
+            self._close_file()
+        if self._file is None:
+            self._file = self._open(f"{len(self.paths):05d}" if isinstance(self.shard_by, int) else None)
+        self._write_line(self._file, item.dump())
+        self._instance_count += 1
+
+    def close(self) -> None:
+        self._close_file()
+        if self._issue_file is not None:
+            self._issue_file.close()
+            self._issue_file = None
+        if not self.paths:
+            # An empty file, such that the output always exists.
+            self._open(None).close()
+        if self.shard_by is not None:
+            manifest = _manifest_path(self.filepath)
+            manifest.write_text("".join(f"{path.name}\n" for path in self.paths), encoding=self.encoding)
+
+    def _get_issue_file(self) -> IO[str]:
+        if self.shard_by != "view" or self._file is not None:
+            if self._file is None:
+                self._file = self._open(f"{len(self.paths):05d}" if isinstance(self.shard_by, int) else None)
+            return self._file
+        if self._issue_file is None:
+            self._issue_file = self._open("issues")
+        return self._issue_file
+
+    def _write_line(self, file: IO[str], dumped: dict) -> None:
+        file.write(json.dumps(dumped, separators=(",", ":")))
+        file.write(self.new_line)
+
+    def _open(self, shard: str | None) -> IO[str]:
+        if not self.paths:
+            _remove_output(self.filepath)
+        path = self._shard_path(shard)
+        self.paths.append(path)
+        self._instance_count = 0
+        if path.name.endswith(_GZIP_SUFFIX):
+            return gzip.open(path, "wt", encoding=self.encoding, newline="")
+        return path.open("w", encoding=self.encoding, newline="")
+
+    def _shard_path(self, shard: str | None) -> Path:
+        if shard is None:
+            return self.filepath
+        name, suffix = _split_suffix(self.filepath)
+        path = self.filepath.with_name(f"{name}-{shard}{suffix}")
+        # Views in different spaces, or versions, can share the external id.
+        no = 1
+        while path in self.paths:
+            no += 1
+            path = self.filepath.with_name(f"{name}-{shard}-{no}{suffix}")
+        return path
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def find_ndjson_shards(filepath: Path) -> list[Path]:
+    """Finds the file, or the shards, written by the NDJSONInstanceWriter to the given file path.
+
+    Args:
+        filepath: The file path given to the writer.
+
+    Returns:
+        The shards listed in the manifest if the output is sharded, otherwise the file itself if it exists.
+    """
+    manifest = _manifest_path(filepath)
+    if manifest.exists():
+        return [filepath.with_name(name) for name in manifest.read_text(encoding="utf-8").splitlines() if name]
+    if filepath.exists():
+        return [filepath]
+    return []
+
+
+def read_ndjson_instances(filepath: Path, encoding: str = "utf-8") -> Iterable[dm.NodeApply | dm.EdgeApply | NeatIssue]:
+    """Reads the nodes, edges and issues of a single file, or shard, written by the NDJSONInstanceWriter.
+
+    The file is read line by line, such that only one item is kept in memory at a time.
+
+    Args:
+        filepath: The file to read.
+        encoding: The encoding of the file.
+
+    Yields:
+        The nodes, edges and issues in the order they were written.
+    """
+    if filepath.name.endswith(_GZIP_SUFFIX):
+        file: IO[str] = gzip.open(filepath, "rt", encoding=encoding)
+    else:
+        file = filepath.open(encoding=encoding)
+    with file:
+        for line in file:
+            if not line.strip():
+                continue
+            dumped = json.loads(line)
+            if "NeatIssue" in dumped:
+                yield NeatIssue.load(dumped)
+            elif dumped.get("instanceType") == "edge":
+                yield dm.EdgeApply.load(dumped)
+            else:
+                yield dm.NodeApply.load(dumped)
+
+
+def _manifest_path(filepath: Path) -> Path:
+    return filepath.with_name(f"{filepath.name}{_MANIFEST_SUFFIX}")
+
+
+def _remove_output(filepath: Path) -> None:
+    """Removes the file, or the shards, of an earlier write to the file path, such that they are not read as
+    part of the new output."""
+    for path in find_ndjson_shards(filepath):
+        path.unlink(missing_ok=True)
+    _manifest_path(filepath).unlink(missing_ok=True)
+    filepath.unlink(missing_ok=True)
+
+
+def _split_suffix(filepath: Path) -> tuple[str, str]:
+    """Splits the file name into the name and the suffix, for example, 'instances' and '.ndjson.gz'."""
+    suffix = filepath.suffix
+    if suffix == _GZIP_SUFFIX:
+        suffix = Path(filepath.stem).suffix + suffix
+    return filepath.name.removesuffix(suffix), suffix
@@ -2,8 +2,7 @@ import itertools
 import json
 import urllib.parse
 import warnings
-from collections import defaultdict
-from collections.abc import Iterable, Sequence
+from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Literal, cast, get_args
@@ -61,6 +60,8 @@ from cognite.neat._v0.core._utils.rdf_ import (
 from cognite.neat._v0.core._utils.upload import UploadResult
 
 from ._base import _END_OF_CLASS, _START_OF_CLASS, CDFLoader
+from ._ndjson import NDJSONInstanceWriter, find_ndjson_shards, is_ndjson_file, read_ndjson_instances
+from ._uri_table import InstanceUriTable
 
 
 @dataclass
@@ -105,12 +106,14 @@ class DMSLoader(CDFLoader[dm.InstanceApply]):
         unquote_external_ids (bool): If True, the loader will unquote external ids before creating the instances.
     """
 
+    _max_cached_instance_ids = 100_000
+
     def __init__(
         self,
         physical_data_model: PhysicalDataModel,
         conceptual_data_model: ConceptualDataModel,
         instance_store: NeatInstanceStore,
-        space_by_instance_uri: dict[URIRef, str],
+        space_by_instance_uri: Mapping[URIRef, str],
         client: NeatClient | None = None,
         create_issues: Sequence[NeatIssue] | None = None,
         unquote_external_ids: bool = False,
@@ -121,14 +124,33 @@ class DMSLoader(CDFLoader[dm.InstanceApply]):
         self.conceptual_data_model = conceptual_data_model
         self.neat_prefix_by_type_uri = neat_prefix_by_type_uri or {}
         self._space_by_instance_uri = space_by_instance_uri
-        self._external_id_by_uri: dict[URIRef, str] = {}
+        # The Neat prefix to remove from the external id of each instance with a unique identifier.
+        self._neat_prefix_by_instance_uri = InstanceUriTable()
+        # Memoized instance ids, as the same instances are referenced many times by their neighbours.
+        self._instance_id_by_uri: dict[URIRef, InstanceId] = {}
         self._issues = IssueList(create_issues or [])
         self._client = client
         self._unquote_external_ids = unquote_external_ids
 
-    def write_to_file(self, filepath: Path) -> None:
+    def write_to_file(self, filepath: Path, shard_by: Literal["view"] | int | None = None) -> None:
+        """Writes the nodes, edges and issues to a file.
+
+        JSON and YAML files are written in one go, and thus, all instances are kept in memory. Newline delimited
+        JSON files, '.ndjson' or '.jsonl' optionally followed by '.gz', are streamed one instance at a time,
+        and can be sharded. Use `read_from_file` to read them back.
+
+        Args:
+            filepath: The file to write to.
+            shard_by: Only applicable to newline delimited JSON. None writes a single file, 'view' writes one shard
+                per view, and an integer is the maximum number of instances per shard.
+        """
+        if is_ndjson_file(filepath):
+            self._write_to_ndjson(filepath, shard_by)
+            return
         if filepath.suffix not in [".json", ".yaml", ".yml"]:
             raise ValueError(f"File format {filepath.suffix} is not supported")
+        if shard_by is not None:
+            raise ValueError(f"Sharding is only supported for newline delimited JSON, got {filepath.suffix}")
         dumped: dict[str, list] = {"nodes": [], "edges": [], "issues": []}
         for item in self.load(stop_on_exception=False):
             key = {
@@ -146,6 +168,37 @@ class DMSLoader(CDFLoader[dm.InstanceApply]):
             else:
                 yaml.safe_dump(dumped, f, sort_keys=False)
 
+    def _write_to_ndjson(self, filepath: Path, shard_by: Literal["view"] | int | None) -> None:
+        with NDJSONInstanceWriter(filepath, shard_by, self._encoding, self._new_line) as writer:
+            for item in self._load(stop_on_exception=False):
+                if isinstance(item, _START_OF_CLASS):
+                    writer.start_view(item.class_name)
+                elif item is _END_OF_CLASS:
+                    writer.end_view()
+                elif isinstance(item, dm.NodeApply | dm.EdgeApply | NeatIssue):
+                    writer.write(item)
+                else:
+                    # This should never happen, and is a bug in neat
+                    raise ValueError(f"Item {item} is not supported. This is a bug in neat please report it.")
+
+    @staticmethod
+    def read_from_file(filepath: Path) -> Iterable[dm.NodeApply | dm.EdgeApply | NeatIssue]:
+        """Reads the nodes, edges and issues written by `write_to_file` to a newline delimited JSON file.
+
+        The file, or each of its shards, is read line by line. To read the shards concurrently, use
+        `find_ndjson_shards` and `read_ndjson_instances` on each shard.
+
+        Args:
+            filepath: The file path given to `write_to_file`.
+
+        Yields:
+            The nodes, edges and issues in the order they were written.
+        """
+        if not is_ndjson_file(filepath):
+            raise ValueError(f"File format {filepath.suffix} is not supported")
+        for shard in find_ndjson_shards(filepath):
+            yield from read_ndjson_instances(shard)
+
     def _load(
         self, stop_on_exception: bool = False
     ) -> Iterable[dm.InstanceApply | NeatIssue | type[_END_OF_CLASS] | _START_OF_CLASS]:
@@ -192,7 +245,9 @@ class DMSLoader(CDFLoader[dm.InstanceApply]):
             yield _END_OF_CLASS
 
     def _create_view_iterations(self) -> tuple[list[_ViewIterator], IssueList]:
-        view_query_by_id = DataModelAnalysis(self.conceptual_data_model, self.physical_data_model).view_query_by_id
+        view_query_by_id = DataModelAnalysis.cached(
+            self.conceptual_data_model, self.physical_data_model
+        ).view_query_by_id
         iterations_by_view_id = self._select_views_with_instances(view_query_by_id)
         if self._client:
             issues = IssueList()
@@ -257,7 +312,7 @@ class DMSLoader(CDFLoader[dm.InstanceApply]):
         """Selects the views with data."""
         view_iterations: dict[dm.ViewId, _ViewIterator] = {}
         for view_id, query in view_query_by_id.items():
-            count = self.instance_store.queries.select.count_of_type(query.rdf_type)
+            count = self.instance_store.statistics().instance_count_by_type.get(query.rdf_type, 0)
             if count > 0:
                 view_iterations[view_id] = _ViewIterator(view_id, count, query)
         return view_iterations
@@ -266,24 +321,36 @@ class DMSLoader(CDFLoader[dm.InstanceApply]):
         if not self.neat_prefix_by_type_uri:
             return
 
-        count = sum(count for _, count in self.instance_store.queries.select.summarize_instances())
-        instance_iterable = self.instance_store.queries.select.list_instances_ids()
+        # Only the instances of the types with a prefix are looked up.
+        instance_count_by_type = self.instance_store.statistics().instance_count_by_type
+        prefix_by_type = {
+            type_: prefix
+            for type_, prefix in self.neat_prefix_by_type_uri.items()
+            if instance_count_by_type.get(type_, 0) > 0
+        }
+        count = sum(instance_count_by_type[type_] for type_ in prefix_by_type)
+        instance_iterable = (
+            (instance_uri, prefix)
+            for type_, prefix in prefix_by_type.items()
+            for instance_uri in self.instance_store.queries.select.list_instances_ids(type_)
+        )
         instance_iterable = iterate_progress_bar_if_above_config_threshold(
             instance_iterable, count, f"Looking up identifiers for {count} instances..."
         )
-        count_by_identifier: dict[str, list[URIRef]] = defaultdict(list)
-        for instance_uri, type in instance_iterable:
-            if type not in self.neat_prefix_by_type_uri:
-                continue
-            prefix = self.neat_prefix_by_type_uri[type]
+        # None marks identifiers shared by several instances, these keep the full identifier.
+        instance_by_identifier: dict[str, tuple[URIRef, str] | None] = {}
+        for instance_uri, prefix in instance_iterable:
             identifier = remove_namespace_from_uri(instance_uri)
             if self._unquote_external_ids:
                 identifier = urllib.parse.unquote(identifier)
-            count_by_identifier[identifier.removeprefix(prefix)].append(instance_uri)
+            identifier = identifier.removeprefix(prefix)
+            instance_by_identifier[identifier] = (
+                None if identifier in instance_by_identifier else (instance_uri, prefix)
+            )
 
-        for identifier, uris in count_by_identifier.items():
-            if len(uris) == 1:
-                self._external_id_by_uri[uris[0]] = identifier
+        for instance in instance_by_identifier.values():
+            if instance is not None:
+                self._neat_prefix_by_instance_uri.add(*instance)
 
     def _create_projection(self, view: dm.View) -> tuple[_Projection, IssueList]:
         issues = IssueList()
@@ -579,17 +646,28 @@ class DMSLoader(CDFLoader[dm.InstanceApply]):
         return None, None
 
     def _create_instance_id(self, uri: URIRef) -> InstanceId:
+        if (instance_id := self._instance_id_by_uri.get(uri)) is not None:
+            return instance_id
         space = self._space_by_instance_uri[uri]
-        if uri in self._external_id_by_uri:
-            external_id = self._external_id_by_uri[uri]
-        else:
-            external_id = remove_namespace_from_uri(uri)
+        external_id = remove_namespace_from_uri(uri)
+        if (prefix := self._neat_prefix_by_instance_uri.get(uri)) is not None:
+            if self._unquote_external_ids:
+                external_id = urllib.parse.unquote(external_id)
+            external_id = external_id.removeprefix(prefix)
 
         if external_id and self._unquote_external_ids:
             external_id = urllib.parse.unquote(external_id)
-        return InstanceId(space, external_id)
+        instance_id = InstanceId(space, external_id)
+        if len(self._instance_id_by_uri) >= self._max_cached_instance_ids:
+            self._instance_id_by_uri.clear()
+        self._instance_id_by_uri[uri] = instance_id
+        return instance_id
 
     def _get_required_capabilities(self) -> list[Capability]:
+        if isinstance(self._space_by_instance_uri, InstanceUriTable):
+            spaces = self._space_by_instance_uri.distinct_values()
+        else:
+            spaces = set(self._space_by_instance_uri.values())
         return [
             DataModelInstancesAcl(
                 actions=[
@@ -597,7 +675,7 @@ class DMSLoader(CDFLoader[dm.InstanceApply]):
                     DataModelInstancesAcl.Action.Write_Properties,
                     DataModelInstancesAcl.Action.Read,
                 ],
-                scope=DataModelInstancesAcl.Scope.SpaceID(sorted(set(self._space_by_instance_uri.values()))),
+                scope=DataModelInstancesAcl.Scope.SpaceID(sorted(spaces)),
             )
         ]
 
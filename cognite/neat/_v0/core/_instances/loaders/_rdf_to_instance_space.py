@@ -1,7 +1,8 @@
 import itertools
 import json
+import sys
 from collections import defaultdict
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 from pathlib import Path
 from typing import cast
 
@@ -23,6 +24,7 @@ from cognite.neat._v0.core._utils.text import NamingStandardization
 from cognite.neat._v0.core._utils.upload import UploadResult
 
 from ._base import _END_OF_CLASS, _START_OF_CLASS, CDFLoader
+from ._uri_table import InstanceUriTable
 
 
 class InstanceSpaceLoader(CDFLoader[dm.SpaceApply]):
@@ -66,18 +68,24 @@ class InstanceSpaceLoader(CDFLoader[dm.SpaceApply]):
         self._lookup_issues = IssueList()
 
         self._has_looked_up = False
-        # This is a dictionary mapping instance URIs to their respective spaces
-        # This is exposed through the property space_by_instance_uri. If the instance_space or space_property is
-        # set (1. and 2.) this is changed to a defaultdict with the instance_space as the default value.
-        self._space_by_instance_uri: dict[URIRef, str] = {}
+        # This is a mapping from instance URIs to their respective spaces
+        # This is exposed through the property space_by_instance_uri. If the instance_space is set (1.) this is
+        # a defaultdict with the instance_space as the default value. Otherwise (2. and 3.), there is an entry
+        # per instance, which is stored in a compact table with the instance_space, if any, as the default value.
+        self._space_by_instance_uri: Mapping[URIRef, str] = {}
+        # The distinct spaces, collected while looking up the spaces to avoid a pass over all instances.
+        self._spaces: set[str] = set()
 
     @property
-    def space_by_instance_uri(self) -> dict[URIRef, str]:
-        """Returns a dictionary mapping instance URIs to their respective spaces."""
+    def space_by_instance_uri(self) -> Mapping[URIRef, str]:
+        """Returns a mapping from instance URIs to their respective spaces."""
+        self._ensure_looked_up()
+        return self._space_by_instance_uri
+
+    def _ensure_looked_up(self) -> None:
         if not self._has_looked_up:
             self._lookup_spaces()
             self._has_looked_up = True
-        return self._space_by_instance_uri
 
     def _get_required_capabilities(self) -> list[Capability]:
         return [
@@ -165,23 +173,23 @@ class InstanceSpaceLoader(CDFLoader[dm.SpaceApply]):
     def _load(
         self, stop_on_exception: bool = False
     ) -> Iterable[dm.SpaceApply | NeatIssue | type[_END_OF_CLASS] | _START_OF_CLASS]:
-        self._lookup_spaces()
+        self._ensure_looked_up()
         if self._lookup_issues.has_errors and stop_on_exception:
             raise self._lookup_issues.as_errors()
         yield from self._lookup_issues
-        seen: set[str] = set()
-        for space_str in set(self.space_by_instance_uri.values()):
-            if space_str in seen or space_str in COGNITE_SPACES:
+        for space_str in self._spaces:
+            if space_str in COGNITE_SPACES:
                 continue
             yield dm.SpaceApply(space=space_str)
-            seen.add(space_str)
 
     def _lookup_spaces(self) -> None:
         # Case 1: Same instance space for all instances:
         if isinstance(self.instance_space, str) and self.space_property is None and self.use_source_space is False:
-            self._space_by_instance_uri = defaultdict(lambda: cast(str, self.instance_space))
+            space_by_instance_uri: dict[URIRef, str] = defaultdict(lambda: cast(str, self.instance_space))
             # Adding a dummy entry to ensure that the instance space is included
-            self._space_by_instance_uri[URIRef(self.instance_space)] = self.instance_space
+            space_by_instance_uri[URIRef(self.instance_space)] = self.instance_space
+            self._space_by_instance_uri = space_by_instance_uri
+            self._spaces.add(self.instance_space)
             return
         if self.graph_store is None:
             raise ValueError("Graph store must be provided to lookup spaces")
@@ -195,27 +203,48 @@ class InstanceSpaceLoader(CDFLoader[dm.SpaceApply]):
                     "Missing fallback instance space. This is required when "
                     f"using space_property='{self.space_property}'"
                 )
-            self._space_by_instance_uri = defaultdict(lambda: cast(str, self.instance_space))
             self._lookup_space_via_property(self.graph_store, self.space_property)
         else:
             raise ValueError("Either 'instance_space', 'space_property', or 'use_source_space' must be provided.")
 
     def _lookup_space_via_instance_uris(self, graph_store: NeatInstanceStore) -> None:
+        """Looks up the space of all subjects and objects in a single pass.
+
+        The space is part of the namespace of the instance URI, and is looked up once per namespace
+        instead of once per instance.
+        """
         instance_iterable = itertools.chain(
             (res[0] for res in graph_store.queries.select.list_instances_ids()),
             graph_store.queries.select.list_instance_object_ids(),
         )
-
+        space_by_instance_uri = InstanceUriTable()
+        space_by_namespace: dict[str, str | None] = {}
+        not_from_cdf: set[URIRef] = set()
         for instance_uri in instance_iterable:
-            namespace, external_id = split_uri(instance_uri)
-            space = namespace_as_space(namespace)
+            # Instances with multiple types, and instances that are both subject and object, are repeated.
+            # These are added to the table once per occurrence, which keeps a single entry.
+            namespace, _ = split_uri(instance_uri)
+            if namespace in space_by_namespace:
+                space = space_by_namespace[namespace]
+            else:
+                space = namespace_as_space(namespace)
+                space = space_by_namespace[namespace] = None if space is None else sys.intern(space)
+                if space is not None:
+                    self._spaces.add(space)
+
             if space is None:
-                error = ResourceCreationError(instance_uri, "instance", "This instance was not extracted from CDF.")
-                self._lookup_issues.append(error)
+                if instance_uri not in not_from_cdf:
+                    error = ResourceCreationError(instance_uri, "instance", "This instance was not extracted from CDF.")
+                    self._lookup_issues.append(error)
+                    not_from_cdf.add(instance_uri)
             else:
-                self._space_by_instance_uri[instance_uri] = space
+                space_by_instance_uri.add(instance_uri, space)
+        self._space_by_instance_uri = space_by_instance_uri
 
     def _lookup_space_via_property(self, graph_store: NeatInstanceStore, space_property: str) -> None:
+        # Instances without the property are in the fallback instance space.
+        space_by_instance_uri = InstanceUriTable(default=self.instance_space)
+        self._space_by_instance_uri = space_by_instance_uri
         properties_by_uriref = graph_store.queries.select.properties()
         space_property_uri = next((k for k, v in properties_by_uriref.items() if v == space_property), None)
         if space_property_uri is None:
@@ -227,23 +256,27 @@ class InstanceSpaceLoader(CDFLoader[dm.SpaceApply]):
             self._lookup_issues.append(error)
             return
 
-        class_with_total_pair = graph_store.queries.select.summarize_instances()
+        class_with_total_pair = graph_store.statistics().summarize_instances()
         total = sum([count for _, count in class_with_total_pair])
         instance_iterable = graph_store.queries.select.list_instances_ids_by_space(space_property_uri)
         instance_iterable = iterate_progress_bar_if_above_config_threshold(
             instance_iterable, total, f"Looking up spaces for {total} instances..."
         )
         neat_prefix = self.neat_prefix_by_predicate_uri.get(space_property_uri)
+        # The values of the space property repeat across instances, thus these are cleaned once per value.
+        clean_space_by_value: dict[str, str] = {}
         warned_spaces: set[str] = set()
-        for instance, space in instance_iterable:
-            if neat_prefix:
-                space = space.removeprefix(neat_prefix)
-
-            clean_space = NamingStandardization.standardize_space_str(space)
-            if clean_space != space and space not in warned_spaces:
-                self._lookup_issues.append(
-                    NeatValueWarning(f"Invalid space in property {space_property}: {space}. Fixed to {clean_space}")
+        for instance, value in instance_iterable:
+            if (clean_space := clean_space_by_value.get(value)) is None:
+                space = value.removeprefix(neat_prefix) if neat_prefix else value
+                clean_space = clean_space_by_value[value] = sys.intern(
+                    NamingStandardization.standardize_space_str(space)
                 )
-                warned_spaces.add(space)
+                if clean_space != space and space not in warned_spaces:
+                    self._lookup_issues.append(
+                        NeatValueWarning(f"Invalid space in property {space_property}: {space}. Fixed to {clean_space}")
+                    )
+                    warned_spaces.add(space)
+                self._spaces.add(clean_space)
 
-            self._space_by_instance_uri[instance] = clean_space
+            space_by_instance_uri.add(instance, clean_space)
@@ -0,0 +1,139 @@
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterator, Mapping, ValuesView
+
+import numpy as np
+from rdflib import URIRef
+
+
+class InstanceUriTable(Mapping[URIRef, str]):
+    """Compact mapping from instance URIs to a few distinct values, for example, the space of each instance.
+
+    A dictionary keyed by URIRefs uses a few hundred bytes per instance. This table interns the namespaces
+    and the values, and stores the rest of each URI in a single contiguous buffer. The entries are sorted by
+    the hash of the URI, and looked up by a binary search, which uses about 30 bytes plus the length of the
+    URI suffix per instance.
+
+    The table is filled with `add`, and sorted on the first lookup. Adding a URI that is already in the table
+    replaces its value, like a dictionary.
+
+    Args:
+        default: The value of URIs that are not in the table. Defaults to None, which raises a KeyError.
+    """
+
+    def __init__(self, default: str | None = None) -> None:
+        self.default = default
+        self._namespaces: list[str] = []
+        self._namespace_id_by_namespace: dict[str, int] = {}
+        self._values: list[str] = []
+        self._value_id_by_value: dict[str, int] = {}
+        # One item per entry, sorted by hash once the table is sorted.
+        self._hashes = array("q")
+        self._namespace_ids = array("I")
+        self._value_ids = array("I")
+        self._rows = array("q")
+        # The URI suffixes in the order they were added, the suffix of row i is
+        # _suffixes[_suffix_offsets[i]:_suffix_offsets[i + 1]].
+        self._suffixes = bytearray()
+        self._suffix_offsets = array("q", [0])
+        self._is_sorted = True
+
+    def add(self, uri: URIRef, value: str) -> None:
+        split_at = max(uri.rfind("#"), uri.rfind("/")) + 1
+        namespace = uri[:split_at]
+        if (namespace_id := self._namespace_id_by_namespace.get(namespace)) is None:
+            namespace_id = self._namespace_id_by_namespace[namespace] = len(self._namespaces)
+            self._namespaces.append(namespace)
+        if (value_id := self._value_id_by_value.get(value)) is None:
+            value_id = self._value_id_by_value[value] = len(self._values)
+            self._values.append(value)
+
+        self._hashes.append(str.__hash__(uri))
+        self._namespace_ids.append(namespace_id)
+        self._value_ids.append(value_id)
+        self._rows.append(len(self._suffix_offsets) - 1)
+        self._suffixes += uri[split_at:].encode("utf-8")
+        self._suffix_offsets.append(len(self._suffixes))
+        self._is_sorted = False
+
+    def __getitem__(self, uri: URIRef) -> str:
+        if (index := self._find(uri)) is not None:
+            return self._values[self._value_ids[index]]
+        if self.default is not None:
+            return self.default
+        raise KeyError(uri)
+
+    def __contains__(self, uri: object) -> bool:
+        return isinstance(uri, str) and self._find(uri) is not None
+
+    def __len__(self) -> int:
+        self._sort()
+        return len(self._hashes)
+
+    def __iter__(self) -> Iterator[URIRef]:
+        self._sort()
+        for index in range(len(self._hashes)):
+            yield self._uri(index)
+
+    def values(self) -> ValuesView[str]:
+        return _TableValuesView(self)
+
+    def distinct_values(self) -> set[str]:
+        """The distinct values in the table, without iterating over the entries."""
+        self._sort()
+        return {self._values[value_id] for value_id in set(self._value_ids)}
+
+    def _uri(self, index: int) -> URIRef:
+        return URIRef(self._key(index))
+
+    def _key(self, index: int) -> str:
+        row = self._rows[index]
+        suffix = self._suffixes[self._suffix_offsets[row] : self._suffix_offsets[row + 1]].decode("utf-8")
+        return self._namespaces[self._namespace_ids[index]] + suffix
+
+    def _find(self, uri: str) -> int | None:
+        if not self._is_sorted:
+            self._sort()
+        hashes = self._hashes
+        hash_ = str.__hash__(uri)
+        index = bisect_left(hashes, hash_)
+        # The table has no duplicates, thus several entries with the same hash are (rare) collisions.
+        while index < len(hashes) and hashes[index] == hash_:
+            # URIRef only equals other URIRefs, thus the plain string comparison.
+            if str.__eq__(self._key(index), uri):
+                return index
+            index += 1
+        return None
+
+    def _sort(self) -> None:
+        if self._is_sorted:
+            return
+        hashes = np.frombuffer(self._hashes, dtype=np.int64)
+        # Stable, such that the last added of equal URIs is last.
+        order = np.argsort(hashes, kind="stable")
+        sorted_hashes = hashes[order]
+        keep = np.ones(len(order), dtype=bool)
+        # Equal URIs have equal hashes, these are rare, so they are compared one by one.
+        for index in np.flatnonzero(sorted_hashes[1:] == sorted_hashes[:-1]):
+            if self._key(int(order[index])) == self._key(int(order[index + 1])):
+                keep[index] = False
+        order = order[keep]
+
+        self._hashes = array("q", hashes[order].tobytes())
+        self._namespace_ids = _take(self._namespace_ids, order)
+        self._value_ids = _take(self._value_ids, order)
+        self._rows = _take(self._rows, order)
+        self._is_sorted = True
+
+
+class _TableValuesView(ValuesView[str]):
+    _mapping: InstanceUriTable
+
+    def __iter__(self) -> Iterator[str]:
+        table = self._mapping
+        table._sort()
+        return map(table._values.__getitem__, table._value_ids)
+
+
+def _take(items: array, order: np.ndarray) -> array:
+    return array(items.typecode, np.frombuffer(items, dtype=items.typecode)[order].tobytes())
@@ -476,3 +476,27 @@ class SelectQueries(BaseQuery):
         }}
         """
         return cast(Iterable[tuple[URIRef, URIRef, URIRef | RdfLiteral]], self.dataset.query(query))
+
+    def count_triples_by_subject_type(self, named_graph: URIRef, type_graph: URIRef) -> dict[URIRef, int]:
+        """Count the triples in a named graph by the type of their subject in another named graph.
+
+        Args:
+            named_graph: URI of the graph with the triples to count.
+            type_graph: URI of the graph to look up the types of the subjects in.
+
+        Returns:
+            Dictionary of type to number of triples.
+        """
+        query = f"""
+        SELECT ?type (COUNT(*) AS ?count)
+        WHERE {{
+        GRAPH <{named_graph}> {{ ?s ?p ?o }}
+        GRAPH <{type_graph}> {{ ?s a ?type }}
+        }}
+        GROUP BY ?type
+        """
+        return {
+            cast(URIRef, type_): int(count)  # type: ignore[call-overload]
+            for type_, count in cast(Iterable[ResultRow], self.dataset.query(query))
+            if isinstance(type_, URIRef)
+        }
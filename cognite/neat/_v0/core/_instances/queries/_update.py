@@ -35,3 +35,26 @@ class UpdateQueries(BaseQuery):
             dropped_types[t] = len(instance_ids)
             remove_instance_ids_in_batch(self.graph(named_graph), instance_ids)
         return dropped_types
+
+    def insert_graph_diff(self, source_graph: URIRef, target_graph: URIRef, diff_graph: URIRef) -> None:
+        """Insert triples that exist in the source graph but not in the target graph into the diff graph.
+
+        This is the same as writing the result of `SelectQueries.get_graph_diff` to the diff graph,
+        but the triples are inserted by the store itself, without passing them through Python.
+
+        Args:
+            source_graph: URI of the graph to compare from.
+            target_graph: URI of the graph to compare against.
+            diff_graph: URI of the graph to insert the triples into.
+        """
+        self.dataset.update(
+            f"""
+        INSERT {{ GRAPH <{diff_graph}> {{ ?s ?p ?o }} }}
+        WHERE {{
+        GRAPH <{source_graph}> {{ ?s ?p ?o }}
+        FILTER NOT EXISTS {{
+            GRAPH <{target_graph}> {{ ?s ?p ?o }}
+        }}
+        }}
+        """
+        )
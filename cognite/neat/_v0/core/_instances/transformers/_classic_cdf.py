@@ -1,8 +1,9 @@
 import urllib.parse
 import warnings
 from abc import ABC
-from collections.abc import Callable, Iterable, Iterator
-from functools import lru_cache
+from array import array
+from collections import deque
+from collections.abc import Callable, Collection, Iterable, Iterator
 from typing import cast
 
 from rdflib import RDF, Graph, Literal, Namespace, URIRef
@@ -11,14 +12,20 @@ from rdflib.query import ResultRow
 from cognite.neat._v0.core._constants import CLASSIC_CDF_NAMESPACE, DEFAULT_NAMESPACE
 from cognite.neat._v0.core._instances import extractors
 from cognite.neat._v0.core._issues.errors import NeatValueError
-from cognite.neat._v0.core._issues.warnings import ResourceNotFoundWarning
-from cognite.neat._v0.core._utils.collection_ import iterate_progress_bar
+from cognite.neat._v0.core._issues.warnings import NeatValueWarning, ResourceNotFoundWarning
+from cognite.neat._v0.core._utils.collection_ import (
+    chunker,
+    iterate_progress_bar,
+    iterate_progress_bar_if_above_config_threshold,
+)
+from cognite.neat._v0.core._utils.graph_transformations_report import GraphTransformationResult
 from cognite.neat._v0.core._utils.rdf_ import (
     Triple,
     add_triples_in_batch,
     get_namespace,
     remove_instance_ids_in_batch,
     remove_namespace_from_uri,
+    remove_triples_in_batch,
 )
 
 from ._base import BaseTransformer, BaseTransformerStandardised, RowTransformationOutput
@@ -28,6 +35,7 @@ class AddAssetDepth(BaseTransformerStandardised):
     description: str = "Adds depth of asset in the asset hierarchy and optionally types asset based on depth"
     _use_only_once: bool = True
     _need_changes = frozenset({str(extractors.AssetsExtractor.__name__)})
+    _batch_size = 10_000
 
     def __init__(
         self,
@@ -40,18 +48,13 @@ class AddAssetDepth(BaseTransformerStandardised):
         self.depth_typing = depth_typing
 
     def _iterate_query(self) -> str:
-        query = """SELECT ?asset (IF(?isRoot, 0, COUNT(?parent)) AS ?parentCount)
-                   WHERE {{
-                        ?asset a <{asset_type}> .
-                        OPTIONAL {{ ?asset <{parent_prop}>+ ?parent . }}
-                        BIND(IF(BOUND(?parent), false, true) AS ?isRoot)}}
-                   GROUP BY ?asset ?isRoot
-                   ORDER BY DESC(?parentCount)"""
+        # All parent edges, not only those of the assets, as the depth is the number of ancestors.
+        return f"""SELECT ?child ?parent
+                   WHERE {{ ?child <{self.parent_prop}> ?parent . }}"""
 
-        return query.format(
-            asset_type=self.asset_type,
-            parent_prop=self.parent_prop,
-        )
+    def _assets_query(self) -> str:
+        return f"""SELECT ?asset
+                   WHERE {{ ?asset a <{self.asset_type}> . }}"""
 
     def _count_query(self) -> str:
         query = """SELECT (COUNT(?asset) as ?count)
@@ -73,6 +76,127 @@ class AddAssetDepth(BaseTransformerStandardised):
 
         return row_output
 
+    def _iterator(self, graph: Graph, depth_by_asset: dict[URIRef, int] | None = None) -> Iterator:
+        if depth_by_asset is None:
+            depth_by_asset = self._depth_by_asset(graph)
+        for asset, depth in depth_by_asset.items():
+            yield asset, Literal(depth)
+
+    def transform(self, graph: Graph) -> GraphTransformationResult:
+        outcome = GraphTransformationResult(self.__class__.__name__)
+        outcome.added = outcome.modified = outcome.removed = 0
+
+        depth_by_asset = self._depth_by_asset(graph)
+        outcome.affected_nodes_count = len(depth_by_asset)
+        if not depth_by_asset:
+            return outcome
+
+        result_iterable = iterate_progress_bar_if_above_config_threshold(
+            self._iterator(graph, depth_by_asset), len(depth_by_asset), self.description
+        )
+        add_triples: set[Triple] = set()
+        remove_triples: set[Triple] = set()
+        for row in result_iterable:
+            row_output = self.operation(cast(ResultRow, row))
+            outcome.modified += row_output.instances_modified_count
+            add_triples.update(row_output.add_triples)
+            remove_triples.update(row_output.remove_triples)
+            if len(add_triples) >= self._batch_size:
+                self._write_batch(graph, add_triples, remove_triples)
+        self._write_batch(graph, add_triples, remove_triples)
+        return outcome
+
+    def _write_batch(self, graph: Graph, add_triples: set[Triple], remove_triples: set[Triple]) -> None:
+        add_triples_in_batch(graph, add_triples, self._batch_size)
+        remove_triples_in_batch(graph, remove_triples, self._batch_size)
+        add_triples.clear()
+        remove_triples.clear()
+
+    def _depth_by_asset(self, graph: Graph) -> dict[URIRef, int]:
+        """The depth of an asset is the number of its ancestors, following the parent property.
+
+        The parent edges are read once into integer-indexed arrays, and the depths are computed with a
+        breadth-first search from the roots, which is linear in the number of edges. Nodes that are not
+        reached from a root, that is, nodes with several parents or in/below a cycle, fall back to counting
+        their distinct ancestors.
+        """
+        index_by_node: dict[URIRef, int] = {}
+        child_indices = array("q")
+        parent_indices = array("q")
+        for child, parent in graph.query(self._iterate_query()):  # type: ignore[misc]
+            child_indices.append(index_by_node.setdefault(cast(URIRef, child), len(index_by_node)))
+            parent_indices.append(index_by_node.setdefault(cast(URIRef, parent), len(index_by_node)))
+
+        node_count = len(index_by_node)
+        parent_count = array("q", bytes(8 * node_count))
+        for child in child_indices:
+            parent_count[child] += 1
+        # Children of each node in compressed sparse row format, the children of node i are
+        # children[child_offset[i]:child_offset[i + 1]].
+        child_offset = array("q", bytes(8 * (node_count + 1)))
+        for parent in parent_indices:
+            child_offset[parent + 1] += 1
+        for i in range(node_count):
+            child_offset[i + 1] += child_offset[i]
+        children = array("q", bytes(8 * len(child_indices)))
+        insert_at = array("q", child_offset[:-1])
+        for child, parent in zip(child_indices, parent_indices, strict=True):
+            children[insert_at[parent]] = child
+            insert_at[parent] += 1
+
+        depth = array("q", [-1]) * node_count
+        queue: deque[int] = deque()
+        for i in range(node_count):
+            if parent_count[i] == 0:
+                depth[i] = 0
+                queue.append(i)
+        while queue:
+            node = queue.popleft()
+            for child in children[child_offset[node] : child_offset[node + 1]]:
+                if parent_count[child] == 1:
+                    depth[child] = depth[node] + 1
+                    queue.append(child)
+
+        depth_by_asset: dict[URIRef, int] = {}
+        parents_by_node: dict[int, list[int]] | None = None
+        in_cycle_count = 0
+        for (asset,) in graph.query(self._assets_query()):  # type: ignore[misc]
+            asset = cast(URIRef, asset)
+            if (i := index_by_node.get(asset)) is None:
+                # No parent and no children
+                depth_by_asset[asset] = 0
+            elif depth[i] >= 0:
+                depth_by_asset[asset] = depth[i]
+            else:
+                if parents_by_node is None:
+                    parents_by_node = {}
+                    for child, parent in zip(child_indices, parent_indices, strict=True):
+                        parents_by_node.setdefault(child, []).append(parent)
+                ancestors = self._ancestors(i, parents_by_node)
+                in_cycle_count += i in ancestors
+                depth_by_asset[asset] = len(ancestors)
+        if in_cycle_count:
+            warnings.warn(
+                NeatValueWarning(
+                    f"Detected {in_cycle_count} assets in a cycle of {remove_namespace_from_uri(self.parent_prop)}. "
+                    "Their depth is the number of distinct ancestors, including themselves."
+                ),
+                stacklevel=2,
+            )
+        return depth_by_asset
+
+    @staticmethod
+    def _ancestors(node: int, parents_by_node: dict[int, list[int]]) -> Collection[int]:
+        ancestors: set[int] = set()
+        to_check = list(parents_by_node.get(node, []))
+        while to_check:
+            parent = to_check.pop()
+            if parent in ancestors:
+                continue
+            ancestors.add(parent)
+            to_check.extend(parents_by_node.get(parent, []))
+        return ancestors
+
 
 class BaseAssetConnector(BaseTransformerStandardised, ABC):
     description: str = "Connects assets to other cognite resources, thus forming bi-directional connection"
@@ -301,6 +425,44 @@ class AssetRelationshipConnector(BaseTransformerStandardised):
         return row_output
 
 
+class _EntityByExternalIdIndex:
+    """Lookup of entities by (type, externalId) built with a single scan of the externalId triples.
+
+    This replaces one SPARQL query per lookup, which is prohibitively slow when resolving the source and
+    target of millions of relationships.
+
+    Args:
+        graph: The graph to index.
+        namespace: The namespace of the externalId property.
+    """
+
+    _entities_query = """SELECT ?entity ?type ?externalId
+WHERE {{
+    ?entity <{namespace}externalId> ?externalId .
+    ?entity a ?type .
+}}"""
+
+    def __init__(self, graph: Graph, namespace: Namespace) -> None:
+        # None marks an ambiguous (type, externalId) pair, that is, more than one entity has it.
+        self._entity_by_type_external_id: dict[tuple[URIRef, str], URIRef | None] = {}
+        for entity, type_, external_id in graph.query(self._entities_query.format(namespace=namespace)):  # type: ignore[misc]
+            if not isinstance(external_id, Literal):
+                continue
+            key = (cast(URIRef, type_), str(external_id))
+            if key in self._entity_by_type_external_id and self._entity_by_type_external_id[key] != entity:
+                self._entity_by_type_external_id[key] = None
+            else:
+                self._entity_by_type_external_id[key] = cast(URIRef, entity)
+
+    def lookup(self, entity_type: URIRef, external_id: str) -> URIRef:
+        if (entity := self._entity_by_type_external_id.get((entity_type, external_id))) is None:
+            raise ValueError(f"Could not find entity with external_id {external_id} and type {entity_type}")
+        return entity
+
+    def __len__(self) -> int:
+        return len(self._entity_by_type_external_id)
+
+
 # TODO: standardise
 class RelationshipAsEdgeTransformer(BaseTransformer):
     """Converts relationships into edges in the graph.
@@ -339,12 +501,13 @@ class RelationshipAsEdgeTransformer(BaseTransformer):
 
     _count_by_source_target = """PREFIX classic: <{namespace}>
 
-SELECT (COUNT(?instance) AS ?instanceCount)
+SELECT ?sourceType ?targetType (COUNT(?instance) AS ?instanceCount)
 WHERE {{
   ?instance a classic:Relationship .
-  ?instance classic:sourceType classic:{source_type} .
-  ?instance classic:targetType classic:{target_type} .
-}}"""
+  ?instance classic:sourceType ?sourceType .
+  ?instance classic:targetType ?targetType .
+}}
+GROUP BY ?sourceType ?targetType"""
 
     _instances = """PREFIX classic: <{namespace}>
 
@@ -354,72 +517,63 @@ WHERE {{
     ?instance classic:sourceType classic:{source_type} .
     ?instance classic:targetType classic:{target_type} .
 }}"""
-    _lookup_entity_query = """PREFIX classic: <{namespace}>
-
-SELECT ?entity
-WHERE {{
-    ?entity a classic:{entity_type} .
-    ?entity classic:externalId "{external_id}" .
-}}"""
 
     @staticmethod
     def create_lookup_entity_with_external_id(graph: Graph, namespace: Namespace) -> Callable[[str, str], URIRef]:
-        @lru_cache(maxsize=10_000)
+        index = _EntityByExternalIdIndex(graph, namespace)
+
         def lookup_entity_with_external_id(entity_type: str, external_id: str) -> URIRef:
-            query = RelationshipAsEdgeTransformer._lookup_entity_query.format(
-                namespace=namespace, entity_type=entity_type, external_id=external_id
-            )
-            result = list(graph.query(query))
-            if len(result) == 1:
-                return cast(URIRef, result[0][0])  # type: ignore[index]
-            raise ValueError(f"Could not find entity with external_id {external_id} and type {entity_type}")
+            # The external id is passed as the literal object of the relationship triple.
+            return index.lookup(namespace[entity_type], str(external_id))
 
         return lookup_entity_with_external_id
 
     def transform(self, graph: Graph) -> None:
-        lookup_entity_with_external_id = self.create_lookup_entity_with_external_id(graph, self._namespace)
+        count_by_source_target: dict[tuple[URIRef, URIRef], int] = {}
+        for source_type, target_type, instance_count in graph.query(  # type: ignore[misc]
+            self._count_by_source_target.format(namespace=self._namespace)
+        ):
+            count_by_source_target[(source_type, target_type)] = int(instance_count)  # type: ignore[index, arg-type]
+
+        lookup_entity_with_external_id: Callable[[str, str], URIRef] | None = None
         for source_type in self._RELATIONSHIP_NODE_TYPES:
             for target_type in self._RELATIONSHIP_NODE_TYPES:
-                query = self._count_by_source_target.format(
-                    namespace=self._namespace, source_type=source_type, target_type=target_type
+                instance_count = count_by_source_target.get(
+                    (self._namespace[source_type], self._namespace[target_type]), 0
                 )
-                for instance_count_res in graph.query(query):
-                    instance_count = int(instance_count_res[0])  # type: ignore[index, arg-type]
-                    if instance_count < self._min_relationship_types:
-                        continue
-                    edge_triples = self._edge_triples(
-                        graph, source_type, target_type, instance_count, lookup_entity_with_external_id
-                    )
-                    add_triples_in_batch(graph, edge_triples)
+                if instance_count == 0 or instance_count < self._min_relationship_types:
+                    continue
+                if lookup_entity_with_external_id is None:
+                    # Built once, and only if there are relationships to convert.
+                    lookup_entity_with_external_id = self.create_lookup_entity_with_external_id(graph, self._namespace)
+                edge_triples = self._edge_triples(graph, source_type, target_type, lookup_entity_with_external_id)
+                add_triples_in_batch(graph, edge_triples)
 
     def _edge_triples(
         self,
         graph: Graph,
         source_type: str,
         target_type: str,
-        instance_count: int,
         lookup_entity_with_external_id: Callable[[str, str], URIRef],
     ) -> Iterable[Triple]:
         query = self._instances.format(namespace=self._namespace, source_type=source_type, target_type=target_type)
-        total_instance_count = instance_count if self._limit_per_type is None else self._limit_per_type
 
-        converted_relationships: list[URIRef] = []
-        for no, result in enumerate(
-            iterate_progress_bar(graph.query(query), total=total_instance_count, description="Relationships to edges")
-        ):
-            if self._limit_per_type is not None and no >= self._limit_per_type:
-                break
-            relationship_id = cast(URIRef, result[0])  # type: ignore[index, misc]
-            yield from self._relationship_as_edge(
-                graph, relationship_id, source_type, target_type, lookup_entity_with_external_id
-            )
-            converted_relationships.append(relationship_id)
-
-            if len(converted_relationships) >= 1_000:
-                remove_instance_ids_in_batch(graph, converted_relationships)
-                converted_relationships = []
+        relationship_ids = [cast(URIRef, result[0]) for result in graph.query(query)]  # type: ignore[index, misc]
+        if self._limit_per_type is not None:
+            relationship_ids = relationship_ids[: self._limit_per_type]
 
-        remove_instance_ids_in_batch(graph, converted_relationships)
+        batch_size = 1_000
+        for batch in iterate_progress_bar(
+            chunker(relationship_ids, batch_size),
+            # The number of batches, not of relationships, as the progress bar advances per batch.
+            total=(len(relationship_ids) + batch_size - 1) // batch_size,
+            description="Relationships to edges",
+        ):
+            for relationship_id in batch:
+                yield from self._relationship_as_edge(
+                    graph, relationship_id, source_type, target_type, lookup_entity_with_external_id
+                )
+            remove_instance_ids_in_batch(graph, batch)
 
     def _relationship_as_edge(
         self,
@@ -429,10 +583,13 @@ WHERE {{
         target_type: str,
         lookup_entity_with_external_id: Callable[[str, str], URIRef],
     ) -> list[Triple]:
-        relationship_triples = cast(list[Triple], list(graph.query(f"DESCRIBE <{relationship_id}>")))
         object_by_predicates = cast(
             dict[str, URIRef | Literal],
-            {remove_namespace_from_uri(row[1]): row[2] for row in relationship_triples if row[1] != RDF.type},
+            {
+                remove_namespace_from_uri(predicate): object_
+                for predicate, object_ in graph.predicate_objects(relationship_id)
+                if predicate != RDF.type
+            },
         )
         source_external_id = cast(URIRef, object_by_predicates["sourceExternalId"])
         target_source_id = cast(URIRef, object_by_predicates["targetExternalId"])
@@ -457,15 +614,6 @@ WHERE {{
             object_by_predicates, edge_id, source_id, target_id, self._predicate(target_type), edge_type
         )
 
-    def _lookup_entity(self, graph: Graph, entity_type: str, external_id: str) -> URIRef:
-        query = self._lookup_entity_query.format(
-            namespace=self._namespace, entity_type=entity_type, external_id=external_id
-        )
-        result = list(graph.query(query))
-        if len(result) == 1:
-            return cast(URIRef, result[0][0])  # type: ignore[index]
-        raise ValueError(f"Could not find entity with external_id {external_id} and type {entity_type}")
-
     def _create_edge(
         self,
         objects_by_predicates: dict[str, URIRef | Literal],
@@ -512,12 +660,6 @@ class LookupRelationshipSourceTarget(BaseTransformerStandardised):
     _use_only_once: bool = True
     _need_changes = frozenset({extractors.RelationshipsExtractor.__name__})
 
-    _lookup_entity_query = """SELECT ?entity
-    WHERE {{
-        ?entity a <{entity_type}> .
-        ?entity <{namespace}externalId> "{external_id}" .
-    }}"""
-
     def __init__(self, namespace: Namespace = CLASSIC_CDF_NAMESPACE, type_prefix: str | None = None) -> None:
         self._namespace = namespace
         self._type_prefix = type_prefix
@@ -551,13 +693,13 @@ WHERE {{
         if self._lookup_entity is None:
             raise NeatValueError(f"{type(self)}: .operation() called before .transform()")
         try:
-            source_id = self._lookup_entity(source_type, source.toPython())
+            source_id = self._lookup_entity(source_type, str(source.toPython()))
         except ValueError:
             warnings.warn(ResourceNotFoundWarning(source, "class", str(instance), "class"), stacklevel=2)
             return output
 
         try:
-            target_id = self._lookup_entity(target_type, target.toPython())
+            target_id = self._lookup_entity(target_type, str(target.toPython()))
         except ValueError:
             warnings.warn(ResourceNotFoundWarning(target, "class", str(instance), "class"), stacklevel=2)
             return output
@@ -573,17 +715,14 @@ WHERE {{
     def create_lookup_entity_with_external_id(
         graph: Graph, namespace: Namespace, type_prefix: str | None
     ) -> Callable[[URIRef, str], URIRef]:
-        @lru_cache(maxsize=10_000)
+        index = _EntityByExternalIdIndex(graph, namespace)
+        prefixed_type_by_type: dict[URIRef, URIRef] = {}
+
         def lookup_entity_with_external_id(entity_type: URIRef, external_id: str) -> URIRef:
             if type_prefix:
-                entity_type = namespace[type_prefix + remove_namespace_from_uri(entity_type)]
-
-            query = LookupRelationshipSourceTarget._lookup_entity_query.format(
-                namespace=namespace, entity_type=entity_type, external_id=external_id
-            )
-            result = list(graph.query(query))
-            if len(result) == 1:
-                return cast(URIRef, result[0][0])  # type: ignore[index]
-            raise ValueError(f"Could not find entity with external_id {external_id} and type {entity_type}")
+                if entity_type not in prefixed_type_by_type:
+                    prefixed_type_by_type[entity_type] = namespace[type_prefix + remove_namespace_from_uri(entity_type)]
+                entity_type = prefixed_type_by_type[entity_type]
+            return index.lookup(entity_type, external_id)
 
         return lookup_entity_with_external_id
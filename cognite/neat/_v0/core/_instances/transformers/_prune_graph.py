@@ -1,16 +1,68 @@
-from typing import Any, cast
+from collections import Counter
+from collections.abc import Iterable
+from typing import cast
 
-from rdflib import Graph, Namespace, URIRef
+from rdflib import RDF, Graph, Namespace, URIRef
 from rdflib.query import ResultRow
 
 from cognite.neat._v0.core._constants import DEFAULT_NAMESPACE
 from cognite.neat._v0.core._shared import Triple
-from cognite.neat._v0.core._utils.rdf_ import as_neat_compliant_uri
+from cognite.neat._v0.core._utils.collection_ import iterate_progress_bar_if_above_config_threshold
+from cognite.neat._v0.core._utils.graph_transformations_report import GraphTransformationResult
+from cognite.neat._v0.core._utils.rdf_ import (
+    add_triples_in_batch,
+    as_neat_compliant_uri,
+    remove_instance_ids_in_batch,
+    remove_triples_in_batch,
+)
 from cognite.neat._v0.core._utils.text import sentence_or_string_to_camel
 
 from ._base import BaseTransformer, BaseTransformerStandardised, RowTransformationOutput
 
 
+class _NodeIndex:
+    """Index of the nodes in a graph built with a single scan of its triples.
+
+    The pruning transformers use this to compute the nodes and edges to remove, instead of running one
+    FILTER NOT EXISTS query, which is an anti-join, per type or row.
+
+    Args:
+        graph: The graph to index.
+    """
+
+    def __init__(self, graph: Graph) -> None:
+        # Nodes with at least one outgoing triple
+        self.subjects: set[URIRef] = set()
+        self.typed_subjects: set[URIRef] = set()
+        # Objects of the triples which are not rdf:type, that is, the nodes that are pointed to by an edge
+        self.edge_objects: set[URIRef] = set()
+
+        for subject, predicate, object_ in graph.triples((None, None, None)):
+            self.subjects.add(cast(URIRef, subject))
+            if predicate == RDF.type:
+                self.typed_subjects.add(cast(URIRef, subject))
+            elif isinstance(object_, URIRef):
+                self.edge_objects.add(object_)
+
+    @property
+    def untyped_subjects(self) -> set[URIRef]:
+        return self.subjects - self.typed_subjects
+
+    @property
+    def dead_end_objects(self) -> set[URIRef]:
+        """Nodes that are pointed to by an edge, but which have no triples themselves."""
+        return self.edge_objects - self.subjects
+
+
+def _in_degree(graph: Graph, nodes: Iterable[URIRef]) -> Counter[URIRef]:
+    """Counts the incoming triples of the given nodes, using the object index of the graph instead of a scan."""
+    in_degree: Counter[URIRef] = Counter()
+    for node in nodes:
+        for _ in graph.triples((None, None, node)):
+            in_degree[node] += 1
+    return in_degree
+
+
 # TODO: Standardise after figuring out the bug which appears when running test_iodd_transformers.py
 class AttachPropertyFromTargetToSource(BaseTransformer):
     """
@@ -71,20 +123,6 @@ class AttachPropertyFromTargetToSource(BaseTransformer):
 
     description: str = "Attaches a target property from a target node that is connected to a source node."
 
-    _query_template_use_case_a: str = """
-    SELECT ?sourceNode ?sourceProperty ?targetNode ?newSourceProperty ?newSourcePropertyValue WHERE {{
-        ?sourceNode ?sourceProperty ?targetNode .
-        BIND( <{target_property}> as ?newSourceProperty ) .
-        ?targetNode a <{target_node_type}> .
-        ?targetNode <{target_property}> ?newSourcePropertyValue . }}"""
-
-    _query_template_use_case_b: str = """
-    SELECT ?sourceNode ?sourceProperty ?targetNode ?newSourceProperty ?newSourcePropertyValue WHERE {{
-        ?sourceNode ?sourceProperty ?targetNode .
-        ?targetNode a <{target_node_type}> .
-        ?targetNode <{target_property_holding_new_property_name}> ?newSourceProperty .
-        ?targetNode <{target_property}> ?newSourcePropertyValue . }}"""
-
     def __init__(
         self,
         target_node_type: URIRef,
@@ -102,27 +140,19 @@ class AttachPropertyFromTargetToSource(BaseTransformer):
         self.namespace = namespace or DEFAULT_NAMESPACE
 
     def transform(self, graph: Graph) -> None:
-        nodes_to_delete: list[Any] = []
-
-        if self.target_property_holding_new_property is not None:
-            query = self._query_template_use_case_b.format(
-                target_node_type=self.target_node_type,
-                target_property_holding_new_property_name=self.target_property_holding_new_property,
-                target_property=self.target_property,
-            )
-        else:
-            query = self._query_template_use_case_a.format(
-                target_node_type=self.target_node_type,
-                target_property=self.target_property,
-            )
+        # The last operation on each triple, True for add and False for remove. Only the last operation
+        # decides whether a triple is in the graph, thus the changes can be written in batches with the
+        # same result as applying them row by row.
+        is_added_by_triple: dict[Triple, bool] = {}
+        nodes_to_delete: set[URIRef] = set()
 
-        for (  # type: ignore
+        for (
             source_node,
             old_predicate,
             target_node,
             new_predicate_value,
             new_property_value,
-        ) in graph.query(query):
+        ) in self._iterate_rows(graph):
             if self.target_property_holding_new_property is not None:
                 # Ensure new predicate is URI compliant as we are creating a new predicate
                 new_predicate_value_string = sentence_or_string_to_camel(str(new_predicate_value))
@@ -131,25 +161,57 @@ class AttachPropertyFromTargetToSource(BaseTransformer):
                 # this assign seems dangerous
                 predicate = old_predicate  # type: ignore
             # Create new connection from source node to value
-            graph.add(
-                (
-                    source_node,
-                    predicate,
-                    (self.namespace[new_property_value] if self.convert_literal_to_uri else new_property_value),
-                )
+            new_triple = (
+                source_node,
+                predicate,
+                (self.namespace[new_property_value] if self.convert_literal_to_uri else new_property_value),
             )
+            is_added_by_triple[new_triple] = True
             # Remove old relationship between source node and destination node
-            graph.remove((source_node, old_predicate, target_node))
-
-            nodes_to_delete.append(target_node)
+            old_triple = (source_node, old_predicate, target_node)
+            is_added_by_triple[old_triple] = False
+
+            nodes_to_delete.add(target_node)
+
+        add_triples_in_batch(graph, (triple for triple, is_added in is_added_by_triple.items() if is_added))
+        remove_triples_in_batch(graph, (triple for triple, is_added in is_added_by_triple.items() if not is_added))
+
+        if self.delete_target_node and nodes_to_delete:
+            # Triples with edges to the target nodes, and the target nodes and their properties,
+            # found with a single scan instead of one scan per target node.
+            remove_triples_in_batch(
+                graph,
+                [
+                    triple
+                    for triple in graph.triples((None, None, None))
+                    if triple[0] in nodes_to_delete or triple[2] in nodes_to_delete
+                ],
+            )
 
-        # this seems a bit funky. Need to check further.
-        if self.delete_target_node:
-            for target_node in nodes_to_delete:
-                # Remove triples with edges to target_node
-                graph.remove((None, None, target_node))  # type: ignore
-                # Remove target node triple and its properties
-                graph.remove((target_node, None, None))  # type: ignore
+    def _iterate_rows(self, graph: Graph) -> Iterable[tuple]:
+        """Yields (source node, source property, target node, new source property, new source property value).
+
+        This is the same as the SPARQL join
+            ?sourceNode ?sourceProperty ?targetNode .
+            ?targetNode a <target_node_type> .
+            ?targetNode <target_property_holding_new_property> ?newSourceProperty .
+            ?targetNode <target_property> ?newSourcePropertyValue .
+        but starting from the target nodes and using index lookups, instead of joining all triples in the graph.
+        """
+        for target_node in set(graph.subjects(RDF.type, self.target_node_type)):
+            values = list(graph.objects(target_node, self.target_property))
+            if not values:
+                continue
+            if self.target_property_holding_new_property is None:
+                new_predicates = [self.target_property]
+            else:
+                new_predicates = list(graph.objects(target_node, self.target_property_holding_new_property))
+            if not new_predicates:
+                continue
+            for source_node, source_property in list(graph.subject_predicates(target_node)):
+                for new_predicate in new_predicates:
+                    for value in values:
+                        yield source_node, source_property, target_node, new_predicate, value
 
 
 # TODO: Remove or adapt IODD
@@ -189,9 +251,23 @@ class PruneDanglingNodes(BaseTransformer):
         self.node_prune_types = node_prune_types
 
     def transform(self, graph: Graph) -> None:
-        for type_ in self.node_prune_types:
-            for (subject,) in list(graph.query(self._query_template.format(rdf_type=type_))):  # type: ignore
-                graph.remove((subject, None, None))
+        nodes_by_type = {
+            type_: {cast(URIRef, node) for node in graph.subjects(RDF.type, type_)} for type_ in self.node_prune_types
+        }
+        candidates = set().union(*nodes_by_type.values())
+        if not candidates:
+            return
+        in_degree = _in_degree(graph, candidates)
+        for nodes in nodes_by_type.values():
+            # Equivalent to FILTER NOT EXISTS { ?s ?p ?subject }. Removing a dangling node can make the nodes it
+            # points to dangling, which are then pruned if they are of one of the following types.
+            dangling = [node for node in nodes if in_degree[node] == 0 and node in candidates]
+            for node in dangling:
+                for object_ in graph.objects(node, None):
+                    if object_ in in_degree:
+                        in_degree[cast(URIRef, object_)] -= 1
+            candidates.difference_update(dangling)
+            remove_instance_ids_in_batch(graph, dangling)
 
 
 class PruneTypes(BaseTransformerStandardised):
@@ -279,6 +355,25 @@ class PruneDeadEndEdges(BaseTransformerStandardised):
 
         return row_output
 
+    def _iterator(self, graph: Graph) -> Iterable:
+        for object_ in _NodeIndex(graph).dead_end_objects:
+            for subject, predicate, _ in graph.triples((None, None, object_)):
+                if predicate != RDF.type:
+                    yield subject, predicate, object_
+
+    def transform(self, graph: Graph) -> GraphTransformationResult:
+        outcome = GraphTransformationResult(self.__class__.__name__)
+        outcome.added = outcome.modified = outcome.removed = 0
+
+        dead_end_edges = list(self._iterator(graph))
+        outcome.affected_nodes_count = len(dead_end_edges)
+        for row in iterate_progress_bar_if_above_config_threshold(
+            dead_end_edges, len(dead_end_edges), self.description
+        ):
+            outcome.modified += self.operation(cast(ResultRow, row)).instances_modified_count
+        remove_triples_in_batch(graph, dead_end_edges)
+        return outcome
+
 
 class PruneInstancesOfUnknownType(BaseTransformerStandardised):
     """
@@ -313,3 +408,16 @@ class PruneInstancesOfUnknownType(BaseTransformerStandardised):
         row_output.instances_removed_count = 1
 
         return row_output
+
+    def transform(self, graph: Graph) -> GraphTransformationResult:
+        outcome = GraphTransformationResult(self.__class__.__name__)
+        outcome.added = outcome.modified = outcome.removed = 0
+
+        untyped_subjects = _NodeIndex(graph).untyped_subjects
+        outcome.affected_nodes_count = len(untyped_subjects)
+        outcome.removed = len(untyped_subjects)
+        remove_instance_ids_in_batch(
+            graph,
+            iterate_progress_bar_if_above_config_threshold(untyped_subjects, len(untyped_subjects), self.description),
+        )
+        return outcome
@@ -1,5 +1,6 @@
 import warnings
-from collections.abc import Callable, Iterator
+from collections import defaultdict
+from collections.abc import Callable, Iterator, Set
 from typing import Any, cast
 from urllib.parse import quote
 
@@ -10,7 +11,16 @@ from rdflib.query import ResultRow
 from cognite.neat._v0.core._constants import NEAT
 from cognite.neat._v0.core._issues.warnings import PropertyDataTypeConversionWarning
 from cognite.neat._v0.core._utils.auxiliary import string_to_ideal_type
-from cognite.neat._v0.core._utils.rdf_ import Triple, get_namespace, remove_namespace_from_uri, uri_to_cdf_id
+from cognite.neat._v0.core._utils.collection_ import iterate_progress_bar_if_above_config_threshold
+from cognite.neat._v0.core._utils.graph_transformations_report import GraphTransformationResult
+from cognite.neat._v0.core._utils.rdf_ import (
+    Triple,
+    add_triples_in_batch,
+    get_namespace,
+    remove_namespace_from_uri,
+    remove_triples_in_batch,
+    uri_to_cdf_id,
+)
 
 from ._base import BaseTransformerStandardised, RowTransformationOutput
 
@@ -22,16 +32,16 @@ class SplitMultiValueProperty(BaseTransformerStandardised):
     )
     _use_only_once: bool = True
     _need_changes = frozenset({})
+    _batch_size: int = 10_000
 
     def __init__(self, unknown_type: URIRef | None = None) -> None:
         self.unknown_type = unknown_type or NEAT.UnknownType
 
     def _iterate_query(self) -> str:
-        query = """SELECT ?subjectType ?property
-                          (GROUP_CONCAT(DISTINCT STR(?valueType); SEPARATOR=",") AS ?valueTypes)
+        query = """SELECT ?subjectType ?s ?p ?o ?valueType
 
                    WHERE {{
-                       ?s ?property ?o .
+                       ?s ?p ?o .
                        ?s a ?subjectType .
                        OPTIONAL {{ ?o a ?type }}
 
@@ -39,10 +49,7 @@ class SplitMultiValueProperty(BaseTransformerStandardised):
                        BIND(   IF(isLiteral(?o),DATATYPE(?o),
                                IF(BOUND(?type), ?type,
                                                <{unknownType}>)) AS ?valueType)
-                   }}
-
-                   GROUP BY ?subjectType ?property
-                   HAVING (COUNT(DISTINCT ?valueType) > 1)"""
+                   }}"""
 
         return query.format(unknownType=self.unknown_type)
 
@@ -51,27 +58,78 @@ class SplitMultiValueProperty(BaseTransformerStandardised):
                    WHERE {?s ?p ?o .}"""
         return query
 
-    def _sub_iterate_query(self, type_: URIRef, property_: URIRef) -> str:
-        query = """ SELECT ?s ?p ?o ?valueType WHERE {{
-                           ?s a <{subject_uri}> .
-                           ?s <{property_uri}> ?o .
-
-                           OPTIONAL {{ ?o a ?type }}
+    def _value_type_statistics_query(self) -> str:
+        query = """SELECT ?subjectType ?property ?valueType (COUNT(?o) AS ?occurrence)
 
-                           BIND(<{property_uri}> AS ?p)
+                   WHERE {{
+                       ?s ?property ?o .
+                       ?s a ?subjectType .
+                       OPTIONAL {{ ?o a ?type }}
 
-                           BIND(IF(isLiteral(?o),  DATATYPE(?o),
-                                   IF(BOUND(?type),?type,
-                                                   <{unknownType}>)) AS ?valueType)
+                       BIND(   IF(isLiteral(?o),DATATYPE(?o),
+                               IF(BOUND(?type), ?type,
+                                               <{unknownType}>)) AS ?valueType)
+                   }}
 
-                                               }} """
+                   GROUP BY ?subjectType ?property ?valueType"""
 
-        return query.format(unknownType=self.unknown_type, subject_uri=type_, property_uri=property_)
+        return query.format(unknownType=self.unknown_type)
 
-    def _iterator(self, graph: Graph) -> Iterator:
-        # this method is doing some funky stuff, we should review this.
-        for type_, property_, _ in graph.query(self._iterate_query()):  # type: ignore
-            yield from graph.query(self._sub_iterate_query(type_, property_))  # type: ignore
+    def _multi_value_type_pairs(self, graph: Graph) -> dict[tuple[URIRef, URIRef], int]:
+        """Collects value type statistics for all (type, property) pairs in a single scan.
+
+        Returns:
+            The number of triples per (type, property) pair that has more than one value type.
+        """
+        value_types_by_pair: dict[tuple[URIRef, URIRef], set[URIRef]] = defaultdict(set)
+        occurrence_by_pair: dict[tuple[URIRef, URIRef], int] = defaultdict(int)
+        for subject_type, property_, value_type, occurrence in graph.query(self._value_type_statistics_query()):  # type: ignore[misc]
+            pair = cast(tuple[URIRef, URIRef], (subject_type, property_))
+            value_types_by_pair[pair].add(cast(URIRef, value_type))
+            occurrence_by_pair[pair] += int(occurrence)  # type: ignore[arg-type]
+        return {
+            pair: occurrence_by_pair[pair] for pair, value_types in value_types_by_pair.items() if len(value_types) > 1
+        }
+
+    def _iterator(self, graph: Graph, pairs: Set[tuple[URIRef, URIRef]] | None = None) -> Iterator:
+        if pairs is None:
+            pairs = self._multi_value_type_pairs(graph).keys()
+        if not pairs:
+            return
+        for subject_type, subject, property_, object_, value_type in graph.query(self._iterate_query()):  # type: ignore[misc]
+            if (subject_type, property_) in pairs:
+                yield subject, property_, object_, value_type
+
+    def transform(self, graph: Graph) -> GraphTransformationResult:
+        outcome = GraphTransformationResult(self.__class__.__name__)
+        outcome.added = outcome.modified = outcome.removed = 0
+
+        count_by_pair = self._multi_value_type_pairs(graph)
+        outcome.affected_nodes_count = sum(count_by_pair.values())
+        if not count_by_pair:
+            return outcome
+
+        result_iterable = iterate_progress_bar_if_above_config_threshold(
+            self._iterator(graph, count_by_pair.keys()), outcome.affected_nodes_count, self.description
+        )
+        add_triples: set[Triple] = set()
+        remove_triples: set[Triple] = set()
+        for row in result_iterable:
+            row_output = self.operation(cast(ResultRow, row))
+            outcome.modified += row_output.instances_modified_count
+            add_triples.update(row_output.add_triples)
+            remove_triples.update(row_output.remove_triples)
+            if len(remove_triples) >= self._batch_size:
+                self._write_batch(graph, add_triples, remove_triples)
+
+        self._write_batch(graph, add_triples, remove_triples)
+        return outcome
+
+    def _write_batch(self, graph: Graph, add_triples: set[Triple], remove_triples: set[Triple]) -> None:
+        add_triples_in_batch(graph, add_triples, self._batch_size)
+        remove_triples_in_batch(graph, remove_triples, self._batch_size)
+        add_triples.clear()
+        remove_triples.clear()
 
     def operation(self, query_result_row: ResultRow) -> RowTransformationOutput:
         row_output = RowTransformationOutput()
@@ -26,7 +26,7 @@ from cognite.neat._v0.core._instances.extractors import (
     DMSGraphExtractor,
     KnowledgeGraphExtractor,
 )
-from cognite.neat._v0.core._issues import IssueList, catch_issues
+from cognite.neat._v0.core._issues import IssueList, catch_issues, catch_warnings
 from cognite.neat._v0.core._issues.errors import NeatValueError
 from cognite.neat._v0.core._utils.upload import UploadResultList
 
@@ -38,6 +38,7 @@ from ._provenance import (
     Entity,
     Provenance,
 )
+from ._verification_cache import VERIFIED_DATA_MODEL_CACHE, VerifiedDataModelCache, VerifiedEntry
 from .exceptions import EmptyStore, InvalidActivityInput
 
 
@@ -63,12 +64,20 @@ class OutcomeEntity(Entity):
 
 
 class NeatDataModelStore:
-    def __init__(self) -> None:
+    """Store of the data models and the provenance of how they were created.
+
+    Args:
+        verification_cache: Cache of verified data models keyed by the content hash of the imported data model.
+            Defaults to a cache shared by all stores in the process.
+    """
+
+    def __init__(self, verification_cache: VerifiedDataModelCache | None = None) -> None:
         self.provenance = Provenance[DataModelEntity]()
         self.exports_by_source_entity_id: dict[rdflib.URIRef, list[Change[OutcomeEntity]]] = defaultdict(list)
         self._last_outcome: UploadResultList | None = None
         self._iteration_by_id: dict[Hashable, int] = {}
         self._last_issues: IssueList | None = None
+        self._verification_cache = verification_cache if verification_cache is not None else VERIFIED_DATA_MODEL_CACHE
 
     def calculate_provenance_hash(self, shorten: bool = True) -> str:
         sha256_hash = hashlib.sha256()
@@ -86,16 +95,35 @@ class NeatDataModelStore:
         validate: bool,
         client: NeatClient | None = None,
     ) -> tuple[ConceptualDataModel, PhysicalDataModel | None]:
-        """Action that imports data model, verifies them and optionally converts them."""
+        """Action that imports data model, verifies them and optionally converts them.
+
+        The verified and converted data models are cached by the content hash of the imported data model. The
+        validation against CDF depends on the state of CDF, thus, it is not cached.
+        """
         imported_data_model = importer.to_data_model()
-        verified = VerifyAnyDataModel(validate, client).transform(imported_data_model)  # type: ignore[arg-type]
-        if isinstance(verified, ConceptualDataModel):
-            return verified, None
-        elif isinstance(verified, PhysicalDataModel):
-            return PhysicalToConceptual().transform(verified), verified
-        else:
-            # Bug in the code
-            raise ValueError(f"Invalid output from importer: {type(verified)}")
+        key: str | None = None
+        if not (validate and client is not None):
+            key = self._verification_cache.calculate_hash(imported_data_model, validate)
+        if key is not None and (entry := self._verification_cache.get(key)) is not None:
+            entry.warnings.trigger_warnings()
+            return entry.conceptual, entry.physical
+
+        try:
+            # The warnings are recorded to be re-triggered when the cached result is used.
+            with catch_warnings() as warning_list:
+                verified = VerifyAnyDataModel(validate, client).transform(imported_data_model)  # type: ignore[arg-type]
+                if isinstance(verified, ConceptualDataModel):
+                    conceptual, physical = verified, None
+                elif isinstance(verified, PhysicalDataModel):
+                    conceptual, physical = PhysicalToConceptual().transform(verified), verified
+                else:
+                    # Bug in the code
+                    raise ValueError(f"Invalid output from importer: {type(verified)}")
+        finally:
+            warning_list.trigger_warnings()
+        if key is not None:
+            self._verification_cache.set(key, VerifiedEntry(conceptual, physical, warning_list))
+        return conceptual, physical
 
     def _graph_import_verify_convert(
         self,
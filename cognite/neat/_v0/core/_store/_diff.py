@@ -0,0 +1,67 @@
+"""Difference between two named graphs.
+
+The graphs are compared subject by subject. Each graph is scanned once to compute an order independent
+digest of the content of every subject, and only the subjects whose digests differ are compared triple by
+triple. This keeps the cost of comparing two snapshots bounded by one scan of each graph plus the size of
+the change, instead of two cross-graph anti-join queries.
+"""
+
+from collections import defaultdict
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+
+from rdflib import Graph, URIRef
+from rdflib.term import Node
+
+from cognite.neat._v0.core._shared import Triple
+
+_DIGEST_MASK = (1 << 64) - 1
+
+
+@dataclass
+class GraphDiffSummary:
+    """Summary of the difference between a current and a new named graph.
+
+    Args:
+        added_count: Number of triples in the new graph that are not in the current graph.
+        deleted_count: Number of triples in the current graph that are not in the new graph.
+        added_count_by_type: Number of added triples by the type of their subject in the new graph.
+        deleted_count_by_type: Number of deleted triples by the type of their subject in the current graph.
+    """
+
+    added_count: int = 0
+    deleted_count: int = 0
+    added_count_by_type: dict[URIRef, int] = field(default_factory=lambda: defaultdict(int))
+    deleted_count_by_type: dict[URIRef, int] = field(default_factory=lambda: defaultdict(int))
+
+
+def _digest_by_subject(graph: Graph) -> dict[Node, int]:
+    """Order independent digest of the predicates and objects of each subject in the graph."""
+    digest_by_subject: dict[Node, int] = defaultdict(int)
+    for subject, predicate, object_ in graph.triples((None, None, None)):
+        # A sum of the triple hashes does not depend on the order the triples are returned in.
+        digest_by_subject[subject] = (digest_by_subject[subject] + hash((predicate, object_))) & _DIGEST_MASK
+    return digest_by_subject
+
+
+def iterate_graph_diff(current: Graph, new: Graph) -> Iterator[tuple[Node, set[Triple], set[Triple]]]:
+    """Iterates over the subjects that differ between the current and the new graph.
+
+    Args:
+        current: The current graph.
+        new: The new graph.
+
+    Yields:
+        The subject, the triples of the subject only in the new graph (to add), and the triples of the
+        subject only in the current graph (to delete).
+    """
+    current_digests = _digest_by_subject(current)
+    new_digests = _digest_by_subject(new)
+    changed_subjects = [subject for subject, digest in new_digests.items() if current_digests.get(subject) != digest]
+    changed_subjects.extend(subject for subject in current_digests if subject not in new_digests)
+    del current_digests, new_digests
+
+    for subject in changed_subjects:
+        current_triples: set[Triple] = set(current.triples((subject, None, None)))  # type: ignore[arg-type]
+        new_triples: set[Triple] = set(new.triples((subject, None, None)))  # type: ignore[arg-type]
+        yield subject, new_triples - current_triples, current_triples - new_triples
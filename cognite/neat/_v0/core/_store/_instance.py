@@ -1,33 +1,45 @@
+import shutil
 import sys
+import tempfile
 import warnings
-from collections.abc import Iterable
+import weakref
+from collections.abc import Callable, Iterable
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
-from typing import Any, cast, overload
+from typing import IO, Any, cast, overload
 from zipfile import ZipExtFile
 
 import pandas as pd
 from pandas import Index
-from rdflib import Dataset, Graph, Namespace, URIRef
+from rdflib import RDF, Dataset, Graph, Namespace, URIRef
 from rdflib.graph import DATASET_DEFAULT_GRAPH_ID
 from rdflib.plugins.stores.sparqlstore import SPARQLUpdateStore
 
 from cognite.neat._v0.core._constants import NAMED_GRAPH_NAMESPACE
-from cognite.neat._v0.core._instances._shared import quad_formats, rdflib_to_oxi_type
-from cognite.neat._v0.core._instances.extractors import RdfFileExtractor, TripleExtractors
+from cognite.neat._v0.core._instances._shared import is_quad_format, quad_formats, rdflib_to_oxi_type
+from cognite.neat._v0.core._instances.extractors import RdfFileExtractor, RdfFilesExtractor, TripleExtractors
+from cognite.neat._v0.core._instances.extractors._rdf_file import RdfSource
 from cognite.neat._v0.core._instances.queries import Queries
 from cognite.neat._v0.core._instances.transformers import Transformers
 from cognite.neat._v0.core._issues import IssueList, catch_issues
 from cognite.neat._v0.core._issues.errors import NeatValueError, OxigraphStorageLockedError
+from cognite.neat._v0.core._issues.warnings import FileReadWarning
 from cognite.neat._v0.core._shared import InstanceType, Triple
 from cognite.neat._v0.core._utils.auxiliary import local_import
+from cognite.neat._v0.core._utils.collection_ import iterate_chunks
+from cognite.neat._v0.core._utils.concurrency import map_concurrently
 from cognite.neat._v0.core._utils.rdf_ import (
     add_triples_in_batch,
+    iterate_oxigraph_quads,
     remove_namespace_from_uri,
+    to_oxigraph_term,
 )
 from cognite.neat._v0.core._utils.text import humanize_collection
 
+from ._diff import GraphDiffSummary, iterate_graph_diff
 from ._provenance import Change, Entity, Provenance
+from ._statistics import GraphStatistics, GraphStatisticsIndex
 
 if sys.version_info < (3, 11):
     from typing_extensions import Self
@@ -35,26 +47,51 @@ else:
     from typing import Self
 
 
+_STATISTICS_FILE_SUFFIX = "-statistics.json"
+
+
+def _call(function: Callable[[], Any]) -> Any:
+    return function()
+
+
+def _return(value: Any) -> Any:
+    return value
+
+
 class NeatInstanceStore:
     """NeatInstanceStore is a class that stores instances as triples and provides methods to read/write data it contains
 
 
     Args:
         dataset : Instance of rdflib.Dataset class for instance storage
+        default_named_graph : Named graph to use when none is given, by default the default graph of the dataset
+        statistics_filepath : File to persist the instance statistics to, by default None (kept in memory only)
 
     !!! note "Dataset"
         The store leverages a RDF dataset which is defined as a collection of RDF graphs
         where all but one are named graphs associated with URIRef (the graph name),
         and the unnamed default graph which is in context of rdflib library has an
         identifier URIRef('urn:x-rdflib:default').
+
+    !!! note "Statistics"
+        Aggregate statistics per named graph, such as instance count per type, are computed once
+        and reused until the named graph is changed through the store, see `.statistics()`.
+
+    !!! note "Adaptive store"
+        A store created with `.from_adaptive_store()` starts in memory and moves all its triples to
+        a local Oxigraph store once it holds more than a given number of triples.
     """
 
     rdf_store_type: str
+    _diff_batch_size = 10_000
+    # Size of the chunks large N-Triples and N-Quads files are split into when loaded in parallel.
+    _bulk_load_chunk_size = 64 * 1024 * 1024
 
     def __init__(
         self,
         dataset: Dataset,
         default_named_graph: URIRef | None = None,
+        statistics_filepath: Path | None = None,
     ):
         _start = datetime.now(timezone.utc)
         self.dataset = dataset
@@ -71,11 +108,40 @@ class NeatInstanceStore:
 
         self.default_named_graph = default_named_graph or DATASET_DEFAULT_GRAPH_ID
         self.queries = Queries(self.dataset, self.default_named_graph)
+        self._statistics = GraphStatisticsIndex(statistics_filepath)
+        # Only set for adaptive stores, see .from_adaptive_store()
+        self._spill_threshold: int | None = None
+        self._spill_storage_dir: Path | None = None
 
     def graph(self, named_graph: URIRef | None = None) -> Graph:
         """Get named graph from the dataset to query over"""
         return self.dataset.graph(named_graph or self.default_named_graph)
 
+    def statistics(self, named_graph: URIRef | None = None) -> GraphStatistics:
+        """Aggregate statistics of the instances in a named graph.
+
+        The statistics are computed on first access and kept until the named graph is changed
+        through the store, i.e., by .write(), .transform() or .diff().
+
+        Args:
+            named_graph: Named graph to get statistics for, default None (default named graph)
+
+        Returns:
+            Statistics of the named graph
+        """
+        return self._statistics.get(self.graph(named_graph))
+
+    def invalidate_statistics(self, named_graph: URIRef | None = None) -> None:
+        """Invalidate the statistics of a named graph.
+
+        This must be called if the named graph is changed outside the store methods, for
+        example, directly through the rdflib Dataset or the update queries.
+
+        Args:
+            named_graph: Named graph to invalidate statistics for, default None (default named graph)
+        """
+        self._statistics.invalidate(named_graph or self.default_named_graph)
+
     @property
     def type_(self) -> str:
         "Return type of the graph store"
@@ -169,7 +235,11 @@ class NeatInstanceStore:
 
     @classmethod
     def from_oxi_local_store(cls, storage_dir: Path | None = None) -> "Self":
-        """Creates a NeatGraphStore from an Oxigraph store."""
+        """Creates a NeatGraphStore from an Oxigraph store.
+
+        If a storage directory is given, the instance statistics are persisted next to it, such
+        that they do not have to be recomputed when the store is opened again.
+        """
         local_import("pyoxigraph", "oxi")
         local_import("oxrdflib", "oxi")
         import oxrdflib
@@ -185,6 +255,80 @@ class NeatInstanceStore:
         return cls(
             dataset=Dataset(
                 store=oxrdflib.OxigraphStore(store=oxi_store),
+            ),
+            statistics_filepath=(
+                storage_dir.parent / f"{storage_dir.name}{_STATISTICS_FILE_SUFFIX}" if storage_dir else None
+            ),
+        )
+
+    @classmethod
+    def from_adaptive_store(cls, spill_threshold: int = 1_000_000, storage_dir: Path | None = None) -> "Self":
+        """Creates a NeatGraphStore that starts in memory and moves to a local Oxigraph store when it grows.
+
+        Small graphs are kept in a plain in-memory rdflib Dataset. Once the store holds more than
+        `spill_threshold` triples, all triples are moved in bulk to an Oxigraph store on disk, and the
+        store continues with Oxigraph. This requires the optional Oxigraph dependencies.
+
+        Args:
+            spill_threshold: Number of triples above which the store moves to Oxigraph, default 1 000 000
+            storage_dir: Directory of the Oxigraph store, by default a temporary directory that is
+                deleted with the store
+        """
+        local_import("pyoxigraph", "oxi")
+        local_import("oxrdflib", "oxi")
+        if storage_dir is not None:
+            # Created upfront, such that the store does not fail when it spills in the middle of a write.
+            storage_dir.mkdir(parents=True, exist_ok=True)
+        store = cls(Dataset())
+        store._spill_threshold = spill_threshold
+        store._spill_storage_dir = storage_dir
+        return store
+
+    def _spill_if_above_threshold(self) -> None:
+        if self._spill_threshold is None or self.type_ != "Memory":
+            return
+        if len(self.dataset.store) > self._spill_threshold:
+            self._spill_to_oxigraph()
+
+    def _spill_to_oxigraph(self) -> None:
+        """Moves all triples, named graphs and prefixes from the in-memory dataset to an Oxigraph store."""
+        import oxrdflib
+        import pyoxigraph
+
+        _start = datetime.now(timezone.utc)
+        storage_dir = self._spill_storage_dir
+        if storage_dir is None:
+            storage_dir = Path(tempfile.mkdtemp(prefix="neat-oxigraph-"))
+            weakref.finalize(self, shutil.rmtree, storage_dir, ignore_errors=True)
+        try:
+            oxi_store = pyoxigraph.Store(path=str(storage_dir))
+        except OSError as e:
+            if "lock" in str(e):
+                raise OxigraphStorageLockedError(filepath=storage_dir) from e
+            raise e
+
+        memory_dataset = self.dataset
+        triple_count = len(memory_dataset.store)
+        for context in memory_dataset.graphs():
+            named_graph = cast(URIRef, context.identifier)
+            oxi_store.bulk_extend(iterate_oxigraph_quads(context.triples((None, None, None)), named_graph))
+            if named_graph != DATASET_DEFAULT_GRAPH_ID:
+                # Keeps the named graphs without triples.
+                oxi_store.add_graph(to_oxigraph_term(named_graph))
+        oxi_store.optimize()
+
+        dataset = Dataset(store=oxrdflib.OxigraphStore(store=oxi_store))
+        for prefix, namespace in memory_dataset.namespaces():
+            dataset.bind(prefix, namespace, override=True)
+        self.dataset = dataset
+        self.queries = Queries(self.dataset, self.default_named_graph)
+        # The content is unchanged, thus the statistics are still valid.
+        self.provenance.append(
+            Change.record(
+                activity=f"{type(self).__name__}._spill_to_oxigraph",
+                start=_start,
+                end=datetime.now(timezone.utc),
+                description=f"Moved {triple_count:,} triples from memory to an Oxigraph store in {storage_dir}",
             )
         )
 
@@ -205,7 +349,10 @@ class NeatInstanceStore:
                 if isinstance(extractor.filepath, ZipExtFile):
                     extractor.filepath.close()
 
-            elif isinstance(extractor, RdfFileExtractor):
+            elif isinstance(extractor, RdfFilesExtractor) and not extractor.issue_list.has_errors:
+                self._parse_files(named_graph, extractor)
+
+            elif isinstance(extractor, RdfFileExtractor | RdfFilesExtractor):
                 success = False
                 issue_text = "\n".join([issue.as_message() for issue in extractor.issue_list])
                 warnings.warn(
@@ -217,6 +364,7 @@ class NeatInstanceStore:
                 )
             else:
                 self._add_triples(extractor.extract(), named_graph=named_graph)
+            self._spill_if_above_threshold()
 
             if success:
                 _end = datetime.now(timezone.utc)
@@ -281,6 +429,8 @@ class NeatInstanceStore:
             https://pyoxigraph.readthedocs.io/en/stable/store.html#pyoxigraph.Store.bulk_load
         """
 
+        # Quad formats can write to any named graph
+        self._statistics.invalidate(None if format in quad_formats() else named_graph)
         # Oxigraph store, do not want to type hint this as it is an optional dependency
         if self.type_ == "OxigraphStore":
             local_import("pyoxigraph", "oxi")
@@ -308,6 +458,100 @@ class NeatInstanceStore:
             else:
                 self.graph(named_graph).parse(filepath, publicID=base_uri, format=format)  # type: ignore[arg-type]
 
+    def _parse_files(self, named_graph: URIRef, extractor: RdfFilesExtractor) -> None:
+        """Imports graph data from many files, directories and archives.
+
+        Documents with triples, including N-Triples, are stored in the named graph, while documents with quads
+        are stored in the named graphs given in the documents. A document that cannot be parsed is reported as a
+        FileReadWarning, and the other documents are still imported.
+
+        Args:
+            named_graph : URIRef of the named graph to store the data in
+            extractor : The extractor with the files to import
+
+        !!! note "Oxigraph store"
+            The documents are bulk loaded, in parallel if the extractor has max_workers above 1. Large
+            N-Triples and N-Quads documents are also split into chunks that are loaded in parallel. Note that
+            bulk loading is not transactional, thus a document with an error might be partially imported.
+        """
+        # The documents can contain quads for any named graph
+        self._statistics.invalidate(None)
+        if self.type_ == "OxigraphStore":
+            local_import("pyoxigraph", "oxi")
+            oxi_store = self.dataset.store._store  # type: ignore[attr-defined]
+            results = map_concurrently(
+                _call, self._iterate_oxigraph_loads(oxi_store, named_graph, extractor), extractor.max_workers
+            )
+        else:
+            results = (
+                self._parse_source(named_graph, source, extractor.base_uri) for source in extractor.iterate_sources()
+            )
+
+        for name, error in results:
+            if error is not None:
+                warnings.warn(FileReadWarning(Path(name), f"{type(error).__name__}: {error}"), stacklevel=2)
+        if self.type_ == "OxigraphStore":
+            self.dataset.store._store.optimize()  # type: ignore[attr-defined]
+
+    def _parse_source(self, named_graph: URIRef, source: RdfSource, base_uri: URIRef) -> tuple[str, Exception | None]:
+        graph = self.dataset if is_quad_format(source.format) else self.graph(named_graph)
+        try:
+            with source.open() as stream:
+                graph.parse(stream, publicID=base_uri, format=source.format)  # type: ignore[arg-type]
+        except Exception as error:
+            return source.name, error
+        return source.name, None
+
+    def _iterate_oxigraph_loads(
+        self, oxi_store: Any, named_graph: URIRef, extractor: RdfFilesExtractor
+    ) -> Iterable[Callable[[], tuple[str, Exception | None]]]:
+        """Iterates over the bulk loads of the documents and their chunks, to be called in any order."""
+        import pyoxigraph
+
+        to_graph = (
+            pyoxigraph.DefaultGraph()
+            if named_graph == DATASET_DEFAULT_GRAPH_ID
+            else pyoxigraph.NamedNode(str(named_graph))
+        )
+        format_by_rdflib_format = {
+            "turtle": pyoxigraph.RdfFormat.TURTLE,
+            "nt": pyoxigraph.RdfFormat.N_TRIPLES,
+            "nquads": pyoxigraph.RdfFormat.N_QUADS,
+            "trig": pyoxigraph.RdfFormat.TRIG,
+            "n3": pyoxigraph.RdfFormat.N3,
+            "xml": pyoxigraph.RdfFormat.RDF_XML,
+        }
+
+        def bulk_load(source: RdfSource, input_: bytes | IO[bytes]) -> tuple[str, Exception | None]:
+            try:
+                oxi_store.bulk_load(
+                    input_,
+                    format_by_rdflib_format[source.format],
+                    base_iri=str(extractor.base_uri),
+                    to_graph=None if is_quad_format(source.format) else to_graph,
+                )
+            except Exception as error:
+                return source.name, error
+            finally:
+                if not isinstance(input_, bytes):
+                    input_.close()
+            return source.name, None
+
+        for source in extractor.iterate_sources():
+            if source.format not in format_by_rdflib_format:
+                yield partial(self._parse_source, named_graph, source, extractor.base_uri)
+                continue
+            chunk_size = self._bulk_load_chunk_size if extractor.max_workers > 1 else None
+            try:
+                for chunk in source.iterate_chunks(chunk_size):
+                    if source.is_independent:
+                        yield partial(bulk_load, source, chunk)
+                    else:
+                        # Members of a streamed archive must be read before moving on to the next member.
+                        yield partial(_return, bulk_load(source, chunk))
+            except Exception as error:
+                yield partial(_return, (source.name, error))
+
     def _add_triples(
         self,
         triples: Iterable[Triple],
@@ -321,7 +565,24 @@ class NeatInstanceStore:
             batch_size: Batch size of triples per commit, by default 10_000
             verbose: Verbose mode, by default False
         """
-        add_triples_in_batch(self.graph(named_graph), triples, batch_size)
+        self._statistics.invalidate(named_graph)
+        if self._spill_threshold is not None and self.type_ == "Memory":
+            triples = iter(triples)
+            for batch in iterate_chunks(triples, batch_size):
+                add_triples_in_batch(self.graph(named_graph), batch, batch_size)
+                self._spill_if_above_threshold()
+                if self.type_ != "Memory":
+                    # Moved to Oxigraph, the rest of the triples are added there.
+                    break
+            else:
+                return
+
+        if self.type_ == "OxigraphStore":
+            # Non-transactional, like the file imports, which is much faster than adding the triples one by one.
+            oxi_store = self.dataset.store._store  # type: ignore[attr-defined]
+            oxi_store.bulk_extend(iterate_oxigraph_quads(triples, named_graph))
+        else:
+            add_triples_in_batch(self.graph(named_graph), triples, batch_size)
 
     def transform(self, transformer: Transformers, named_graph: URIRef | None = None) -> IssueList:
         """Transforms the graph store using a transformer."""
@@ -348,9 +609,11 @@ class NeatInstanceStore:
             )
             return issue_list
         _start = datetime.now(timezone.utc)
+        self._statistics.invalidate(named_graph)
         with catch_issues() as transform_issues:
             transformer.transform(self.graph(named_graph))
         issue_list.extend(transform_issues)
+        self._spill_if_above_threshold()
         self.provenance.append(
             Change.record(
                 activity=f"{type(transformer).__name__}",
@@ -365,7 +628,7 @@ class NeatInstanceStore:
     def summary(self) -> dict[URIRef, pd.DataFrame]:
         return {
             named_graph: pd.DataFrame(
-                self.queries.select.summarize_instances(named_graph),
+                self.statistics(named_graph).summarize_instances(),
                 columns=["Type", "Occurrence"],
             )
             for named_graph in self.named_graphs
@@ -373,7 +636,7 @@ class NeatInstanceStore:
 
     @property
     def multi_type_instances(self) -> dict[URIRef, dict[str, list[str]]]:
-        return {named_graph: self.queries.select.multi_type_instances(named_graph) for named_graph in self.named_graphs}
+        return {named_graph: self.statistics(named_graph).multi_type_instances() for named_graph in self.named_graphs}
 
     def _repr_html_(self) -> str:
         provenance = self.provenance._repr_html_()
@@ -452,16 +715,23 @@ class NeatInstanceStore:
         """Cheap way to check if the graph store is empty."""
         return not self.queries.select.has_data()
 
-    def diff(self, current_named_graph: URIRef, new_named_graph: URIRef) -> None:
+    def diff(self, current_named_graph: URIRef, new_named_graph: URIRef) -> GraphDiffSummary:
         """
         Compare two named graphs and store diff results in dedicated named graphs.
 
         Stores triples to add in DIFF_ADD and triples to delete in DIFF_DELETE.
 
+        With a store that has a native SPARQL engine, such as Oxigraph, the diff is computed and inserted
+        by the store. Otherwise, the graphs are compared with one scan of each graph, followed by a triple by
+        triple comparison of only the subjects that changed.
+
         Args:
             current_named_graph: URI of the current named graph
             new_named_graph: URI of the new/updated named graph
 
+        Returns:
+            Summary of the diff with the number of triples to add and to delete, in total and by type.
+
         Raises:
             NeatValueError: If either named graph doesn't exist in the store
         """
@@ -474,12 +744,47 @@ class NeatInstanceStore:
         self.dataset.update(f"CLEAR SILENT GRAPH <{NAMED_GRAPH_NAMESPACE['DIFF_ADD']}>")
         self.dataset.update(f"CLEAR SILENT GRAPH <{NAMED_GRAPH_NAMESPACE['DIFF_DELETE']}>")
 
-        # Store new diff results
-        self._add_triples(
-            self.queries.select.get_graph_diff(new_named_graph, current_named_graph),
-            named_graph=NAMED_GRAPH_NAMESPACE["DIFF_ADD"],
-        )
-        self._add_triples(
-            self.queries.select.get_graph_diff(current_named_graph, new_named_graph),
-            named_graph=NAMED_GRAPH_NAMESPACE["DIFF_DELETE"],
-        )
+        diff_add, diff_delete = NAMED_GRAPH_NAMESPACE["DIFF_ADD"], NAMED_GRAPH_NAMESPACE["DIFF_DELETE"]
+        if self.type_ != "Memory":
+            # Stores with a native SPARQL engine compute and insert the diff without passing the triples through
+            # Python, which is faster than comparing the graphs in Python.
+            self._statistics.invalidate(diff_add)
+            self._statistics.invalidate(diff_delete)
+            self.queries.update.insert_graph_diff(new_named_graph, current_named_graph, diff_add)
+            self.queries.update.insert_graph_diff(current_named_graph, new_named_graph, diff_delete)
+            return GraphDiffSummary(
+                added_count=len(self.graph(diff_add)),
+                deleted_count=len(self.graph(diff_delete)),
+                added_count_by_type=self.queries.select.count_triples_by_subject_type(diff_add, new_named_graph),
+                deleted_count_by_type=self.queries.select.count_triples_by_subject_type(
+                    diff_delete, current_named_graph
+                ),
+            )
+
+        current_graph, new_graph = self.graph(current_named_graph), self.graph(new_named_graph)
+        summary = GraphDiffSummary()
+        to_add: list[Triple] = []
+        to_delete: list[Triple] = []
+        for subject, added, deleted in iterate_graph_diff(current_graph, new_graph):
+            for graph, triples, count_by_type in [
+                (new_graph, added, summary.added_count_by_type),
+                (current_graph, deleted, summary.deleted_count_by_type),
+            ]:
+                if triples:
+                    for type_ in set(graph.objects(subject, RDF.type)):
+                        if isinstance(type_, URIRef):
+                            count_by_type[type_] += len(triples)
+            summary.added_count += len(added)
+            summary.deleted_count += len(deleted)
+            to_add.extend(added)
+            to_delete.extend(deleted)
+            if len(to_add) + len(to_delete) >= self._diff_batch_size:
+                self._write_diff(to_add, to_delete)
+        self._write_diff(to_add, to_delete)
+        return summary
+
+    def _write_diff(self, to_add: list[Triple], to_delete: list[Triple]) -> None:
+        self._add_triples(to_add, named_graph=NAMED_GRAPH_NAMESPACE["DIFF_ADD"])
+        self._add_triples(to_delete, named_graph=NAMED_GRAPH_NAMESPACE["DIFF_DELETE"])
+        to_add.clear()
+        to_delete.clear()
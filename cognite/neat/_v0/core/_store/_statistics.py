@@ -0,0 +1,272 @@
+"""Aggregate statistics of the instances stored in a named graph.
+
+The statistics are computed with a fixed number of grouped scans of the named graph and are then
+reused until the named graph changes. This makes summaries such as instance count per type, property
+count per type and multi-type instances O(#types) instead of O(#triples) for repeated calls.
+"""
+
+import json
+import sys
+import urllib.parse
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, cast
+
+from rdflib import Graph, URIRef
+from rdflib import Literal as RdfLiteral
+
+from cognite.neat._v0.core._constants import NEAT
+from cognite.neat._v0.core._utils.rdf_ import remove_namespace_from_uri
+
+if sys.version_info < (3, 11):
+    from typing_extensions import Self
+else:
+    from typing import Self
+
+_TYPE_COUNT_QUERY = """SELECT ?type (COUNT(?instance) AS ?instanceCount)
+                       WHERE { ?instance a ?type . }
+                       GROUP BY ?type"""
+
+_TYPE_WITH_PROPERTIES_COUNT_QUERY = """SELECT ?type (COUNT(DISTINCT ?instance) AS ?instanceCount)
+                                       WHERE {
+                                         ?instance a ?type .
+                                         ?instance ?property ?value .
+                                         FILTER(?property != rdf:type)
+                                       }
+                                       GROUP BY ?type"""
+
+_PROPERTY_COUNT_QUERY = """SELECT ?type ?property (COUNT(?instance) AS ?instanceCount) (MAX(?valueCount) AS ?maxCount)
+                           WHERE {
+                             {
+                               SELECT ?instance ?property (COUNT(?value) AS ?valueCount)
+                               WHERE {
+                                 ?instance ?property ?value .
+                                 FILTER(?property != rdf:type)
+                               }
+                               GROUP BY ?instance ?property
+                             }
+                             ?instance a ?type .
+                           }
+                           GROUP BY ?type ?property"""
+
+_VALUE_TYPE_COUNT_QUERY = """SELECT ?type ?property ?valueType (COUNT(?value) AS ?occurrence)
+                             WHERE {{
+                               ?instance a ?type .
+                               ?instance ?property ?value .
+                               FILTER(?property != rdf:type)
+                               OPTIONAL {{ ?value a ?objectType }}
+                               BIND(IF(isLiteral(?value), DATATYPE(?value),
+                                       IF(BOUND(?objectType), ?objectType, <{unknown_type}>)) AS ?valueType)
+                             }}
+                             GROUP BY ?type ?property ?valueType"""
+
+_MULTI_TYPE_INSTANCES_QUERY = """SELECT ?instance (GROUP_CONCAT(str(?type); SEPARATOR=",") AS ?types)
+                                 WHERE { ?instance a ?type . }
+                                 GROUP BY ?instance
+                                 HAVING (COUNT(?type) > 1)"""
+
+
+@dataclass
+class GraphStatistics:
+    """Aggregate statistics of the instances in a single named graph.
+
+    Args:
+        instance_count_by_type: Number of instances per type.
+        instance_with_properties_count_by_type: Number of instances per type with at least one property
+            besides rdf:type.
+        instance_count_by_type_property: Number of instances per (type, property) having the property.
+        max_count_by_type_property: Maximum number of values a single instance has for the (type, property).
+        value_type_count_by_type_property: Number of values per value type for each (type, property). The
+            value type is the datatype for literals, the type of the object for URIs, and NEAT.UnknownType
+            for objects without a type.
+        types_by_multi_type_instance: Types of instances that have more than one type.
+    """
+
+    instance_count_by_type: dict[URIRef, int] = field(default_factory=dict)
+    instance_with_properties_count_by_type: dict[URIRef, int] = field(default_factory=dict)
+    instance_count_by_type_property: dict[tuple[URIRef, URIRef], int] = field(default_factory=dict)
+    max_count_by_type_property: dict[tuple[URIRef, URIRef], int] = field(default_factory=dict)
+    value_type_count_by_type_property: dict[tuple[URIRef, URIRef], dict[URIRef, int]] = field(default_factory=dict)
+    types_by_multi_type_instance: dict[URIRef, list[URIRef]] = field(default_factory=dict)
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> Self:
+        """Computes the statistics of a graph with a fixed number of grouped scans."""
+        statistics = cls()
+        for type_, count in graph.query(_TYPE_COUNT_QUERY):  # type: ignore[misc]
+            statistics.instance_count_by_type[cast(URIRef, type_)] = int(cast(RdfLiteral, count).toPython())
+
+        for type_, count in graph.query(_TYPE_WITH_PROPERTIES_COUNT_QUERY):  # type: ignore[misc]
+            statistics.instance_with_properties_count_by_type[cast(URIRef, type_)] = int(
+                cast(RdfLiteral, count).toPython()
+            )
+
+        for type_, property_, count, max_count in graph.query(_PROPERTY_COUNT_QUERY):  # type: ignore[misc]
+            key = cast(tuple[URIRef, URIRef], (type_, property_))
+            statistics.instance_count_by_type_property[key] = int(cast(RdfLiteral, count).toPython())
+            statistics.max_count_by_type_property[key] = int(cast(RdfLiteral, max_count).toPython())
+
+        value_type_count: dict[tuple[URIRef, URIRef], dict[URIRef, int]] = defaultdict(dict)
+        for type_, property_, value_type, occurrence in graph.query(  # type: ignore[misc]
+            _VALUE_TYPE_COUNT_QUERY.format(unknown_type=NEAT.UnknownType)
+        ):
+            key = cast(tuple[URIRef, URIRef], (type_, property_))
+            value_type = cast(URIRef, value_type or NEAT.UnknownType)
+            value_type_count[key][value_type] = value_type_count[key].get(value_type, 0) + int(
+                cast(RdfLiteral, occurrence).toPython()
+            )
+        statistics.value_type_count_by_type_property = dict(value_type_count)
+
+        for instance, types in graph.query(_MULTI_TYPE_INSTANCES_QUERY):  # type: ignore[misc]
+            statistics.types_by_multi_type_instance[cast(URIRef, instance)] = [
+                URIRef(type_) for type_ in str(types).split(",")
+            ]
+        return statistics
+
+    def summarize_instances(self) -> list[tuple[str, int]]:
+        """Same as SelectQueries.summarize_instances, instance count per type ordered by count."""
+        return [
+            (remove_namespace_from_uri(type_), count)
+            for type_, count in sorted(self.instance_count_by_type.items(), key=lambda item: -item[1])
+        ]
+
+    def types_with_instance_and_property_count(self, remove_namespace: bool = True) -> list[dict[str, Any]]:
+        """Same as SelectQueries.types_with_instance_and_property_count"""
+        property_count_by_type: dict[URIRef, int] = defaultdict(int)
+        for type_, _ in self.instance_count_by_type_property.keys():
+            property_count_by_type[type_] += 1
+        return [
+            {
+                "type": urllib.parse.unquote(remove_namespace_from_uri(type_)) if remove_namespace else type_,
+                "instanceCount": instance_count,
+                "propertyCount": property_count_by_type[type_],
+            }
+            for type_, instance_count in sorted(
+                self.instance_with_properties_count_by_type.items(), key=lambda item: -item[1]
+            )
+        ]
+
+    def properties_with_count(self, remove_namespace: bool = True) -> list[dict[str, Any]]:
+        """Same as SelectQueries.properties_with_count"""
+        return [
+            {
+                "type": urllib.parse.unquote(remove_namespace_from_uri(type_)) if remove_namespace else type_,
+                "property": urllib.parse.unquote(remove_namespace_from_uri(property_))
+                if remove_namespace
+                else property_,
+                "instanceCount": instance_count,
+                "total": self.instance_with_properties_count_by_type[type_],
+            }
+            for (type_, property_), instance_count in sorted(
+                self.instance_count_by_type_property.items(), key=lambda item: (str(item[0][0]), str(item[0][1]))
+            )
+        ]
+
+    def multi_type_instances(self) -> dict[str, list[str]]:
+        """Same as SelectQueries.multi_type_instances"""
+        return {
+            remove_namespace_from_uri(instance): remove_namespace_from_uri(types)
+            for instance, types in self.types_by_multi_type_instance.items()
+        }
+
+    def multi_value_type_properties(self) -> dict[tuple[URIRef, URIRef], list[URIRef]]:
+        """(type, property) pairs with more than one value type"""
+        return {
+            key: list(count_by_value_type)
+            for key, count_by_value_type in self.value_type_count_by_type_property.items()
+            if len(count_by_value_type) > 1
+        }
+
+    def dump(self) -> dict[str, Any]:
+        return {
+            "instanceCountByType": [[str(type_), count] for type_, count in self.instance_count_by_type.items()],
+            "instanceWithPropertiesCountByType": [
+                [str(type_), count] for type_, count in self.instance_with_properties_count_by_type.items()
+            ],
+            "instanceCountByTypeProperty": [
+                [str(type_), str(property_), count, self.max_count_by_type_property[(type_, property_)]]
+                for (type_, property_), count in self.instance_count_by_type_property.items()
+            ],
+            "valueTypeCountByTypeProperty": [
+                [str(type_), str(property_), {str(value_type): count for value_type, count in counts.items()}]
+                for (type_, property_), counts in self.value_type_count_by_type_property.items()
+            ],
+            "typesByMultiTypeInstance": {
+                str(instance): [str(type_) for type_ in types]
+                for instance, types in self.types_by_multi_type_instance.items()
+            },
+        }
+
+    @classmethod
+    def load(cls, data: dict[str, Any]) -> Self:
+        statistics = cls()
+        for type_, count in data.get("instanceCountByType", []):
+            statistics.instance_count_by_type[URIRef(type_)] = count
+        for type_, count in data.get("instanceWithPropertiesCountByType", []):
+            statistics.instance_with_properties_count_by_type[URIRef(type_)] = count
+        for type_, property_, count, max_count in data.get("instanceCountByTypeProperty", []):
+            key = (URIRef(type_), URIRef(property_))
+            statistics.instance_count_by_type_property[key] = count
+            statistics.max_count_by_type_property[key] = max_count
+        for type_, property_, counts in data.get("valueTypeCountByTypeProperty", []):
+            statistics.value_type_count_by_type_property[(URIRef(type_), URIRef(property_))] = {
+                URIRef(value_type): count for value_type, count in counts.items()
+            }
+        for instance, types in data.get("typesByMultiTypeInstance", {}).items():
+            statistics.types_by_multi_type_instance[URIRef(instance)] = [URIRef(type_) for type_ in types]
+        return statistics
+
+
+class GraphStatisticsIndex:
+    """Statistics per named graph, computed on demand and kept until the named graph changes.
+
+    Args:
+        filepath: Optional file to persist the statistics to, typically next to an on-disk Oxigraph store
+            such that the statistics survive across sessions.
+    """
+
+    def __init__(self, filepath: Path | None = None) -> None:
+        self.filepath = filepath
+        self._statistics_by_named_graph: dict[URIRef, GraphStatistics] = {}
+        if filepath is not None and filepath.exists():
+            try:
+                data = json.loads(filepath.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                # A corrupt statistics file is not critical, the statistics will be recomputed.
+                data = {}
+            self._statistics_by_named_graph = {
+                URIRef(named_graph): GraphStatistics.load(graph_data) for named_graph, graph_data in data.items()
+            }
+
+    def get(self, graph: Graph) -> GraphStatistics:
+        named_graph = cast(URIRef, graph.identifier)
+        if (statistics := self._statistics_by_named_graph.get(named_graph)) is None:
+            statistics = GraphStatistics.from_graph(graph)
+            self._statistics_by_named_graph[named_graph] = statistics
+            self._persist()
+        return statistics
+
+    def invalidate(self, named_graph: URIRef | None = None) -> None:
+        """Invalidate statistics for a named graph, or all named graphs if None."""
+        if named_graph is None:
+            self._statistics_by_named_graph.clear()
+        elif self._statistics_by_named_graph.pop(named_graph, None) is None:
+            return
+        self._persist()
+
+    def __contains__(self, named_graph: URIRef) -> bool:
+        return named_graph in self._statistics_by_named_graph
+
+    def _persist(self) -> None:
+        if self.filepath is None:
+            return
+        self.filepath.write_text(
+            json.dumps(
+                {
+                    str(named_graph): statistics.dump()
+                    for named_graph, statistics in self._statistics_by_named_graph.items()
+                }
+            ),
+            encoding="utf-8",
+        )
@@ -0,0 +1,130 @@
+"""Content addressed cache of verified and converted data models.
+
+Verifying an imported data model and converting a physical data model to a conceptual one are the
+most expensive steps of an import. The result only depends on the content of the imported data model,
+so it is cached by a hash of that content. Re-importing the same data model, for example when a notebook
+is re-executed, returns a copy of the cached result and re-triggers the warnings of the first verification.
+"""
+
+import hashlib
+import json
+import pickle
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from cognite.neat._v0.core._data_model._shared import ImportedDataModel
+from cognite.neat._v0.core._data_model.models import ConceptualDataModel, PhysicalDataModel
+from cognite.neat._v0.core._issues import IssueList
+
+
+@dataclass
+class VerifiedEntry:
+    """The outcome of verifying, and converting, an imported data model.
+
+    Args:
+        conceptual: The conceptual data model.
+        physical: The physical data model, if the imported data model was physical.
+        warnings: The warnings raised while verifying and converting.
+    """
+
+    conceptual: ConceptualDataModel
+    physical: PhysicalDataModel | None
+    warnings: IssueList
+
+    def copy(self) -> "VerifiedEntry":
+        """Verified data models are mutable, thus, the cache never hands out its own instances."""
+        return VerifiedEntry(
+            self.conceptual.model_copy(deep=True),
+            self.physical.model_copy(deep=True) if self.physical is not None else None,
+            IssueList(self.warnings),
+        )
+
+
+class VerifiedDataModelCache:
+    """Least recently used cache of verified data models keyed by the content hash of the imported data model.
+
+    Args:
+        max_size: The maximum number of entries kept in memory.
+        cache_dir: If given, entries are also pickled to this directory, such that they are reused across sessions.
+    """
+
+    def __init__(self, max_size: int = 16, cache_dir: Path | None = None) -> None:
+        self.max_size = max_size
+        self.cache_dir = cache_dir
+        self._entry_by_key: OrderedDict[str, VerifiedEntry] = OrderedDict()
+
+    @staticmethod
+    def calculate_hash(imported: ImportedDataModel, validate: bool) -> str | None:
+        """Calculate the content hash of an imported data model.
+
+        Returns:
+            The hash, or None if the imported data model cannot be verified.
+        """
+        if imported.unverified_data_model is None:
+            return None
+        sha256_hash = hashlib.sha256()
+        sha256_hash.update(type(imported.unverified_data_model).__name__.encode("utf-8"))
+        sha256_hash.update(str(validate).encode("utf-8"))
+        # The context adjusts row numbers of warnings, which are part of the cached result.
+        sha256_hash.update(repr(imported.context).encode("utf-8"))
+        dumped = json.dumps(imported.unverified_data_model.dump(), sort_keys=True, default=_dump_default)
+        sha256_hash.update(dumped.encode("utf-8"))
+        return sha256_hash.hexdigest()
+
+    def get(self, key: str) -> VerifiedEntry | None:
+        if key in self._entry_by_key:
+            self._entry_by_key.move_to_end(key)
+            return self._entry_by_key[key].copy()
+        if self.cache_dir is None or not (path := self._path(key)).exists():
+            return None
+        try:
+            with path.open("rb") as file:
+                entry = pickle.load(file)
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            # Written by an incompatible version of neat, it is overwritten by the next set.
+            return None
+        if not isinstance(entry, VerifiedEntry):
+            return None
+        self._set_in_memory(key, entry)
+        return entry.copy()
+
+    def set(self, key: str, entry: VerifiedEntry) -> None:
+        entry = entry.copy()
+        self._set_in_memory(key, entry)
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self._path(key)
+            tmp_path = path.with_suffix(".tmp")
+            with tmp_path.open("wb") as file:
+                pickle.dump(entry, file)
+            tmp_path.replace(path)
+
+    def clear(self) -> None:
+        """Clear the in memory entries. Entries on disk are kept."""
+        self._entry_by_key.clear()
+
+    def __len__(self) -> int:
+        return len(self._entry_by_key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entry_by_key or (self.cache_dir is not None and self._path(key).exists())
+
+    def _set_in_memory(self, key: str, entry: VerifiedEntry) -> None:
+        self._entry_by_key[key] = entry
+        self._entry_by_key.move_to_end(key)
+        while len(self._entry_by_key) > self.max_size:
+            self._entry_by_key.popitem(last=False)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"verified-{key}.pkl"  # type: ignore[operator]
+
+
+def _dump_default(value: Any) -> str:
+    # Entities, URIs and dates all have a deterministic string representation.
+    return f"{type(value).__name__}:{value}"
+
+
+# Shared by all stores in the process, such that a new session reuses the verification of an earlier one.
+VERIFIED_DATA_MODEL_CACHE = VerifiedDataModelCache()
@@ -1,5 +1,6 @@
 from collections import Counter
 from collections.abc import Iterable, Sequence
+from itertools import islice
 from typing import TypeVar
 
 from cognite.neat._v0.core._config import GLOBAL_CONFIG
@@ -22,6 +23,13 @@ def chunker(sequence: Sequence[T_Element], chunk_size: int) -> Iterable[Sequence
         yield sequence[i : i + chunk_size]
 
 
+def iterate_chunks(iterable: Iterable[T_Element], chunk_size: int) -> Iterable[list[T_Element]]:
+    """Like chunker, but for any iterable, consuming it lazily."""
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
 def remove_list_elements(input_list: list, elements_to_remove: list) -> list:
     return [element for element in input_list if element not in elements_to_remove]
 
@@ -0,0 +1,131 @@
+import queue
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TypeVar
+
+from cognite.neat._v0.core._constants import IN_PYODIDE
+
+T_Element = TypeVar("T_Element")
+T_Result = TypeVar("T_Result")
+
+# Sentinel put on the queue by a producer when its iterable is exhausted.
+_DONE = object()
+
+
+class _ProducerError:
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+def can_use_threads() -> bool:
+    """Threads are not available in Pyodide, there everything must run sequentially."""
+    return not IN_PYODIDE
+
+
+def iterate_concurrently(
+    iterables: Sequence[Iterable[T_Element]],
+    max_workers: int = 4,
+    buffer_size: int = 1_000,
+    chunk_size: int = 100,
+) -> Iterator[T_Element]:
+    """Consumes several iterables in parallel threads and merges them into one iterator.
+
+    The items of a single iterable are yielded in order, while items from different iterables are
+    interleaved in the order they become available. At most `buffer_size` chunks are held in memory
+    at any time, producers block until the consumer catches up.
+
+    Args:
+        iterables: The iterables to consume, typically lazy API iterators.
+        max_workers: Maximum number of iterables consumed at the same time.
+        buffer_size: Maximum number of chunks buffered between the producers and the consumer.
+        chunk_size: Number of items a producer collects before handing them over to the consumer.
+
+    Returns:
+        Iterator over all items in all iterables.
+
+    !!! note "Sequential fallback"
+        If max_workers is 1, there is at most one iterable, or threads are not available (Pyodide),
+        the iterables are consumed one after another in the calling thread.
+    """
+    if max_workers <= 1 or len(iterables) <= 1 or not can_use_threads():
+        for iterable in iterables:
+            yield from iterable
+        return
+
+    buffer: queue.Queue = queue.Queue(maxsize=buffer_size)
+    stop = threading.Event()
+
+    def put(item: object) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce(iterable: Iterable[T_Element]) -> None:
+        if stop.is_set():
+            return
+        try:
+            chunk: list[T_Element] = []
+            for item in iterable:
+                chunk.append(item)
+                if len(chunk) >= chunk_size:
+                    if not put(chunk):
+                        return
+                    chunk = []
+            if chunk and not put(chunk):
+                return
+        except BaseException as error:
+            put(_ProducerError(error))
+        finally:
+            put(_DONE)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(iterables))) as executor:
+        for iterable in iterables:
+            executor.submit(produce, iterable)
+        remaining = len(iterables)
+        try:
+            while remaining:
+                item = buffer.get()
+                if item is _DONE:
+                    remaining -= 1
+                elif isinstance(item, _ProducerError):
+                    raise item.error
+                else:
+                    yield from item
+        finally:
+            # Unblocks producers if the consumer stops early or a producer failed.
+            stop.set()
+
+
+def map_concurrently(
+    function: Callable[[T_Element], T_Result],
+    items: Iterable[T_Element],
+    max_workers: int = 4,
+) -> Iterator[T_Result]:
+    """Applies a function to all items in a thread pool and yields the results in input order.
+
+    At most 2 * max_workers items are submitted ahead of the consumer, such that the items
+    can be a lazy iterator over a large source.
+
+    Falls back to a plain map in the calling thread if max_workers is 1 or threads are not available.
+    """
+    if max_workers <= 1 or not can_use_threads():
+        yield from map(function, items)
+        return
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: deque[Future[T_Result]] = deque()
+        try:
+            for item in items:
+                pending.append(executor.submit(function, item))
+                if len(pending) >= 2 * max_workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
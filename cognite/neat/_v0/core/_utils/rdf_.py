@@ -5,10 +5,12 @@ from typing import Any, Literal, TypeAlias, overload
 
 from cognite.client.utils.useful_types import SequenceNotStr
 from pydantic import HttpUrl, TypeAdapter, ValidationError
-from rdflib import Graph, Namespace, URIRef
+from rdflib import BNode, Graph, Namespace, URIRef
 from rdflib import Literal as RdfLiteral
+from rdflib.graph import DATASET_DEFAULT_GRAPH_ID
 
 from cognite.neat._v0.core._constants import SPACE_URI_PATTERN
+from cognite.neat._v0.core._issues.errors import NeatValueError
 
 Triple: TypeAlias = tuple[URIRef, URIRef, RdfLiteral | URIRef]
 
@@ -264,6 +266,57 @@ def add_triples_in_batch(graph: Graph, triples: Iterable[Triple], batch_size: in
     check_commit(force_commit=True)
 
 
+def to_oxigraph_term(term: Any) -> Any:
+    """Converts an rdflib term to the matching pyoxigraph term, keeping the identity of blank nodes."""
+    import pyoxigraph  # type: ignore[import-untyped]
+
+    if isinstance(term, URIRef):
+        return pyoxigraph.NamedNode(term)
+    elif isinstance(term, BNode):
+        return pyoxigraph.BlankNode(term)
+    elif isinstance(term, RdfLiteral):
+        return pyoxigraph.Literal(
+            term,
+            language=term.language,
+            datatype=pyoxigraph.NamedNode(term.datatype) if term.datatype else None,
+        )
+    raise NeatValueError(f"Cannot add {term!r} to an Oxigraph store")
+
+
+def iterate_oxigraph_quads(triples: Iterable[tuple], named_graph: URIRef) -> Iterable[Any]:
+    """Converts triples to pyoxigraph quads in the given named graph."""
+    import pyoxigraph  # type: ignore[import-untyped]
+
+    graph_name = pyoxigraph.DefaultGraph() if named_graph == DATASET_DEFAULT_GRAPH_ID else to_oxigraph_term(named_graph)
+    # There are few distinct predicates, thus they are converted once.
+    predicate_by_uri: dict[URIRef, Any] = {}
+    for subject, predicate, object_ in triples:
+        if (oxi_predicate := predicate_by_uri.get(predicate)) is None:
+            oxi_predicate = predicate_by_uri[predicate] = to_oxigraph_term(predicate)
+        yield pyoxigraph.Quad(to_oxigraph_term(subject), oxi_predicate, to_oxigraph_term(object_), graph_name)
+
+
+_NTRIPLES_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r"})
+
+
+def to_ntriples_row(triple: tuple) -> str:
+    """Serializes a triple to a line in the N-Triples format."""
+    subject, predicate, object_ = triple
+    return f"{_to_ntriples_term(subject)} {_to_ntriples_term(predicate)} {_to_ntriples_term(object_)} .\n"
+
+
+def _to_ntriples_term(term: Any) -> str:
+    if not isinstance(term, RdfLiteral):
+        return term.n3()
+    # The n3 notation writes multiline literals in triple quotes, which are not allowed in N-Triples.
+    lexical = str(term).translate(_NTRIPLES_ESCAPES)
+    if term.language:
+        return f'"{lexical}"@{term.language}'
+    elif term.datatype:
+        return f'"{lexical}"^^<{term.datatype}>'
+    return f'"{lexical}"'
+
+
 def remove_triples_in_batch(graph: Graph, triples: Iterable[Triple], batch_size: int = 10_000) -> None:
     """Removes triples from the graph store in batches.
 
@@ -53,11 +53,13 @@ class NeatSession:
 
     Args:
         client: The CogniteClient to use for reading and writing data.
-        storage: The storage type to use for storing data and data models. Can be either "memory" or "oxigraph".
+        storage: The storage type to use for storing data and data models. Can be "memory", "oxigraph" or "adaptive".
             In "memory" mode works well for small data sets and when only working with data models. It is works
             well for all notebook environments. In "oxigraph" mode, the data is stored in an Oxigraph database. This
             is more performant for larger data sets and when working with data. Note that this option requires
-            additional dependencies to be installed and is not available in CDF Notebooks.
+            additional dependencies to be installed and is not available in CDF Notebooks. In "adaptive" mode, the
+            data is kept in memory until the data set grows large, and then moved to an Oxigraph database on disk.
+            This also requires the Oxigraph dependencies.
         verbose: Whether to print information about the operations being performed.
         load_engine: Whether to load the Neat Engine. Can be "newest", "cache", or "skip". "newest" will always
             check for the newest version of the engine. "cache" will load the engine if it has been downloaded before.
@@ -87,7 +89,7 @@ class NeatSession:
     def __init__(
         self,
         client: CogniteClient | None = None,
-        storage: Literal["memory", "oxigraph"] | None = None,
+        storage: Literal["memory", "oxigraph", "adaptive"] | None = None,
         storage_path: str | None = None,
         verbose: bool = True,
         load_engine: Literal["newest", "cache", "skip"] = "cache",
@@ -1,8 +1,6 @@
-from typing import cast
-
-from rdflib.query import ResultRow
-
 from cognite.neat._v0.core._constants import NAMED_GRAPH_NAMESPACE
+from cognite.neat._v0.core._store._diff import GraphDiffSummary
+from cognite.neat._v0.core._utils.rdf_ import remove_namespace_from_uri
 
 from ._state import SessionState
 
@@ -26,26 +24,17 @@ class DiffAPI:
         current_uri = NAMED_GRAPH_NAMESPACE[current_named_graph]
         new_uri = NAMED_GRAPH_NAMESPACE[new_named_graph]
 
-        self._state.instances.store.diff(current_uri, new_uri)
-        self._print_summary()
+        summary = self._state.instances.store.diff(current_uri, new_uri)
+        self._print_summary(summary)
 
-    def _print_summary(self) -> None:
+    @staticmethod
+    def _print_summary(summary: GraphDiffSummary) -> None:
         """Print diff summary with triple counts."""
-        store = self._state.instances.store
-
-        add_query = (
-            f"SELECT (COUNT(*) as ?count) WHERE {{ GRAPH <{NAMED_GRAPH_NAMESPACE['DIFF_ADD']}> {{ ?s ?p ?o }} }}"
-        )
-        delete_query = (
-            f"SELECT (COUNT(*) as ?count) WHERE {{ GRAPH <{NAMED_GRAPH_NAMESPACE['DIFF_DELETE']}> {{ ?s ?p ?o }} }}"
-        )
-
-        add_result = cast(ResultRow, next(iter(store.dataset.query(add_query))))
-        delete_result = cast(ResultRow, next(iter(store.dataset.query(delete_query))))
-
-        add_count = int(add_result[0])
-        delete_count = int(delete_result[0])
-
         print("Diff complete:")
-        print(f"  {add_count} triples to add (stored in DIFF_ADD)")
-        print(f"  {delete_count} triples to delete (stored in DIFF_DELETE)")
+        print(f"  {summary.added_count} triples to add (stored in DIFF_ADD)")
+        print(f"  {summary.deleted_count} triples to delete (stored in DIFF_DELETE)")
+        for type_ in sorted(set(summary.added_count_by_type) | set(summary.deleted_count_by_type)):
+            print(
+                f"    {remove_namespace_from_uri(type_)}: {summary.added_count_by_type.get(type_, 0)} to add, "
+                f"{summary.deleted_count_by_type.get(type_, 0)} to delete"
+            )
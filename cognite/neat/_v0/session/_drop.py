@@ -53,6 +53,7 @@ class DropAPI:
             selected_uri_by_type[uri_type_type[type_item]] = type_item
 
         result = self._state.instances.store.queries.update.drop_types(list(selected_uri_by_type.keys()))
+        self._state.instances.store.invalidate_statistics(named_graph)
 
         for type_uri, count in result.items():
             print(f"Dropped {count} instances of type {selected_uri_by_type[type_uri]}")
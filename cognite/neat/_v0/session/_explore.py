@@ -21,11 +21,11 @@ class ExploreAPI:
 
     def types(self) -> pd.DataFrame:
         """List all the types of instances in the session."""
-        return pd.DataFrame(self._state.instances.store.queries.select.types_with_instance_and_property_count())
+        return pd.DataFrame(self._state.instances.store.statistics().types_with_instance_and_property_count())
 
     def properties(self) -> pd.DataFrame:
         """List all the properties of a type of instances in the session."""
-        return pd.DataFrame(self._state.instances.store.queries.select.properties_with_count())
+        return pd.DataFrame(self._state.instances.store.statistics().properties_with_count())
 
     def instance_with_properties(self, type: str) -> dict[str, set[str]]:
         """List all the instances of a type with their properties."""
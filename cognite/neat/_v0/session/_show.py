@@ -100,7 +100,7 @@ class ShowDataModelAPI(ShowBaseAPI):
 
         last_target = self._state.data_model_store.provenance[-1].target_entity
         data_model = last_target.physical or last_target.conceptual
-        analysis = DataModelAnalysis(physical=last_target.physical, conceptual=last_target.conceptual)
+        analysis = DataModelAnalysis.cached(physical=last_target.physical, conceptual=last_target.conceptual)
 
         if last_target.physical is not None:
             di_graph = analysis._physical_di_graph(format="data-model")
@@ -124,7 +124,7 @@ class ShowDataModelImplementsAPI(ShowBaseAPI):
 
         last_target = self._state.data_model_store.provenance[-1].target_entity
         data_model = last_target.physical or last_target.conceptual
-        analysis = DataModelAnalysis(physical=last_target.physical, conceptual=last_target.conceptual)
+        analysis = DataModelAnalysis.cached(physical=last_target.physical, conceptual=last_target.conceptual)
 
         if last_target.physical is not None:
             di_graph = analysis._physical_di_graph(format="implements")
@@ -222,7 +222,8 @@ class ShowInstanceAPI(ShowBaseAPI):
                 "Try running neat in regular Jupyter notebook and set [bold]NeatSession(storage='oxigraph')[/bold]."
             )
 
-        if not self._state.instances.store_type == "oxigraph":
+        # The adaptive store is visualized once it has moved to Oxigraph.
+        if not self._state.instances.store.type_ == "OxigraphStore":
             raise NeatSessionError(
                 "Visualization is only available for Oxigraph store. "
                 'Try setting [bold]NeatSession(storage="oxigraph")[/bold] enable Oxigraph store.'
@@ -250,7 +251,7 @@ class ShowInstanceAPI(ShowBaseAPI):
 
         di_graph = nx.DiGraph()
 
-        types = [type_ for type_, _ in self._state.instances.store.queries.select.summarize_instances()]
+        types = [type_ for type_, _ in self._state.instances.store.statistics().summarize_instances()]
         hex_colored_types = _generate_hex_color_per_type(types)
 
         for (  # type: ignore
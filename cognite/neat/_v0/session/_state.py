@@ -22,7 +22,7 @@ from .exceptions import NeatSessionError, _session_method_wrapper
 class SessionState:
     def __init__(
         self,
-        store_type: Literal["memory", "oxigraph"],
+        store_type: Literal["memory", "oxigraph", "adaptive"],
         storage_path: Path | None = None,
         client: NeatClient | None = None,
     ) -> None:
@@ -122,7 +122,7 @@ class SessionState:
 class InstancesState:
     def __init__(
         self,
-        store_type: Literal["memory", "oxigraph"],
+        store_type: Literal["memory", "oxigraph", "adaptive"],
         storage_path: Path | None = None,
     ) -> None:
         self.store_type = store_type
@@ -145,6 +145,8 @@ class InstancesState:
             if self.storage_path:
                 self.storage_path.mkdir(parents=True, exist_ok=True)
             return NeatInstanceStore.from_oxi_local_store(storage_dir=self.storage_path)
+        elif self.store_type == "adaptive":
+            return NeatInstanceStore.from_adaptive_store(storage_dir=self.storage_path)
         else:
             return NeatInstanceStore.from_memory_store()
 
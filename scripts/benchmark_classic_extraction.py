@@ -0,0 +1,75 @@
+"""Benchmark of converting classic CDF assets to triples with the AssetsExtractor.
+
+The assets are synthetic, each with a parent, a data set, a few labels and a number of metadata keys. The keys
+and a share of the metadata values repeat across the assets, as they do in a typical asset hierarchy. The
+assets are created up front, such that only the conversion to triples is timed.
+
+Run it from the root of the repository:
+
+```bash
+python scripts/benchmark_classic_extraction.py --assets 1000000 --metadata-keys 6
+```
+"""
+
+import argparse
+import random
+import time
+import warnings
+
+from cognite.client.data_classes import Asset, AssetList, Label
+
+# The importers are imported first to avoid a circular import when importing the extractors directly.
+import cognite.neat._v0.core._data_model.importers  # noqa: F401
+from cognite.neat._v0.core._instances.extractors import AssetsExtractor
+
+STATUSES = ["Running", "Stopped", "Under maintenance", "Decommissioned"]
+
+
+def create_assets(count: int, metadata_keys: int) -> AssetList:
+    random.seed(42)
+    assets = AssetList([])
+    for no in range(count):
+        metadata = {f"key{key_no}": random.choice(STATUSES) for key_no in range(metadata_keys - 2)}
+        metadata["serialNumber"] = f"SN-{no:08d}"
+        metadata["weight"] = str(random.randint(1, 100))
+        assets.append(
+            Asset(
+                id=no + 1,
+                external_id=f"asset{no}",
+                name=f"Asset {no}",
+                parent_id=(no // 10) + 1 if no > 0 else None,
+                root_id=1,
+                data_set_id=123,
+                description=f"Synthetic asset number {no}",
+                source="benchmark",
+                labels=[Label(random.choice(["Pump", "Valve", "Motor"]))],
+                metadata=metadata,
+                created_time=1_700_000_000_000,
+                last_updated_time=1_700_000_000_000 + no,
+            )
+        )
+    return assets
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--assets", type=int, default=100_000, help="Number of assets.")
+    parser.add_argument("--metadata-keys", type=int, default=6, help="Number of metadata keys per asset.")
+    args = parser.parse_args()
+
+    assets = create_assets(args.assets, args.metadata_keys)
+    print(f"Assets: {len(assets):,} with {args.metadata_keys} metadata keys each")
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for name, kwargs in [
+            ("as_write, unpacked metadata", dict(as_write=True, unpack_metadata=True)),
+            ("packed metadata", dict(as_write=False, unpack_metadata=False)),
+        ]:
+            extractor = AssetsExtractor(assets, total=len(assets), **kwargs)  # type: ignore[arg-type]
+            start = time.perf_counter()
+            triple_count = sum(1 for _ in extractor.extract())
+            print(f"{name:<30} {time.perf_counter() - start:7.2f} s, {triple_count:,} triples")
+
+
+if __name__ == "__main__":
+    main()
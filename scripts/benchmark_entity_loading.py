@@ -0,0 +1,69 @@
+"""Benchmark of the entity loading when verifying the data model spreadsheets bundled with neat.
+
+Verifying a spreadsheet loads the entities, such as the concept, view, container and value type, of every row.
+The same entity strings repeat many times, and the loaded entities are cached. Each spreadsheet is read once,
+and the verification is timed.
+
+Run it from the root of the repository:
+
+```bash
+python scripts/benchmark_entity_loading.py --repeat 20
+```
+
+Use `--no-cache` to see the time with the entity cache disabled.
+"""
+
+import argparse
+import time
+import timeit
+import warnings
+from typing import Any
+from unittest.mock import patch
+
+import cognite.neat._v0.core._data_model.importers as importers
+from cognite.neat._v0.core._data_model.catalog import classic_model, hello_world_pump, imf_attributes
+from cognite.neat._v0.core._data_model.models.entities import ConceptEntity, EdgeEntity, ViewEntity, _single_value
+from cognite.neat._v0.core._data_model.transformers import VerifyAnyDataModel
+
+SPREADSHEETS = [classic_model, hello_world_pump, imf_attributes]
+# Typical entity strings of a spreadsheet row, with the defaults the spreadsheet metadata gives.
+ENTITIES = [
+    ("ConceptEntity", lambda: ConceptEntity.load("cdf_cdm:CogniteAsset", prefix="my_space", version="v1")),
+    ("ViewEntity", lambda: ViewEntity.load("CogniteAsset", space="my_space", version="v1")),
+    ("EdgeEntity", lambda: EdgeEntity.load("edge(properties=Flow,type=my_space:flow)", space="my_space", version="v1")),
+]
+
+
+@classmethod  # type: ignore[misc]
+def _no_cache_key(cls: type, data: Any, defaults: dict[str, Any]) -> None:
+    return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20, help="Number of times each spreadsheet is verified.")
+    parser.add_argument("--no-cache", action="store_true", help="Disable the entity cache.")
+    args = parser.parse_args()
+
+    cache_key = _no_cache_key if args.no_cache else _single_value.ConceptualEntity._cache_key
+    with warnings.catch_warnings(), patch.object(_single_value.ConceptualEntity, "_cache_key", cache_key):
+        warnings.simplefilter("ignore")
+        for filepath in SPREADSHEETS:
+            imported = importers.ExcelImporter(filepath).to_data_model()
+            _single_value._entity_by_key.clear()
+            durations: list[float] = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                # The validation is skipped, as it needs a client for models that import from CDF.
+                VerifyAnyDataModel(validate=False).transform(imported)
+                durations.append(time.perf_counter() - start)
+            print(
+                f"{filepath.name:<35} first {durations[0] * 1000:7.1f} ms, best {min(durations) * 1000:7.1f} ms, "
+                f"{len(_single_value._entity_by_key):,} cached entities"
+            )
+        for name, load in ENTITIES:
+            print(f"{name + '.load':<35} {timeit.timeit(load, number=10_000) * 100:7.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Benchmark of creating enterprise, solution and data product models on top of the Cognite core model.
+
+The reference model is the Cognite core model extended with generated views in a user space. Each extension
+view implements a core view, has its own container and a number of properties, one of which is a direct
+connection to the previous extension view. Each conversion is timed.
+
+Run it from the root of the repository:
+
+```bash
+python scripts/benchmark_extension_models.py --extensions 500 --properties 20
+```
+"""
+
+import argparse
+import random
+import time
+import warnings
+from collections.abc import Callable
+from pathlib import Path
+
+import cognite.neat._v0.core._data_model.importers as importers
+from cognite.neat._v0.core._data_model.models import PhysicalDataModel
+from cognite.neat._v0.core._data_model.models.data_types import String
+from cognite.neat._v0.core._data_model.models.entities import ContainerEntity, ViewEntity
+from cognite.neat._v0.core._data_model.models.physical import (
+    DMSSchema,
+    PhysicalContainer,
+    PhysicalProperty,
+    PhysicalView,
+)
+from cognite.neat._v0.core._data_model.transformers import (
+    ToDataProductModel,
+    ToEnterpriseModel,
+    ToSolutionModel,
+    VerifyPhysicalDataModel,
+)
+
+COGNITE_CORE_ZIP = (
+    Path(__file__).parent.parent / "tests" / "v0" / "data" / "_schema" / "non_neat" / "cognite_core_v1.zip"
+)
+SPACE = "my_space"
+
+
+def load_reference_model(extensions: int, properties: int) -> PhysicalDataModel:
+    core = VerifyPhysicalDataModel(validate=False).transform(
+        importers.DMSImporter(DMSSchema.from_zip(COGNITE_CORE_ZIP)).to_data_model()
+    )
+    model = core.model_copy(deep=True)
+    model.metadata.space = SPACE
+    model.metadata.external_id = "ExtendedCore"
+    core_views = [view.view for view in core.views]
+    random.seed(42)
+    for no in range(extensions):
+        view = ViewEntity(space=SPACE, externalId=f"Extension{no}", version="v1")
+        container = ContainerEntity(space=SPACE, externalId=f"Extension{no}")
+        model.views.append(PhysicalView(view=view, implements=[random.choice(core_views)], in_model=True))
+        model.containers.append(PhysicalContainer(container=container))  # type: ignore[union-attr]
+        for property_no in range(properties):
+            is_connection = property_no == 0 and no > 0
+            model.properties.append(
+                PhysicalProperty(
+                    view=view,
+                    view_property=f"property{property_no}",
+                    value_type=ViewEntity(space=SPACE, externalId=f"Extension{no - 1}", version="v1")
+                    if is_connection
+                    else String(),
+                    connection="direct" if is_connection else None,
+                    min_count=0,
+                    max_count=1,
+                    immutable=False,
+                    container=container,
+                    container_property=f"property{property_no}",
+                )
+            )
+    return model
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--extensions", type=int, default=500, help="Number of extension views.")
+    parser.add_argument("--properties", type=int, default=20, help="Number of properties per extension view.")
+    args = parser.parse_args()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        reference = load_reference_model(args.extensions, args.properties)
+        print(f"Reference model: {len(reference.views):,} views, {len(reference.properties):,} properties")
+        conversions: list[tuple[str, Callable[[PhysicalDataModel], PhysicalDataModel]]] = [
+            ("ToEnterpriseModel", ToEnterpriseModel(("my_enterprise", "Enterprise", "v1")).transform),
+            (
+                "ToEnterpriseModel(move_connections)",
+                ToEnterpriseModel(("my_enterprise", "Enterprise", "v1"), move_connections=True).transform,
+            ),
+            ("ToSolutionModel(connection)", ToSolutionModel(("my_solution", "Solution", "v1")).transform),
+            ("ToSolutionModel(repeat)", ToSolutionModel(("my_solution", "Solution", "v1"), "repeat").transform),
+            ("ToDataProductModel", ToDataProductModel(("my_product", "Product", "v1")).transform),
+        ]
+        for name, convert in conversions:
+            start = time.perf_counter()
+            output = convert(reference)
+            print(
+                f"{name:<40} {time.perf_counter() - start:7.2f} s, "
+                f"{len(output.views):,} views, {len(output.properties):,} properties"
+            )
+
+
+if __name__ == "__main__":
+    main()
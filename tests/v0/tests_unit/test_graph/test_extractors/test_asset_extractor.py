@@ -47,3 +47,19 @@ def test_asset_extractor_with_packed_metadata():
 
     assert len(store.dataset) == 43
     assert len(list(store.dataset.query(f"Select ?s Where {{ ?s <{DEFAULT_NAMESPACE['metadata']}> ?m}}"))) == 4
+
+
+def test_asset_extractor_cached_conversion_matches_fresh_conversion():
+    assets = AssetList.load(InstanceData.AssetCentricCDF.assets_yaml.read_text())
+    # Same assets twice, such that the second round is converted using the cached predicates and objects.
+    extractor = AssetsExtractor(list(assets) * 2, unpack_metadata=True, as_write=True)
+
+    actual = list(extractor.extract())
+
+    expected = [
+        triple
+        for asset in list(assets) * 2
+        for triple in AssetsExtractor([asset], unpack_metadata=True, as_write=True).extract()
+    ]
+    assert actual == expected
+    assert extractor._metadata_predicate_by_key
@@ -0,0 +1,54 @@
+from cognite.client.data_classes import AssetList, EventList
+from cognite.client.testing import monkeypatch_cognite_client
+
+from cognite.neat._v0.core._instances.extractors import AssetsExtractor, ClassicGraphExtractor
+from tests.v0.data import InstanceData
+
+
+def _mock_classic_client(client_mock) -> None:
+    assets = AssetList.load(InstanceData.AssetCentricCDF.assets_yaml.read_text())
+    events = EventList.load(InstanceData.AssetCentricCDF.events_yaml.read_text())
+    client_mock.assets.aggregate_count.return_value = len(assets)
+    client_mock.assets.return_value = assets
+    client_mock.assets.list.return_value = assets
+    client_mock.assets.retrieve_multiple.return_value = AssetList([])
+    client_mock.events.aggregate_count.return_value = len(events)
+    client_mock.events.return_value = events
+    client_mock.events.list.return_value = events
+    for api in [client_mock.time_series, client_mock.sequences]:
+        api.aggregate_count.return_value = 0
+        api.return_value = []
+        api.list.return_value = []
+    client_mock.files.return_value = []
+    client_mock.files.list.return_value = []
+    client_mock.relationships.return_value = []
+    client_mock.labels.retrieve.return_value = []
+    client_mock.data_sets.retrieve_multiple.return_value = []
+
+
+def test_classic_graph_extractor_concurrently_matches_sequential() -> None:
+    with monkeypatch_cognite_client() as client_mock:
+        _mock_classic_client(client_mock)
+
+    sequential = set(
+        ClassicGraphExtractor(client_mock, data_set_external_id="nordic44", skip_sequence_rows=True).extract()
+    )
+    concurrent = set(
+        ClassicGraphExtractor(
+            client_mock, data_set_external_id="nordic44", skip_sequence_rows=True, max_workers=4, partitions=4
+        ).extract()
+    )
+
+    assert sequential
+    assert concurrent == sequential
+    assert client_mock.assets.list.call_args.kwargs["partitions"] == 4
+
+
+def test_asset_extractor_with_partitions() -> None:
+    with monkeypatch_cognite_client() as client_mock:
+        _mock_classic_client(client_mock)
+
+    triples = list(AssetsExtractor.from_dataset(client_mock, data_set_external_id="nordic44", partitions=2).extract())
+
+    assert triples
+    client_mock.assets.list.assert_called_once_with(partitions=2, limit=None, data_set_external_ids="nordic44")
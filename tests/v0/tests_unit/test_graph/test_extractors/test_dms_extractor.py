@@ -10,6 +10,7 @@ from cognite.client.data_classes.data_modeling.instances import Instance, Proper
 from requests import Response
 
 from cognite.neat._v0.core._client.testing import monkeypatch_neat_client
+from cognite.neat._v0.core._constants import DEFAULT_SPACE_URI
 from cognite.neat._v0.core._instances.extractors import DMSExtractor
 from tests.v0.data import GraphData
 
@@ -37,6 +38,22 @@ class TestDMSExtractor:
         extra_triples = triples - expected_triples
         assert len(extra_triples) == 0
 
+    def test_extract_instances_concurrently(self) -> None:
+        total_instances_pair_by_view: dict[dm.ViewId, tuple[int | None, list[Instance]]] = defaultdict(lambda: (0, []))
+        for instance in instance_apply_to_read(GraphData.car.INSTANCES):
+            if isinstance(instance, dm.Node):
+                view_id = next(iter(instance.properties.keys()))
+            else:
+                view_id = dm.ViewId("sp_example_car", "Car", "v1")
+            total_instances, instances = total_instances_pair_by_view[view_id]
+            instances.append(instance)
+            total_instances_pair_by_view[view_id] = total_instances + 1, instances
+
+        sequential = set(DMSExtractor(total_instances_pair_by_view).extract())
+        concurrent = set(DMSExtractor(total_instances_pair_by_view, max_workers=4, buffer_size=1).extract())
+
+        assert concurrent == sequential
+
     def test_extract_instances_enforce_type(self) -> None:
         view = dm.View(
             space="cdf_cdm",
@@ -87,6 +104,81 @@ class TestDMSExtractor:
         type_count = len({triple[2] for triple in triples if triple[1] == rdflib.RDF.type})
         assert type_count == 1
 
+    def test_shared_edge_type_of_view_without_nodes_is_extracted(self) -> None:
+        edge_type = dm.DirectRelationReference("my_space", "relatedTo")
+
+        def create_view(external_id: str) -> dm.View:
+            return dm.View(
+                space="my_space",
+                external_id=external_id,
+                version="v1",
+                properties={
+                    "related": dm.MultiEdgeConnection(
+                        type=edge_type,
+                        source=dm.ViewId("my_space", "Other", "v1"),
+                        name=None,
+                        description=None,
+                        edge_source=None,
+                        direction="outwards",
+                    )
+                },
+                filter=None,
+                implements=None,
+                writable=True,
+                used_for="node",
+                is_global=False,
+                last_updated_time=1,
+                created_time=1,
+                description=None,
+                name=None,
+            )
+
+        empty_view, view = create_view("Empty"), create_view("WithNodes")
+        node = dm.Node(
+            space="my_space",
+            external_id="node1",
+            version=1,
+            type=None,
+            properties=None,
+            last_updated_time=1,
+            created_time=1,
+            deleted_time=None,
+        )
+        edge = dm.Edge(
+            space="my_space",
+            external_id="edge1",
+            version=1,
+            type=edge_type,
+            start_node=dm.DirectRelationReference("my_space", "node1"),
+            end_node=dm.DirectRelationReference("my_space", "node2"),
+            properties=None,
+            last_updated_time=1,
+            created_time=1,
+            deleted_time=None,
+        )
+
+        def aggregate(view: dm.ViewId, **_: object) -> AggregatedNumberedValue:
+            return AggregatedNumberedValue("externalId", 0 if view == empty_view.as_id() else 1)
+
+        def iterate(instance_type: str, **kwargs: object) -> list[Instance]:
+            if instance_type == "edge":
+                return [edge] if kwargs.get("filter_") is not None else []
+            return [node] if kwargs.get("source") == view.as_id() else []
+
+        with monkeypatch_neat_client() as client:
+            client.data_modeling.instances.aggregate.side_effect = aggregate
+            client.instances.iterate = MagicMock(side_effect=iterate)
+            extractor = DMSExtractor.from_views(client, [empty_view, view])
+
+            triples = list(extractor.extract())
+
+        edge_triples = [
+            triple
+            for triple in triples
+            if triple[1] == rdflib.URIRef(f"{DEFAULT_SPACE_URI.format(space='my_space')}relatedTo")
+        ]
+        assert len(edge_triples) == 1
+
 
 def instance_apply_to_read(instances: Iterable[dm.NodeApply | dm.EdgeApply]) -> Iterable[Instance]:
     for instance in instances:
@@ -0,0 +1,39 @@
+from collections import Counter
+from pathlib import Path
+
+from rdflib import RDF, Graph
+
+from cognite.neat._v0.core._instances.extractors import MockGraphGenerator
+from tests.v0.data import GraphData
+
+
+def test_generate_seeded_graph_with_fan_out() -> None:
+    data_model = GraphData.car.get_care_rules()
+    make = next(prop for prop in data_model.properties if prop.property_ == "make")
+    make.max_count = None
+    concept_count = {"Manufacturer": 5, "Color": 4, "Car": 50}
+
+    generator = MockGraphGenerator(data_model, dict(concept_count), seed=42, max_fan_out=3)
+    triples = list(generator.extract())
+
+    assert triples == list(MockGraphGenerator(data_model, dict(concept_count), seed=42, max_fan_out=3).extract())
+    type_counts = Counter(str(type_).rsplit("/", 1)[-1] for _, predicate, type_ in triples if predicate == RDF.type)
+    assert type_counts == concept_count
+    # Colors allow a single value, while cars can have up to three manufacturers.
+    color_make_pairs = Counter(
+        (str(predicate).rsplit("/", 1)[-1], source) for source, predicate, _ in triples if predicate != RDF.type
+    )
+    assert {count for (predicate, _), count in color_make_pairs.items() if predicate == "color"} == {1}
+    assert {count for (predicate, _), count in color_make_pairs.items() if predicate == "make"} == {1, 2, 3}
+    # All manufacturers make at least one car.
+    assert len({target for _, predicate, target in triples if str(predicate).endswith("/make")}) == 5
+
+
+def test_write_to_file(tmp_path: Path) -> None:
+    generator = MockGraphGenerator(GraphData.car.get_care_rules(), {"Manufacturer": 2, "Color": 2, "Car": 10}, seed=1)
+    filepath = tmp_path / "cars.nt"
+
+    triple_count = generator.write_to_file(filepath, batch_size=7)
+
+    graph = Graph().parse(filepath, format="nt")
+    assert len(graph) == triple_count == len(set(generator.extract()))
@@ -3,6 +3,7 @@ from rdflib import RDF, XSD, Literal
 
 from cognite.neat._v0.core._client.testing import monkeypatch_neat_client
 from cognite.neat._v0.core._instances.extractors import RAWExtractor
+from cognite.neat._v0.core._utils.auxiliary import string_to_ideal_type
 
 
 class TestRAWExtractor:
@@ -35,3 +36,33 @@ class TestRAWExtractor:
             (ns["key2"], ns["column3"], Literal("1983-01-22T00:00:00", datatype=XSD.dateTime)),
             (ns["key2"], ns["column4"], ns["key1"]),
         }
+
+    def test_extract_typed_columns_with_outliers(self) -> None:
+        values_by_column = {
+            "integer": ["1", "2", "2.5", "abc"],
+            "float": ["1.5", "2.5", "3", "nan"],
+            "boolean": ["true", "FALSE", "1", "yes"],
+            "date": ["1983-01-22", "1983-01-23", "19830124", "1.0"],
+        }
+        with monkeypatch_neat_client() as client:
+            client.raw.rows.return_value = [
+                Row(f"key{no}", {column: values[no] for column, values in values_by_column.items()}, 0)
+                for no in range(4)
+            ]
+        extractor = RAWExtractor(client, "my_db", "my_table", str_to_ideal_type=True, max_workers=2)
+        extractor._chunk_size = 1
+        ns = extractor.namespace
+
+        triples = set(extractor.extract())
+
+        assert {(subject, object_) for subject, predicate, object_ in triples if predicate != RDF.type} == {
+            (ns[f"key{no}"], Literal(string_to_ideal_type(values[no])))
+            for values in values_by_column.values()
+            for no in range(4)
+        }
+        assert {object_.toPython() for subject, predicate, object_ in triples if predicate == ns["integer"]} == {
+            1,
+            2,
+            2.5,
+            "abc",
+        }
@@ -0,0 +1,80 @@
+import gzip
+import io
+import tarfile
+import zipfile
+from pathlib import Path
+
+import pytest
+from rdflib import RDF, Namespace
+
+from cognite.neat._v0.core._instances.extractors import RdfFilesExtractor
+from cognite.neat._v0.core._instances.extractors._rdf_file import RdfSource
+from cognite.neat._v0.core._issues.warnings import FileReadWarning
+from cognite.neat._v0.core._store import NeatInstanceStore
+
+EX = Namespace("http://example.org/")
+
+
+def _turtle(*names: str) -> str:
+    return "@prefix ex: <http://example.org/> .\n" + "".join(f"ex:{name} a ex:Thing .\n" for name in names)
+
+
+def _ntriples(*names: str) -> str:
+    return "".join(f"<{EX[name]}> <{RDF.type}> <{EX.Thing}> .\n" for name in names)
+
+
+@pytest.fixture()
+def rdf_directory(tmp_path: Path) -> Path:
+    directory = tmp_path / "export"
+    (directory / "nested").mkdir(parents=True)
+    (directory / "plain.ttl").write_text(_turtle("a"))
+    (directory / "nested" / "compressed.nt.gz").write_bytes(gzip.compress(_ntriples("b", "c").encode()))
+    (directory / "broken.ttl").write_text("@prefix ex: <http://example.org/> .\nex:broken a")
+    (directory / "notes.txt").write_text("Not RDF, skipped")
+    with zipfile.ZipFile(directory / "archive.zip", "w") as archive:
+        archive.writestr("in_zip.ttl", _turtle("d"))
+    member = tmp_path / "in_tar.nt"
+    member.write_text(_ntriples("e") + '_:blank <http://example.org/name> "blank" .\n')
+    with tarfile.open(directory / "archive.tar.gz", "w:gz") as archive:
+        archive.add(member, arcname="in_tar.nt")
+    return directory
+
+
+@pytest.mark.parametrize("store_type", ["memory", "oxigraph"])
+def test_load_directory_with_archives(rdf_directory: Path, store_type: str) -> None:
+    store = (
+        NeatInstanceStore.from_memory_store() if store_type == "memory" else NeatInstanceStore.from_oxi_local_store()
+    )
+    extractor = RdfFilesExtractor(rdf_directory, max_workers=2)
+
+    issues = store.write(extractor)
+
+    assert set(store.dataset.subjects(RDF.type, EX.Thing)) == {EX.a, EX.b, EX.c, EX.d, EX.e}
+    assert len(list(store.dataset.triples((None, EX.name, None)))) == 1
+    assert [Path(issue.filepath).name for issue in issues if isinstance(issue, FileReadWarning)] == ["broken.ttl"]
+
+
+@pytest.mark.parametrize("store_type", ["memory", "oxigraph"])
+def test_load_directory_into_named_graph(rdf_directory: Path, store_type: str) -> None:
+    store = (
+        NeatInstanceStore.from_memory_store() if store_type == "memory" else NeatInstanceStore.from_oxi_local_store()
+    )
+    (rdf_directory / "quads.nq").write_text(f"<{EX.f}> <{RDF.type}> <{EX.Thing}> <{EX.quadGraph}> .\n")
+
+    store.write(RdfFilesExtractor(rdf_directory, max_workers=2), named_graph=EX.myGraph)
+
+    assert set(store.graph(EX.myGraph).subjects(RDF.type, EX.Thing)) == {EX.a, EX.b, EX.c, EX.d, EX.e}
+    assert set(store.graph(EX.quadGraph).subjects(RDF.type, EX.Thing)) == {EX.f}
+    assert not set(store.graph().subjects(RDF.type, EX.Thing))
+
+
+def test_chunks_split_on_lines_until_blank_node() -> None:
+    content = (_ntriples("a", "b", "c") + "_:x <http://example.org/p> _:y .\n" + _ntriples("d")).encode()
+    source = RdfSource("data.nt", "nt", lambda: io.BytesIO(content))
+
+    chunks = list(source.iterate_chunks(chunk_size=10))
+
+    assert all(isinstance(chunk, bytes) and chunk.endswith(b"\n") for chunk in chunks[:-1])
+    # Oxigraph scopes blank nodes to a single load, thus everything from the first blank node is one load.
+    assert chunks[-1].read() == content[content.index(b"_:x") :]
+    assert b"".join(chunks[:-1]) == content[: content.index(b"_:x")]
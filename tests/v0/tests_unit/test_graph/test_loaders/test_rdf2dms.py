@@ -1,5 +1,11 @@
+import gzip
+from pathlib import Path
+from typing import Literal
+
 import pytest
+from cognite.client import data_modeling as dm
 from cognite.client.data_classes.data_modeling import ViewList
+from rdflib import URIRef
 
 from cognite.neat._v0.core._client.data_classes.statistics import (
     CountLimitPair,
@@ -17,6 +23,12 @@ from cognite.neat._v0.core._data_model.transformers._converters import (
     ToCompliantEntities,
 )
 from cognite.neat._v0.core._instances.loaders import DMSLoader, InstanceSpaceLoader
+from cognite.neat._v0.core._instances.loaders._ndjson import (
+    NDJSONInstanceWriter,
+    find_ndjson_shards,
+    read_ndjson_instances,
+)
+from cognite.neat._v0.core._instances.loaders._uri_table import InstanceUriTable
 from cognite.neat._v0.core._issues import IssueList
 from cognite.neat._v0.core._issues.errors import WillExceedLimitError
 from cognite.neat._v0.core._store import NeatInstanceStore
@@ -65,6 +77,83 @@ class TestDMSLoader:
 
         assert dict(sorted(instances_expected.items())) == dict(sorted(instances_actual.items()))
 
+    @pytest.mark.parametrize(
+        "filename, shard_by",
+        [
+            pytest.param("instances.ndjson", None, id="single file"),
+            pytest.param("instances.ndjson.gz", "view", id="gzip per view"),
+            pytest.param("instances.jsonl", 2, id="per two instances"),
+        ],
+    )
+    def test_write_car_example_to_ndjson(
+        self,
+        filename: str,
+        shard_by: Literal["view"] | int | None,
+        car_case: tuple[PhysicalDataModel, ConceptualDataModel, NeatInstanceStore],
+        tmp_path: Path,
+    ) -> None:
+        dms_rules, info_rules, store = car_case
+        loader = DMSLoader(
+            dms_rules,
+            info_rules,
+            store,
+            InstanceSpaceLoader(instance_space=GraphData.car.INSTANCE_SPACE).space_by_instance_uri,
+        )
+        filepath = tmp_path / filename
+
+        loader.write_to_file(filepath, shard_by=shard_by)
+
+        expected = sorted(
+            (item.dump() for item in loader.load(stop_on_exception=False)), key=lambda item: str(item.items())
+        )
+        actual = sorted(
+            (item.dump() for item in DMSLoader.read_from_file(filepath)), key=lambda item: str(item.items())
+        )
+        assert actual == expected
+        shards = find_ndjson_shards(filepath)
+        if shard_by is None:
+            assert shards == [filepath]
+        elif shard_by == "view":
+            assert {shard.name for shard in shards} >= {"instances-Car.ndjson.gz", "instances-Manufacturer.ndjson.gz"}
+        else:
+            assert len(shards) == (len(GraphData.car.INSTANCES) + 1) // 2
+            assert all(sum(1 for _ in read_ndjson_instances(shard)) <= 2 for shard in shards)
+
+    def test_rewrite_car_example_to_ndjson_replaces_earlier_output(
+        self, car_case: tuple[PhysicalDataModel, ConceptualDataModel, NeatInstanceStore], tmp_path: Path
+    ) -> None:
+        dms_rules, info_rules, store = car_case
+        loader = DMSLoader(
+            dms_rules,
+            info_rules,
+            store,
+            InstanceSpaceLoader(instance_space=GraphData.car.INSTANCE_SPACE).space_by_instance_uri,
+        )
+        filepath = tmp_path / "[instances].ndjson"
+        unrelated = tmp_path / "[instances]-unrelated.ndjson"
+        unrelated.write_text("not written by neat\n")
+        expected_count = sum(1 for _ in loader.load(stop_on_exception=False))
+
+        for shard_by in [None, "view", 1, None]:
+            loader.write_to_file(filepath, shard_by=shard_by)
+
+            assert sum(1 for _ in DMSLoader.read_from_file(filepath)) == expected_count
+        assert find_ndjson_shards(filepath) == [filepath]
+        assert {path.name for path in tmp_path.iterdir()} == {filepath.name, unrelated.name}
+
+    def test_required_capabilities_cover_instance_spaces(
+        self, car_case: tuple[PhysicalDataModel, ConceptualDataModel, NeatInstanceStore]
+    ) -> None:
+        dms_rules, info_rules, store = car_case
+        space_by_instance_uri = InstanceUriTable()
+        for no, space in enumerate(["space1", "space2", "space1"]):
+            space_by_instance_uri.add(URIRef(f"http://example.org/instance{no}"), space)
+        loader = DMSLoader(dms_rules, info_rules, store, space_by_instance_uri)
+
+        capabilities = loader._get_required_capabilities()
+
+        assert capabilities[0].scope.space_ids == ["space1", "space2"]
+
     def test_load_car_example_instance_limit_reached(
         self, car_case: tuple[PhysicalDataModel, ConceptualDataModel, NeatInstanceStore]
     ) -> None:
@@ -105,3 +194,18 @@ class TestDMSLoader:
             _ = loader.load_into_cdf(client)
 
         assert excinfo.value == WillExceedLimitError("instances", 6, "neat-project", 250_000, DMS_INSTANCE_LIMIT_MARGIN)
+
+
+@pytest.mark.parametrize("filename", ["instances.ndjson", "instances.ndjson.gz"])
+def test_ndjson_writer_uses_given_line_separator(filename: str, tmp_path: Path) -> None:
+    filepath = tmp_path / filename
+    nodes = [dm.NodeApply("my_space", f"node{no}") for no in range(2)]
+
+    with NDJSONInstanceWriter(filepath, new_line="\r\n") as writer:
+        for node in nodes:
+            writer.write(node)
+
+    raw = gzip.decompress(filepath.read_bytes()) if filename.endswith(".gz") else filepath.read_bytes()
+    assert raw.count(b"\r\n") == len(nodes)
+    assert b"\r\r" not in raw
+    assert [item.dump() for item in read_ndjson_instances(filepath)] == [node.dump() for node in nodes]
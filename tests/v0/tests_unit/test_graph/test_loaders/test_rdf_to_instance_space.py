@@ -131,3 +131,35 @@ class TestInstanceSpaceLoader:
             "http://purl.org/cognite/neat/my_instance2. The error was: This instance "
             "was not extracted from CDF."
         )
+
+    def test_lookup_source_space_once_per_instance(self) -> None:
+        store = NeatInstanceStore.from_oxi_local_store()
+        space1 = Namespace(DEFAULT_SPACE_URI.format(space="space1"))
+        space2 = Namespace(DEFAULT_SPACE_URI.format(space="space2"))
+        store._add_triples(
+            [
+                (space1["pump"], RDF.type, space1["Pump"]),
+                (space1["pump"], RDF.type, space1["Equipment"]),
+                (space1["pump"], space1["connectedTo"], space1["pipe"]),
+                (space1["pipe"], RDF.type, space1["Pipe"]),
+                (space1["pipe"], space1["connectedTo"], space2["tank"]),
+                (DEFAULT_NAMESPACE["unknown"], RDF.type, space1["Pump"]),
+                (DEFAULT_NAMESPACE["unknown"], RDF.type, space1["Equipment"]),
+            ],
+            named_graph=store.default_named_graph,
+        )
+        loader = InstanceSpaceLoader(graph_store=store, use_source_space=True)
+
+        loaded = list(loader.load(stop_on_exception=False))
+
+        assert {item.space for item in loaded if isinstance(item, SpaceApply)} == {"space1", "space2"}
+        assert [issue.identifier for issue in loaded if not isinstance(issue, SpaceApply)] == [
+            DEFAULT_NAMESPACE["unknown"]
+        ]
+        assert loader.space_by_instance_uri == {
+            space1["pump"]: "space1",
+            space1["pipe"]: "space1",
+            space2["tank"]: "space2",
+        }
+        # All instances in the same space share the same string.
+        assert loader.space_by_instance_uri[space1["pump"]] is loader.space_by_instance_uri[space1["pipe"]]
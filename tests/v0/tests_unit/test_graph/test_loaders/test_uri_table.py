@@ -0,0 +1,38 @@
+import pytest
+from rdflib import Namespace, URIRef
+
+from cognite.neat._v0.core._instances.loaders._uri_table import InstanceUriTable
+
+SPACE1 = Namespace("http://purl.org/cognite/space/space1#")
+SPACE2 = Namespace("http://purl.org/cognite/space/space2#")
+
+
+class TestInstanceUriTable:
+    def test_lookup_like_dict(self) -> None:
+        expected = {SPACE1[f"instance{no}"]: "space1" for no in range(100)}
+        expected.update({SPACE2[f"instance{no}"]: "space2" for no in range(50)})
+        expected[URIRef("http://example.org/with/slash/æøå")] = "other"
+        table = InstanceUriTable()
+        for uri, space in expected.items():
+            table.add(uri, space)
+        # Adding again replaces the value.
+        table.add(SPACE1["instance0"], "space2")
+        expected[SPACE1["instance0"]] = "space2"
+
+        assert dict(table) == expected
+        assert len(table) == len(expected)
+        assert table[SPACE2["instance3"]] == "space2"
+        assert SPACE1["instance99"] in table
+        assert SPACE1["instance100"] not in table
+        assert table.distinct_values() == set(table.values()) == {"space1", "space2", "other"}
+        with pytest.raises(KeyError):
+            _ = table[SPACE1["instance100"]]
+
+    def test_default_value(self) -> None:
+        table = InstanceUriTable(default="fallback")
+        table.add(SPACE1["instance"], "space1")
+
+        assert table[SPACE1["instance"]] == "space1"
+        assert table[SPACE1["unknown"]] == "fallback"
+        assert SPACE1["unknown"] not in table
+        assert set(table.values()) == {"space1"}
@@ -1,6 +1,10 @@
+import pytest
+from rdflib import RDF, Graph, Literal
+
 from cognite.neat._v0.core._constants import DEFAULT_NAMESPACE
 from cognite.neat._v0.core._instances import extractors, transformers
 from cognite.neat._v0.core._issues.errors import NeatValueError
+from cognite.neat._v0.core._issues.warnings import NeatValueWarning
 from cognite.neat._v0.core._store import NeatInstanceStore
 from tests.v0.data import InstanceData
 
@@ -63,3 +67,39 @@ def test_asset_depth_transformer_warning():
     issues2 = store.transform(transformer)
     assert len(issues2) == 1
     assert issues2[0] == NeatValueError("Cannot transform graph store with AddAssetDepth, already applied")
+
+
+def test_asset_depth_transformer_multiple_parents_and_cycle():
+    ns = DEFAULT_NAMESPACE
+    graph = Graph()
+    for child, parent in [
+        ("root", None),
+        ("a", "root"),
+        ("b", "a"),
+        ("c", "root"),
+        # Two parents, the depth is the number of distinct ancestors
+        ("multi", "b"),
+        ("multi", "c"),
+        ("belowMulti", "multi"),
+        # Cycle
+        ("cycle1", "cycle2"),
+        ("cycle2", "cycle1"),
+    ]:
+        graph.add((ns[child], RDF.type, ns.Asset))
+        if parent:
+            graph.add((ns[child], ns.parentId, ns[parent]))
+
+    with pytest.warns(NeatValueWarning):
+        transformers.AddAssetDepth().transform(graph)
+
+    assert {subject.removeprefix(ns): depth.toPython() for subject, depth in graph.subject_objects(ns.depth)} == {
+        "root": 0,
+        "a": 1,
+        "b": 2,
+        "c": 1,
+        "multi": 4,
+        "belowMulti": 5,
+        "cycle1": 2,
+        "cycle2": 2,
+    }
+    assert graph.value(ns.b, ns.depth) == Literal(2)
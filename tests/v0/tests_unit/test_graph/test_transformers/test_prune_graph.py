@@ -2,10 +2,14 @@ from collections.abc import Iterable
 
 import pytest
 from _pytest.mark import ParameterSet
-from rdflib import RDF
+from rdflib import RDF, Literal, Namespace
 
 from cognite.neat._v0.core._constants import get_default_prefixes_and_namespaces
-from cognite.neat._v0.core._instances.transformers import PruneDeadEndEdges
+from cognite.neat._v0.core._instances.transformers import (
+    PruneDanglingNodes,
+    PruneDeadEndEdges,
+    PruneInstancesOfUnknownType,
+)
 from cognite.neat._v0.core._shared import Triple
 from cognite.neat._v0.core._store import NeatInstanceStore
 
@@ -85,3 +89,44 @@ class TestPruneGraph:
     def test_prune_dead_end_edges(self): ...
 
     def test_prune_types(self): ...
+
+
+EX = Namespace("http://example.org/")
+
+
+def test_prune_dangling_nodes_removes_nodes_made_dangling_by_previous_type() -> None:
+    store = NeatInstanceStore.from_memory_store()
+    store._add_triples(
+        [
+            (EX.pump, RDF.type, EX.Pump),
+            (EX.pump, EX.disc, EX.connectedDisc),
+            (EX.connectedDisc, RDF.type, EX.Disc),
+            (EX.danglingDisc, RDF.type, EX.Disc),
+            (EX.danglingDisc, EX.text, EX.text),
+            (EX.text, RDF.type, EX.Text),
+            (EX.orphanText, RDF.type, EX.Text),
+        ],
+        store.default_named_graph,
+    )
+
+    PruneDanglingNodes([EX.Disc, EX.Text]).transform(store.dataset)
+
+    assert set(store.dataset.subjects(unique=True)) == {EX.pump, EX.connectedDisc}
+
+
+def test_prune_instances_of_unknown_type() -> None:
+    store = NeatInstanceStore.from_memory_store()
+    store._add_triples(
+        [
+            (EX.pump, RDF.type, EX.Pump),
+            (EX.pump, EX.name, Literal("Pump")),
+            (EX.untyped, EX.name, Literal("Untyped")),
+            (EX.untyped, EX.connectedTo, EX.pump),
+        ],
+        store.default_named_graph,
+    )
+
+    result = PruneInstancesOfUnknownType().transform(store.dataset)
+
+    assert set(store.dataset.subjects(unique=True)) == {EX.pump}
+    assert result.removed == 1
@@ -0,0 +1,80 @@
+import pytest
+from rdflib import RDF, Graph, Literal, URIRef
+
+from cognite.neat._v0.core._constants import CLASSIC_CDF_NAMESPACE as CLASSIC
+from cognite.neat._v0.core._instances import transformers
+from cognite.neat._v0.core._issues.warnings import ResourceNotFoundWarning
+
+
+def _relationship_graph(relationship_type: URIRef, asset_type: URIRef, time_series_type: URIRef) -> Graph:
+    graph = Graph()
+    for no in range(3):
+        graph.add((CLASSIC[f"Asset_{no}"], RDF.type, asset_type))
+        graph.add((CLASSIC[f"Asset_{no}"], CLASSIC.externalId, Literal(f"asset{no}")))
+        graph.add((CLASSIC[f"TimeSeries_{no}"], RDF.type, time_series_type))
+        graph.add((CLASSIC[f"TimeSeries_{no}"], CLASSIC.externalId, Literal(f"ts{no}")))
+    for no, (source, target, target_type) in enumerate(
+        [
+            ("asset0", "ts0", CLASSIC.TimeSeries),
+            ("asset0", "asset1", CLASSIC.Asset),
+            ("asset2", "unknown", CLASSIC.Asset),
+        ]
+    ):
+        relationship = CLASSIC[f"Relationship_{no}"]
+        graph.add((relationship, RDF.type, relationship_type))
+        graph.add((relationship, CLASSIC.externalId, Literal(f"relationship{no}")))
+        graph.add((relationship, CLASSIC.sourceExternalId, Literal(source)))
+        graph.add((relationship, CLASSIC.sourceType, CLASSIC.Asset))
+        graph.add((relationship, CLASSIC.targetExternalId, Literal(target)))
+        graph.add((relationship, CLASSIC.targetType, target_type))
+        graph.add((relationship, CLASSIC.confidence, Literal(0.5)))
+    return graph
+
+
+def test_relationship_as_edge_transformer() -> None:
+    graph = _relationship_graph(CLASSIC.Relationship, CLASSIC.Asset, CLASSIC.TimeSeries)
+
+    with pytest.warns(ResourceNotFoundWarning):
+        transformers.RelationshipAsEdgeTransformer().transform(graph)
+
+    assert set(graph.subjects(RDF.type, CLASSIC.Relationship)) == set()
+    assert set(graph.triples((None, CLASSIC.relationshipTimeseries, None))) == {
+        (CLASSIC.Asset_0, CLASSIC.relationshipTimeseries, CLASSIC.relationship0)
+    }
+    assert set(graph.predicate_objects(CLASSIC.relationship1)) == {
+        (RDF.type, CLASSIC.AssetToAssetEdge),
+        (CLASSIC.confidence, Literal(0.5)),
+        (CLASSIC.startNode, CLASSIC.Asset_0),
+        (CLASSIC.endNode, CLASSIC.Asset_1),
+    }
+
+
+def test_lookup_relationship_source_target() -> None:
+    graph = _relationship_graph(CLASSIC.ClassicRelationship, CLASSIC.ClassicAsset, CLASSIC.ClassicTimeSeries)
+
+    with pytest.warns(ResourceNotFoundWarning):
+        transformers.LookupRelationshipSourceTarget(CLASSIC, type_prefix="Classic").transform(graph)
+
+    assert graph.value(CLASSIC.Relationship_0, CLASSIC.targetExternalId) == CLASSIC.TimeSeries_0
+    assert graph.value(CLASSIC.Relationship_1, CLASSIC.sourceExternalId) == CLASSIC.Asset_0
+    assert graph.value(CLASSIC.Relationship_1, CLASSIC.targetExternalId) == CLASSIC.Asset_1
+    # The unknown target is left as is.
+    assert graph.value(CLASSIC.Relationship_2, CLASSIC.targetExternalId) == Literal("unknown")
+
+
+def test_lookup_relationship_source_target_with_numeric_external_ids() -> None:
+    graph = Graph()
+    graph.add((CLASSIC.Asset_0, RDF.type, CLASSIC.ClassicAsset))
+    graph.add((CLASSIC.Asset_0, CLASSIC.externalId, Literal(123)))
+    graph.add((CLASSIC.Asset_1, RDF.type, CLASSIC.ClassicAsset))
+    graph.add((CLASSIC.Asset_1, CLASSIC.externalId, Literal(456)))
+    graph.add((CLASSIC.Relationship_0, RDF.type, CLASSIC.ClassicRelationship))
+    graph.add((CLASSIC.Relationship_0, CLASSIC.sourceExternalId, Literal(123)))
+    graph.add((CLASSIC.Relationship_0, CLASSIC.sourceType, CLASSIC.Asset))
+    graph.add((CLASSIC.Relationship_0, CLASSIC.targetExternalId, Literal(456)))
+    graph.add((CLASSIC.Relationship_0, CLASSIC.targetType, CLASSIC.Asset))
+
+    transformers.LookupRelationshipSourceTarget(CLASSIC, type_prefix="Classic").transform(graph)
+
+    assert graph.value(CLASSIC.Relationship_0, CLASSIC.sourceExternalId) == CLASSIC.Asset_0
+    assert graph.value(CLASSIC.Relationship_0, CLASSIC.targetExternalId) == CLASSIC.Asset_1
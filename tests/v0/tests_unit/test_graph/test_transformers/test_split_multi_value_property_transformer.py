@@ -1,3 +1,5 @@
+from rdflib import RDF, Graph, Literal, Namespace
+
 from cognite.neat._v0.core._data_model.analysis import DataModelAnalysis
 from cognite.neat._v0.core._data_model.importers import InferenceImporter
 from cognite.neat._v0.core._instances.examples import nordic44_knowledge_graph
@@ -15,3 +17,30 @@ def test_split_multi_value_property():
 
     rules = InferenceImporter.from_graph_store(store).to_data_model().unverified_data_model.as_verified_data_model()
     assert len(DataModelAnalysis(rules).multi_value_properties) == 0
+
+
+def test_split_multi_value_property_single_scan() -> None:
+    namespace = Namespace("http://example.com/")
+    graph = Graph()
+    for triple in [
+        (namespace["pump1"], RDF.type, namespace["Pump"]),
+        (namespace["pump1"], namespace["connectedTo"], namespace["valve1"]),
+        (namespace["pump2"], RDF.type, namespace["Pump"]),
+        (namespace["pump2"], namespace["connectedTo"], Literal("valve2")),
+        (namespace["pump2"], namespace["name"], Literal("Pump 2")),
+        (namespace["valve1"], RDF.type, namespace["Valve"]),
+    ]:
+        graph.add(triple)
+    transformer = SplitMultiValueProperty()
+
+    # The count query is a single count row, as the base transformer expects.
+    assert [int(row[0]) for row in graph.query(transformer._count_query())] == [len(graph)]
+
+    result = transformer.transform(graph)
+
+    assert result.affected_nodes_count == 2
+    assert result.modified == 2
+    assert (namespace["pump1"], namespace["connectedTo_Valve"], namespace["valve1"]) in graph
+    assert (namespace["pump2"], namespace["connectedTo_string"], Literal("valve2")) in graph
+    assert (namespace["pump2"], namespace["name"], Literal("Pump 2")) in graph
+    assert not list(graph.triples((None, namespace["connectedTo"], None)))
@@ -1,9 +1,15 @@
+import warnings
+from unittest.mock import MagicMock
+
+import pytest
 from cognite.client import data_modeling as dm
 from cognite.client.data_classes.data_modeling.containers import BTreeIndex
+from cognite.client.exceptions import CogniteAPIError
 
 from cognite.neat._v0.core._client._api.data_modeling_loaders import (
     ContainerLoader,
     DataModelLoader,
+    MultiCogniteAPIError,
     ViewLoader,
 )
 
@@ -88,6 +94,20 @@ class TestViewLoader:
             ).dump()
         )
 
+    def test_recover_coupled_views_by_levels(self) -> None:
+        parent = dm.ViewApply("my_space", "parent", "v1")
+        child = dm.ViewApply("my_space", "child", "v1", implements=[parent.as_id()])
+        other = dm.ViewApply("my_space", "other", "v1")
+        client = MagicMock()
+        client.data_modeling.views.apply.side_effect = lambda views: dm.ViewList([])
+
+        ViewLoader(client)._try_to_recover_coupled([child, parent, other], CogniteAPIError("Not exist", code=400))
+
+        levels = [
+            {view.external_id for view in call.args[0]} for call in client.data_modeling.views.apply.call_args_list
+        ]
+        assert levels == [{"parent", "other"}, {"child"}]
+
 
 class TestContainerLoader:
     def test_merge_containers(self) -> None:
@@ -142,3 +162,126 @@ class TestContainerLoader:
                 },
             ).dump()
         )
+
+    def test_retrieve_deep_requires_chain(self) -> None:
+        # Each container requires the next one, with a cycle back to the first.
+        containers = [_container(f"container{no}", f"container{(no + 1) % 15}") for no in range(15)]
+        client = _mock_client(containers)
+        loader = ContainerLoader(client)
+        loader.prefetch_space_threshold = 100
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            retrieved = loader.retrieve([dm.ContainerId("my_space", "container0")], include_connected=True)
+
+        assert {container.external_id for container in retrieved} == {f"container{no}" for no in range(15)}
+        assert client.data_modeling.containers.retrieve.call_count == 15
+
+    def test_retrieve_prefetches_space(self) -> None:
+        containers = [_container(f"container{no}", "base") for no in range(3)] + [_container("base")]
+        client = _mock_client(containers)
+        loader = ContainerLoader(client)
+        loader.prefetch_space_threshold = 3
+
+        retrieved = loader.retrieve(
+            [dm.ContainerId("my_space", f"container{no}") for no in range(3)], include_connected=True
+        )
+
+        assert [container.external_id for container in retrieved] == ["container0", "container1", "container2", "base"]
+        client.data_modeling.containers.list.assert_called_once_with(space="my_space", limit=-1, include_global=True)
+        client.data_modeling.containers.retrieve.assert_not_called()
+
+    def test_create_by_dependency_levels(self) -> None:
+        containers = [_container("a", "b"), _container("b", "c"), _container("c"), _container("d")]
+        client = _mock_client([])
+        client.data_modeling.containers.apply.side_effect = _apply
+
+        created = ContainerLoader(client).create([_as_apply(container) for container in containers])
+
+        assert {container.external_id for container in created} == {"a", "b", "c", "d"}
+        levels = [
+            {container.external_id for container in call.args[0]}
+            for call in client.data_modeling.containers.apply.call_args_list
+        ]
+        assert levels == [{"c", "d"}, {"b"}, {"a"}]
+
+    def test_create_bisects_failing_containers(self) -> None:
+        containers = [_container(f"container{no}") for no in range(16)] + [_container("invalid")]
+        client = _mock_client([])
+        client.data_modeling.containers.apply.side_effect = _apply
+
+        with pytest.raises(MultiCogniteAPIError) as exc_info:
+            ContainerLoader(client).create([_as_apply(container) for container in containers])
+
+        assert exc_info.value.failed == [dm.ContainerId("my_space", "invalid")]
+        assert len(exc_info.value.errors) == 1
+        assert {container.external_id for container in exc_info.value.success} == {f"container{no}" for no in range(16)}
+        # One request per container would be 18 requests.
+        assert client.data_modeling.containers.apply.call_count == 11
+
+    def test_create_all_failing_containers_one_by_one(self) -> None:
+        containers = [_container(f"invalid{no}") for no in range(16)]
+        client = _mock_client([])
+        client.data_modeling.containers.apply.side_effect = _apply
+
+        with pytest.raises(MultiCogniteAPIError) as exc_info:
+            ContainerLoader(client).create([_as_apply(container) for container in containers])
+
+        assert set(exc_info.value.failed) == {container.as_id() for container in containers}
+        # The request, its two halves, and then one request per container.
+        assert client.data_modeling.containers.apply.call_count == 16 + 3
+
+    def test_create_server_error_is_not_retried(self) -> None:
+        containers = [_container(f"container{no}") for no in range(16)]
+        client = _mock_client([])
+        client.data_modeling.containers.apply.side_effect = CogniteAPIError("Service unavailable", code=503)
+
+        with pytest.raises(MultiCogniteAPIError) as exc_info:
+            ContainerLoader(client).create([_as_apply(container) for container in containers])
+
+        assert set(exc_info.value.failed) == {container.as_id() for container in containers}
+        assert client.data_modeling.containers.apply.call_count == 1
+
+
+def _apply(items: list[dm.ContainerApply]) -> dm.ContainerList:
+    if any(item.external_id.startswith("invalid") for item in items):
+        raise CogniteAPIError("Invalid container", code=400, failed=list(items))
+    return dm.ContainerList([_container(item.external_id) for item in items])
+
+
+def _container(external_id: str, require: str | None = None) -> dm.Container:
+    constraints = {}
+    if require:
+        constraints["requires"] = {
+            "constraintType": "requires",
+            "require": {"space": "my_space", "externalId": require, "type": "container"},
+            "state": "current",
+        }
+    return dm.Container.load(
+        {
+            "space": "my_space",
+            "externalId": external_id,
+            "properties": {},
+            "constraints": constraints,
+            "usedFor": "node",
+            "isGlobal": False,
+            "createdTime": 1,
+            "lastUpdatedTime": 1,
+        }
+    )
+
+
+def _as_apply(container: dm.Container) -> dm.ContainerApply:
+    return dm.ContainerApply(container.space, container.external_id, properties={}, constraints=container.constraints)
+
+
+def _mock_client(containers: list[dm.Container]) -> MagicMock:
+    container_by_id = {container.as_id(): container for container in containers}
+    client = MagicMock()
+    client.data_modeling.containers.retrieve.side_effect = lambda ids: dm.ContainerList(
+        [container_by_id[id_] for id_ in ids if id_ in container_by_id]
+    )
+    client.data_modeling.containers.list.side_effect = lambda space, **_: dm.ContainerList(
+        [container for container in containers if container.space == space]
+    )
+    return client
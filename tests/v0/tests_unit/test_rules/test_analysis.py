@@ -6,6 +6,8 @@ from cognite.neat._v0.core._data_model.models.conceptual import (
     UnverifiedConceptualMetadata,
     UnverifiedConceptualProperty,
 )
+from cognite.neat._v0.core._data_model.models.entities import ConceptEntity
+from cognite.neat._v0.core._issues import catch_warnings
 
 
 class TestRulesAnalysis:
@@ -71,3 +73,33 @@ class TestAnalysis:
             "parent": {"grandparent"},
             "grandparent": set(),
         }
+
+    def test_cached_analysis_is_shared(self) -> None:
+        data_model = UnverifiedConceptualDataModel(
+            metadata=UnverifiedConceptualMetadata("my_space", "my_external_id", "v1", "doctrino"),
+            properties=[
+                UnverifiedConceptualProperty("child", "childProp", "string"),
+                UnverifiedConceptualProperty("parent", "parentProp", "string"),
+            ],
+            concepts=[
+                UnverifiedConcept("child", implements="parent, other_space:grandparent"),
+                UnverifiedConcept("parent"),
+            ],
+        ).as_verified_data_model()
+        analysis = DataModelAnalysis.cached(data_model)
+
+        with catch_warnings() as first_issues:
+            properties_by_concept = analysis.properties_by_concepts(include_ancestors=True)
+        properties_by_concept.clear()
+        with catch_warnings() as second_issues:
+            properties_by_concept = analysis.properties_by_concepts(include_ancestors=True)
+
+        assert DataModelAnalysis.cached(data_model) is analysis
+        assert len(first_issues) == len(second_issues) == 1
+        assert {prop.property_ for prop in properties_by_concept[ConceptEntity.load("my_space:child")]} == {
+            "childProp",
+            "parentProp",
+        }
+
+        data_model.properties.append(data_model.properties[0].model_copy(update={"property_": "newProp"}))
+        assert DataModelAnalysis.cached(data_model) is not analysis
@@ -1,8 +1,15 @@
 from pathlib import Path
 
+import pyoxigraph
+import pytest
 from rdflib import DCTERMS, OWL, RDF, RDFS, BNode, Graph, Literal, Namespace
+from rdflib.compare import isomorphic
 
-from cognite.neat._v0.core._data_model.exporters._data_model2semantic_model import OWLExporter, SHACLExporter
+from cognite.neat._v0.core._data_model.exporters._data_model2semantic_model import (
+    GraphExporter,
+    OWLExporter,
+    SHACLExporter,
+)
 from cognite.neat._v0.core._data_model.models import ConceptualDataModel
 from cognite.neat._v0.core._data_model.models.entities._single_value import ConceptEntity
 
@@ -63,3 +70,20 @@ class TestSemanticExporter:
         actual_node = set(shacl_shapes.objects(None, SHACL.node))
 
         assert actual_node == expected_node
+
+    @pytest.mark.parametrize("exporter", [OWLExporter(), SHACLExporter()], ids=["OWL", "SHACL"])
+    def test_streamed_exports_match_graph(
+        self, exporter: GraphExporter, david_rules: ConceptualDataModel, tmp_path: Path
+    ) -> None:
+        expected = exporter.export(david_rules)
+        exporter.export_to_file(david_rules, tmp_path / "model.ttl")
+        exporter.export_to_file(david_rules, tmp_path / "model.nt")
+        store = pyoxigraph.Store()
+        exporter.export_to_oxigraph(david_rules, store)
+        from_store = Graph().parse(
+            data=pyoxigraph.serialize(store, format=pyoxigraph.RdfFormat.N_QUADS), format="nquads"
+        )
+
+        assert isomorphic(Graph().parse(tmp_path / "model.ttl", format="ttl"), expected)
+        assert isomorphic(Graph().parse(tmp_path / "model.nt", format="nt"), expected)
+        assert isomorphic(from_store, expected)
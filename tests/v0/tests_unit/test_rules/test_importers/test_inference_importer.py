@@ -189,3 +189,30 @@ def test_infer_importer_names_different_casing() -> None:
         "MyAsset": {"DeleteFlag": True},
         "MyAsset2": {"DeleteFlag": False},
     }
+
+
+def test_infer_max_count_and_value_types() -> None:
+    EX = Namespace("http://example.org/")
+    store = NeatInstanceStore.from_memory_store()
+    for triple in [
+        (EX.pump1, RDF.type, EX.Pump),
+        (EX.pump1, EX.name, Literal("Pump", lang="en")),
+        (EX.pump1, EX.name, Literal("Pumpe", lang="no")),
+        (EX.pump1, EX.connectedTo, EX.valve1),
+        (EX.pump1, EX.connectedTo, EX.tank1),
+        (EX.pump2, RDF.type, EX.Pump),
+        (EX.pump2, EX.connectedTo, EX.valve1),
+        (EX.valve1, RDF.type, EX.Valve),
+        (EX.tank1, RDF.type, EX.Tank),
+    ]:
+        store.dataset.add(triple)
+
+    components = InferenceImporter.from_graph_store(store)._to_data_model_components()
+
+    properties = {prop["property_"]: prop for prop in components["properties"]}
+    assert set(properties) == {"name", "connectedTo"}
+    assert properties["name"]["max_count"] == 2
+    assert properties["name"]["value_type"] == "langString"
+    # One value of each object type.
+    assert properties["connectedTo"]["max_count"] == 1
+    assert set(properties["connectedTo"]["value_type"].split(", ")) == {"Valve", "Tank"}
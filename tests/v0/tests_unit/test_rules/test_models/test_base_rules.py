@@ -1,3 +1,7 @@
+import pytest
+from pydantic import TypeAdapter
+
+from cognite.neat._v0.core._data_model.models import SheetList
 from cognite.neat._v0.core._data_model.models.conceptual import (
     Concept,
     ConceptualMetadata,
@@ -40,3 +44,14 @@ class TestBaseRules:
         assert class_.concept.suffix == "MyClass"
         assert class_.name == "My Class Name"
         assert class_.description == "My Class Description"
+
+    @pytest.mark.parametrize("rows_type", [list, tuple, SheetList])
+    def test_validate_sheet_list(self, rows_type: type) -> None:
+        rows = [UnverifiedConcept(concept=f"  MyClass{no}  ").dump(default_prefix="neat") for no in range(3)]
+        if rows_type is SheetList:
+            rows = [Concept.model_validate(row) for row in rows]
+
+        concepts = TypeAdapter(SheetList[Concept]).validate_python(rows_type(rows))
+
+        assert isinstance(concepts, SheetList)
+        assert [concept.concept.suffix for concept in concepts] == ["MyClass0", "MyClass1", "MyClass2"]
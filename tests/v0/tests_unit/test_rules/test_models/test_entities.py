@@ -290,6 +290,20 @@ class TestEntities:
         assert e1.direction == "inwards"
         assert e2.direction == "outwards"
 
+    def test_load_same_string_gives_independent_entities(self) -> None:
+        defaults = {"space": DEFAULT_SPACE, "version": DEFAULT_VERSION}
+        raw = "edge(properties=StartEndTime,type=my_space:startEnd)"
+        first = EdgeEntity.load(raw, **defaults)
+        first.suffix = "changed"
+        first.properties.suffix = "changed"  # type: ignore[union-attr]
+
+        second = EdgeEntity.load(raw, **defaults)
+
+        assert second is not first
+        assert second.suffix == "edge"
+        assert second.properties == ViewEntity(space=DEFAULT_SPACE, externalId="StartEndTime", version=DEFAULT_VERSION)
+        assert EdgeEntity.load(raw, space="other_space", version=DEFAULT_VERSION).properties.space == "other_space"  # type: ignore[union-attr]
+
 
 class TestEntityPattern:
     @pytest.mark.parametrize(
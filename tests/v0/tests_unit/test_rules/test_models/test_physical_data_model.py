@@ -1899,7 +1899,40 @@ class TestDMSValidation:
                 set(),
                 {ContainerEntity(space="cdf_cdm", externalId="CogniteDescribable")},
                 id="Container requiring other container",
-            )
+            ),
+            pytest.param(
+                UnverifiedPhysicalDataModel(
+                    UnverifiedPhysicalMetadata("my_space", "MyModel", "Me", "v1"),
+                    properties=[
+                        UnverifiedPhysicalProperty(
+                            "MyView",
+                            "name",
+                            "text",
+                            container="MyContainer",
+                            container_property="name",
+                        ),
+                        UnverifiedPhysicalProperty(
+                            "cdf_cdm:CogniteAsset(version=v1)",
+                            "code",
+                            "text",
+                            container="cdf_cdm:CogniteAsset",
+                            container_property="code",
+                        ),
+                    ],
+                    views=[
+                        UnverifiedPhysicalView("MyView", implements="cdf_cdm:CogniteDescribable(version=v1)"),
+                        UnverifiedPhysicalView("MyEmptyView"),
+                    ],
+                    containers=[UnverifiedPhysicalContainer("MyContainer")],
+                ),
+                {
+                    ViewEntity(space="cdf_cdm", externalId="CogniteDescribable", version="v1"),
+                    ViewEntity(space="cdf_cdm", externalId="CogniteAsset", version="v1"),
+                    ViewEntity(space="my_space", externalId="MyEmptyView", version="v1"),
+                },
+                {ContainerEntity(space="cdf_cdm", externalId="CogniteAsset")},
+                id="Views and containers referenced by views and properties",
+            ),
         ],
     )
     def test_imported_views_and_containers_ids(
@@ -17,6 +17,7 @@ from cognite.neat._v0.core._data_model.models.conceptual import (
     UnverifiedConceptualMetadata,
     UnverifiedConceptualProperty,
 )
+from cognite.neat._v0.core._data_model.models.entities import HasDataFilter
 from cognite.neat._v0.core._data_model.models.entities._single_value import (
     ConceptEntity,
     ViewEntity,
@@ -33,7 +34,10 @@ from cognite.neat._v0.core._data_model.transformers import (
     StandardizeNaming,
     SubsetConceptualDataModel,
     SubsetPhysicalDataModel,
+    ToDataProductModel,
     ToDMSCompliantEntities,
+    ToEnterpriseModel,
+    ToSolutionModel,
 )
 from cognite.neat._v0.core._issues.errors._general import NeatValueError
 
@@ -135,6 +139,40 @@ class TestDataModelSubsetting:
             _ = SubsetPhysicalDataModel({view}).transform(alice_rules)
 
 
+class TestToExtensionModel:
+    @pytest.mark.parametrize(
+        "transformer",
+        [
+            pytest.param(
+                ToEnterpriseModel(("my_enterprise", "Enterprise", "v1"), move_connections=True), id="enterprise"
+            ),
+            pytest.param(ToSolutionModel(("my_solution", "Solution", "v1")), id="solution-connection"),
+            pytest.param(ToSolutionModel(("my_solution", "Solution", "v1"), "repeat"), id="solution-repeat"),
+            pytest.param(
+                ToSolutionModel(("my_solution", "Solution", "v1"), filter_type="view"), id="solution-view-filter"
+            ),
+            pytest.param(ToDataProductModel(("my_product", "Product", "v1")), id="data-product"),
+        ],
+    )
+    def test_reference_model_is_not_modified(
+        self, transformer: ToEnterpriseModel | ToSolutionModel, alice_rules: PhysicalDataModel
+    ) -> None:
+        before = alice_rules.dump()
+
+        result = transformer.transform(alice_rules)
+
+        assert alice_rules.dump() == before
+        reference_ids = {id(prop) for prop in alice_rules.properties}
+        assert result.properties
+        assert not any(id(prop) in reference_ids for prop in result.properties)
+        result.properties[0].view.version = "changed"
+        for view in result.views:
+            if isinstance(view.filter_, HasDataFilter):
+                for entity in view.filter_.inner or []:
+                    entity.prefix = "changed"
+        assert alice_rules.dump() == before
+
+
 class TestAddCogniteProperties:
     def test_add_cognite_properties(self, cognite_core_schema: DMSSchema) -> None:
         unverified_conceptual_dm = UnverifiedConceptualDataModel(
@@ -0,0 +1,47 @@
+from pathlib import Path
+
+from rdflib import RDF, BNode, Literal, Namespace, URIRef
+
+from cognite.neat._v0.core._store import NeatInstanceStore
+
+EX = Namespace("http://example.org/")
+
+
+class TestAdaptiveStore:
+    def test_stays_in_memory_below_threshold(self) -> None:
+        store = NeatInstanceStore.from_adaptive_store(spill_threshold=100)
+        store._add_triples([(EX.pump1, RDF.type, EX.Pump)], named_graph=store.default_named_graph)
+
+        assert store.type_ == "Memory"
+
+    def test_spill_to_oxigraph_keeps_triples(self, tmp_path: Path) -> None:
+        store = NeatInstanceStore.from_adaptive_store(spill_threshold=10, storage_dir=tmp_path / "oxigraph")
+        store.dataset.bind("ex", EX)
+        blank = BNode()
+        other_graph = EX.other
+        store.graph(other_graph).add((blank, EX.name, Literal("Blank", lang="en")))
+        triples = {(EX[f"pump{no}"], RDF.type, EX.Pump) for no in range(20)}
+        triples.add((EX.pump0, EX.connectedTo, blank))
+        triples.add((EX.pump0, EX.pressure, Literal(1.5)))
+        statistics = store.statistics()
+
+        store._add_triples(triples, named_graph=store.default_named_graph, batch_size=5)
+
+        assert store.type_ == "OxigraphStore"
+        assert set(store.graph()) == triples
+        assert set(store.graph(other_graph)) == {(blank, EX.name, Literal("Blank", lang="en"))}
+        assert dict(store.dataset.namespaces())["ex"] == URIRef(EX)
+        assert store.provenance[-1].activity.used == "NeatInstanceStore._spill_to_oxigraph"
+        assert store.statistics() is not statistics
+        assert store.queries.select.summarize_instances() == [("Pump", 20)]
+
+    def test_spill_to_nested_storage_dir(self, tmp_path: Path) -> None:
+        storage_dir = tmp_path / "not" / "yet" / "created"
+        store = NeatInstanceStore.from_adaptive_store(spill_threshold=2, storage_dir=storage_dir)
+
+        store._add_triples(
+            [(EX[f"pump{no}"], RDF.type, EX.Pump) for no in range(5)], named_graph=store.default_named_graph
+        )
+
+        assert store.type_ == "OxigraphStore"
+        assert len(store.graph()) == 5
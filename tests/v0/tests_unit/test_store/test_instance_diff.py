@@ -1,3 +1,5 @@
+from collections.abc import Callable
+
 import pytest
 from rdflib import RDF, Literal, Namespace, URIRef
 
@@ -91,3 +93,33 @@ def test_diff_clears_previous_results() -> None:
     assert (ex.c, RDF.type, ex.T2) in delete_graph
     assert (ex.b, RDF.type, ex.T1) not in add_graph  # Cleared
     assert (ex.a, RDF.type, ex.T1) not in delete_graph  # Cleared
+
+
+@pytest.mark.parametrize("store_factory", [NeatInstanceStore.from_memory_store, NeatInstanceStore.from_oxi_local_store])
+def test_diff_matches_sparql_diff_and_summarizes_by_type(store_factory: Callable[[], NeatInstanceStore]) -> None:
+    store = store_factory()
+    ex = Namespace("http://example.org/")
+    current_graph, new_graph = URIRef("urn:test:current"), URIRef("urn:test:new")
+    store._add_triples(
+        [(ex[f"instance{no}"], prop, Literal(f"value{no}")) for no in range(100) for prop in [ex.name, ex.description]]
+        + [(ex[f"instance{no}"], RDF.type, ex.Type1 if no % 2 else ex.Type2) for no in range(100)],
+        named_graph=current_graph,
+    )
+    store._add_triples(
+        [(ex[f"instance{no}"], ex.name, Literal(f"value{no}" if no % 10 else "changed")) for no in range(110)]
+        + [(ex[f"instance{no}"], RDF.type, ex.Type1 if no % 2 else ex.Type2) for no in range(110)],
+        named_graph=new_graph,
+    )
+
+    summary = store.diff(current_graph, new_graph)
+
+    add_graph = store.graph(NAMED_GRAPH_NAMESPACE["DIFF_ADD"])
+    delete_graph = store.graph(NAMED_GRAPH_NAMESPACE["DIFF_DELETE"])
+    assert set(add_graph) == set(store.queries.select.get_graph_diff(new_graph, current_graph))
+    assert set(delete_graph) == set(store.queries.select.get_graph_diff(current_graph, new_graph))
+    # 10 changed names, all of Type2, and 10 new instances with a name and a type
+    assert summary.added_count == len(add_graph) == 30
+    # 10 changed names and 100 removed descriptions
+    assert summary.deleted_count == len(delete_graph) == 110
+    assert summary.added_count_by_type == {ex.Type1: 10, ex.Type2: 20}
+    assert summary.deleted_count_by_type == {ex.Type1: 50, ex.Type2: 60}
@@ -0,0 +1,68 @@
+from pathlib import Path
+
+from rdflib import RDF, XSD, Literal, Namespace
+
+from cognite.neat._v0.core._constants import NEAT
+from cognite.neat._v0.core._instances.transformers import PruneTypes
+from cognite.neat._v0.core._store import NeatInstanceStore
+
+EX = Namespace("http://example.org/")
+
+
+def _write_pumps(store: NeatInstanceStore) -> None:
+    store._add_triples(
+        [
+            (EX.pump1, RDF.type, EX.Pump),
+            (EX.pump1, EX.name, Literal("Pump 1")),
+            (EX.pump1, EX.connectedTo, EX.valve1),
+            (EX.pump1, EX.connectedTo, EX.valve2),
+            (EX.pump2, RDF.type, EX.Pump),
+            (EX.pump2, RDF.type, EX.Equipment),
+            (EX.pump2, EX.connectedTo, Literal("valve3")),
+            (EX.valve1, RDF.type, EX.Valve),
+        ],
+        named_graph=store.default_named_graph,
+    )
+
+
+class TestInstanceStatistics:
+    def test_statistics_match_select_queries(self) -> None:
+        store = NeatInstanceStore.from_oxi_local_store()
+        _write_pumps(store)
+
+        statistics = store.statistics()
+        select = store.queries.select
+
+        assert set(statistics.summarize_instances()) == set(select.summarize_instances())
+        assert sorted(statistics.types_with_instance_and_property_count(), key=lambda x: x["type"]) == sorted(
+            select.types_with_instance_and_property_count(), key=lambda x: x["type"]
+        )
+        assert statistics.properties_with_count() == select.properties_with_count()
+        assert statistics.multi_type_instances() == select.multi_type_instances()
+        assert statistics.max_count_by_type_property[(EX.Pump, EX.connectedTo)] == 2
+        assert statistics.value_type_count_by_type_property[(EX.Pump, EX.connectedTo)] == {
+            EX.Valve: 1,
+            NEAT.UnknownType: 1,
+            XSD.string: 1,
+        }
+
+    def test_statistics_invalidated_by_transform(self) -> None:
+        store = NeatInstanceStore.from_oxi_local_store()
+        _write_pumps(store)
+        assert store.statistics().instance_count_by_type[EX.Valve] == 1
+
+        store.transform(PruneTypes([EX.Valve]))
+
+        assert EX.Valve not in store.statistics().instance_count_by_type
+
+    def test_statistics_persisted_next_to_storage(self, tmp_path: Path) -> None:
+        storage_dir = tmp_path / "oxigraph"
+        store = NeatInstanceStore.from_oxi_local_store(storage_dir)
+        _write_pumps(store)
+        expected = store.statistics()
+        store.dataset.close()
+
+        reopened = NeatInstanceStore.from_oxi_local_store(storage_dir)
+
+        assert store.default_named_graph in reopened._statistics
+        assert reopened.statistics() == expected
@@ -1,3 +1,6 @@
+from pathlib import Path
+from unittest.mock import patch
+
 import pytest
 import yaml
 from pytest_regressions.data_regression import DataRegressionFixture
@@ -7,6 +10,7 @@ from cognite.neat._v0.core._data_model.models import ConceptualDataModel, Physic
 from cognite.neat._v0.core._data_model.transformers import VerifiedDataModelTransformer
 from cognite.neat._v0.core._issues.errors import NeatValueError
 from cognite.neat._v0.core._store import NeatDataModelStore
+from cognite.neat._v0.core._store._verification_cache import VerifiedDataModelCache
 from cognite.neat._v0.core._store.exceptions import InvalidActivityInput
 
 
@@ -86,3 +90,32 @@ class TestRuleStore:
         error = store.last_issues.errors[0]
         assert isinstance(error, NeatValueError)
         assert "This exporter always fails" in error.as_message()
+
+    def test_reimport_uses_verification_cache(self) -> None:
+        cache = VerifiedDataModelCache()
+        first = NeatDataModelStore(cache)
+        first_issues = first.import_data_model(importers.ExcelImporter(catalog.classic_model), validate=True)
+        second = NeatDataModelStore(cache)
+
+        with patch.object(transformers.VerifyAnyDataModel, "transform") as verify:
+            second_issues = second.import_data_model(importers.ExcelImporter(catalog.classic_model), validate=True)
+
+        verify.assert_not_called()
+        assert len(cache) == 1
+        assert first_issues.warnings
+        assert second_issues == first_issues
+        assert second.last_verified_conceptual_data_model == first.last_verified_conceptual_data_model
+        assert second.last_verified_conceptual_data_model is not first.last_verified_conceptual_data_model
+
+    def test_verification_cache_on_disk(self, tmp_path: Path) -> None:
+        store = NeatDataModelStore(VerifiedDataModelCache(cache_dir=tmp_path))
+        store.import_data_model(importers.ExcelImporter(catalog.hello_world_pump), validate=False)
+        new_session_cache = VerifiedDataModelCache(cache_dir=tmp_path)
+        new_session = NeatDataModelStore(new_session_cache)
+
+        with patch.object(transformers.VerifyAnyDataModel, "transform") as verify:
+            new_session.import_data_model(importers.ExcelImporter(catalog.hello_world_pump), validate=False)
+
+        verify.assert_not_called()
+        assert len(list(tmp_path.glob("verified-*.pkl"))) == 1
+        assert new_session.last_verified_physical_data_model == store.last_verified_physical_data_model
@@ -0,0 +1,36 @@
+from collections.abc import Iterable
+
+import pytest
+
+from cognite.neat._v0.core._utils.concurrency import iterate_concurrently, map_concurrently
+
+
+class TestIterateConcurrently:
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_merge_keeps_order_within_iterable(self, max_workers: int) -> None:
+        iterables = [range(start, start + 1_000) for start in range(0, 5_000, 1_000)]
+
+        result = list(iterate_concurrently(iterables, max_workers=max_workers, buffer_size=2, chunk_size=7))
+
+        assert sorted(result) == list(range(5_000))
+        for iterable in iterables:
+            assert [item for item in result if item in iterable] == list(iterable)
+
+    def test_producer_error_is_raised(self) -> None:
+        def failing() -> Iterable[int]:
+            yield 1
+            raise ValueError("Boom")
+
+        with pytest.raises(ValueError, match="Boom"):
+            list(iterate_concurrently([failing(), range(10)], max_workers=2))
+
+    def test_stop_early(self) -> None:
+        iterables = [range(100_000), range(100_000)]
+
+        first = next(iter(iterate_concurrently(iterables, max_workers=2, buffer_size=1)))
+
+        assert first == 0
+
+
+def test_map_concurrently_keeps_order() -> None:
+    assert list(map_concurrently(lambda x: x * 2, iter(range(100)), max_workers=4)) == [x * 2 for x in range(100)]